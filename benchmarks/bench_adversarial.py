@@ -0,0 +1,57 @@
+"""
+Check that the time for parsing grows linearly with the length of long,
+bracket-heavy transcriptions, like sentences pasted as one string.
+
+Usage: python benchmarks/bench_adversarial.py [GROUPS ...]
+"""
+import sys
+import time
+
+from tabulate import tabulate
+
+from pysign.parse import parse_hamnosys
+
+from common import SIGNS
+
+# functions returning texts with a number of bracketed groups
+PATTERNS = {
+    # simultaneous movements, with a dominance symbol only at the end
+    'simultaneous': lambda size: (
+        SIGNS['one-handed'] + ' \ue0e2\ue089\ue08c\ue0e3' * size +
+        '\ue0e7'),
+    # two-handed movements
+    'two-handed': lambda size: (
+        SIGNS['one-handed'] + ' \ue0e2\ue089\ue0e7\ue08c\ue0e3' * size),
+    # nested brackets around movements
+    'nested': lambda size: (
+        SIGNS['one-handed'] + ' \ue0e2\ue0e2\ue089\ue0e3\ue0e3' * size +
+        '\ue0e7'),
+    # two-handed signs
+    'signs': lambda size: ' '.join([SIGNS['two-handed']] * size),
+    # bracketed handshapes and as many bracketed pairs of handshapes,
+    # before a two-handed sign
+    'handshapes': lambda size: (
+        '\ue0e2\ue002\ue0e3' * size +
+        '\ue0e2\ue002\ue0e7\ue001\ue0e3' * size + SIGNS['two-handed']),
+    }
+
+
+def main(*sizes):
+    sizes = sizes or (1000, 4000, 16000, 64000)
+    table = []
+    for name, pattern in PATTERNS.items():
+        for size in sizes:
+            text = pattern(size)
+            start = time.perf_counter()
+            parse_hamnosys(text)
+            seconds = time.perf_counter() - start
+            table += [[
+                name, size, len(text), '{0:.3f}'.format(seconds),
+                '{0:.2f}'.format(seconds / len(text) * 1e6)]]
+    print(tabulate(table, headers=[
+        'pattern', 'groups', 'characters', 'seconds', 'us/character'],
+        tablefmt='pipe'))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
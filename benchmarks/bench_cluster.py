@@ -0,0 +1,42 @@
+"""
+Measure hierarchical clustering on the condensed distance matrix of a
+synthetic lexicon.
+
+Usage: python benchmarks/bench_cluster.py [SIZE ...]
+
+The condensed matrix of n hands takes 2 n (n - 1) bytes (float32), that is
+200 MB for 10000 and 5 GB for 50000 hands, and average linkage works on a
+copy of it unless it is allowed to overwrite the matrix.
+"""
+import sys
+import time
+
+from tabulate import tabulate
+
+from pysign.cluster import linkage, flat_clusters
+from pysign.distance import distance_matrix
+
+from common import synthetic_hands
+
+
+def main(*sizes):
+    table = []
+    for size in sizes or (10000, 50000):
+        hands = synthetic_hands(size)
+        start = time.perf_counter()
+        condensed = distance_matrix(hands)
+        seconds = time.perf_counter() - start
+        table += [[size, 'distance_matrix', '{0:.2f}'.format(seconds), '']]
+        for method in ['single', 'average']:
+            start = time.perf_counter()
+            result = linkage(condensed, method=method, overwrite=True)
+            seconds = time.perf_counter() - start
+            clusters = len(set(flat_clusters(result, 0.2)))
+            table += [[size, method, '{0:.2f}'.format(seconds), clusters]]
+        del condensed
+    print(tabulate(table, headers=[
+        'hands', 'step', 'seconds', 'clusters at 0.2'], tablefmt='pipe'))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,42 @@
+"""
+Measure the scaling of `distance_matrix` with the number of processes.
+
+Usage: python benchmarks/bench_distance.py [SIZE] [WORKERS ...]
+
+By default, the distances of 20000 hands are computed with 1, 2, 4, ...
+processes, up to the number of CPUs.
+"""
+import os
+import sys
+import time
+
+from tabulate import tabulate
+
+from pysign.distance import distance_matrix
+
+from common import synthetic_hands
+
+
+def main(size=20000, *workers):
+    hands = synthetic_hands(size)
+    if not workers:
+        cpus = os.cpu_count() or 1
+        workers = [2 ** i for i in range(cpus.bit_length()) if 2 ** i <= cpus]
+        workers += [cpus] if cpus not in workers else []
+    table, baseline = [], None
+    for count in workers:
+        start = time.perf_counter()
+        distance_matrix(hands, workers=count)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        table += [[
+            count, '{0:.2f}'.format(seconds),
+            '{0:.2f}x'.format(baseline / seconds)]]
+    print('{0} hands, {1:,} distances'.format(size, size * (size - 1) // 2))
+    print(tabulate(table, headers=[
+        'workers', 'seconds', 'speed-up'], tablefmt='pipe'))
+    print('{0} CPUs'.format(os.cpu_count()))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,45 @@
+"""
+Compare the number of distances computed by `VPTree` queries with a linear
+scan over a synthetic lexicon.
+
+Usage: python benchmarks/bench_index.py [SIZE] [QUERIES]
+"""
+import random
+import sys
+import time
+
+from tabulate import tabulate
+
+from pysign.index import VPTree
+
+from common import synthetic_hands
+
+
+def main(size=10000, queries=100):
+    hands = synthetic_hands(size)
+    start = time.perf_counter()
+    tree = VPTree(hands)
+    build = time.perf_counter() - start
+    rng = random.Random(2)
+    table = []
+    for query, argument in [
+            ('k_nearest', 1), ('k_nearest', 10), ('within', 0.0),
+            ('within', 0.2)]:
+        tree.evaluations = 0
+        start = time.perf_counter()
+        for sign in rng.sample(hands, queries):
+            getattr(tree, query)(sign, argument)
+        seconds = (time.perf_counter() - start) / queries
+        evaluations = tree.evaluations / queries
+        table += [[
+            '{0}({1})'.format(query, argument),
+            round(evaluations),
+            '{0:.1%}'.format(1 - evaluations / size),
+            '{0:.2f}'.format(seconds * 1000)]]
+    print('{0} hands, tree built in {1:.2f} s'.format(size, build))
+    print(tabulate(table, headers=[
+        'query', 'distances', 'avoided', 'ms/query'], tablefmt='pipe'))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,85 @@
+"""
+Shared test data for the benchmarks.
+"""
+import random
+from functools import lru_cache
+from pathlib import Path
+
+from csvw.dsv import UnicodeDictReader
+
+from pysign.parse import parse_hamnosys, Sign, Hand
+
+
+def example_signs():
+    """
+    Return the distinct transcriptions in examples/test-signs.tsv.
+    """
+    path = Path(__file__).parent.parent / 'examples' / 'test-signs.tsv'
+    with UnicodeDictReader(path, delimiter='\t') as reader:
+        return sorted(set(row['sign'] for row in reader))
+
+
+def named_signs():
+    """
+    Return the named transcriptions in examples/signs.tsv.
+    """
+    path = Path(__file__).parent.parent / 'examples' / 'signs.tsv'
+    with UnicodeDictReader(path, delimiter='\t') as reader:
+        return {row['name']: row['sign'] for row in reader}
+
+
+# typical transcriptions, by name
+SIGNS = named_signs()
+
+
+@lru_cache(maxsize=None)
+def _pool(seed, size):
+    rng = random.Random(seed)
+    templates = {}
+    for text in example_signs():
+        segments = text.split(' ')
+        templates.setdefault(len(segments), []).append(segments)
+    texts = set()
+    for i in range(size * 5):
+        groups = rng.choice(list(templates.values()))
+        text = ' '.join(
+                rng.choice(groups)[j] for j in range(len(groups[0])))
+        try:
+            parse_hamnosys(text)
+            texts.add(text)
+        except Exception:
+            pass
+        if len(texts) == size:
+            break
+    return sorted(texts)
+
+
+def synthetic_corpus(size, seed=1, pool=2000):
+    """
+    Create a corpus of transcriptions of the given size.
+
+    Notes
+    -----
+    New transcriptions are made by replacing the space-separated segments of
+    an example sign with the segments in the same position of other example
+    signs with the same number of segments. A pool of distinct
+    transcriptions which can be parsed is made first, from which the corpus
+    is then sampled, so signs recur like in real corpora.
+    """
+    texts = _pool(seed, pool)
+    rng = random.Random(seed)
+    return [rng.choice(texts) for i in range(size)]
+
+
+def synthetic_hands(size, seed=1):
+    """
+    Create hands by combining attribute values of the example signs.
+    """
+    hands = [Sign.from_text(text).dominant for text in example_signs()]
+    rng = random.Random(seed)
+    attributes = [
+            'shape', 'orientation', 'location', 'movement', 'contact',
+            'repetition']
+    return [
+            Hand(**{a: getattr(rng.choice(hands), a) for a in attributes})
+            for i in range(size)]
@@ -0,0 +1,234 @@
+"""
+Benchmarks for the hot paths of pysign.
+
+Usage:
+    python benchmarks/suite.py [--sizes 1000 10000 ...] [--output FILE]
+                               [--compare FILE]
+
+The results can be written to a JSON file and compared with the results of
+an earlier run on the same machine.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from tabulate import tabulate
+
+from pysign.columns import Columns
+from pysign.distance import substitution_matrix
+from pysign.parse import parse_hamnosys, ascify, ascify_many, deascify, Sign
+
+from common import SIGNS, synthetic_corpus
+
+
+def measure(function, repeat=3, minimum=0.1):
+    """
+    Return the best time in seconds for calling a function once.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(number):
+            function()
+        seconds = time.perf_counter() - start
+        if seconds >= minimum:
+            break
+        number *= 2 if seconds * 10 > minimum else 10
+    best = seconds
+    for i in range(repeat - 1):
+        start = time.perf_counter()
+        for i in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def peak_memory(function):
+    """
+    Return the peak memory in bytes allocated while calling a function.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def micro_benchmarks():
+    sign1 = Sign.from_text(SIGNS['two-handed'])
+    sign2 = Sign.from_text(SIGNS['simultaneous'])
+    benchmarks = {
+            'parse_hamnosys[{0}]'.format(name): (
+                lambda text=text: parse_hamnosys(text))
+            for name, text in SIGNS.items()}
+    benchmarks['Sign.from_text'] = lambda: Sign.from_text(
+            SIGNS['two-handed'])
+    benchmarks['ascify'] = lambda: ascify(SIGNS['two-handed'])
+    names = ascify(SIGNS['two-handed'])
+    benchmarks['deascify'] = lambda: deascify(names)
+    benchmarks['Hand.distance'] = lambda: sign1.dominant.distance(
+            sign2.dominant)
+    benchmarks['Sign.distance'] = lambda: sign1.distance(sign2)
+    benchmarks['Sign.distance[max_distance]'] = lambda: sign1.distance(
+            sign2, max_distance=0.1)
+    benchmarks['Hand.distance[graded]'] = lambda: sign1.dominant.distance(
+            sign2.dominant, compare=substitution_matrix())
+
+    def pprint():
+        with contextlib.redirect_stdout(io.StringIO()):
+            sign1.pprint()
+    benchmarks['Sign.pprint'] = pprint
+
+    results = {}
+    for name, function in benchmarks.items():
+        seconds = measure(function)
+        results[name] = {'seconds': seconds, 'per_second': 1 / seconds}
+    return results
+
+
+def corpus_benchmarks(sizes):
+    results = {}
+    for size in sizes:
+        texts = synthetic_corpus(size)
+        start = time.perf_counter()
+        signs = [Sign.from_text(text) for text in texts]
+        seconds = time.perf_counter() - start
+        columns = Columns.from_signs(signs)
+        del signs
+        memory = peak_memory(lambda: [Sign.from_text(text) for text in texts])
+        results['corpus[{0}]'.format(size)] = {
+                'seconds': seconds,
+                'per_second': size / seconds,
+                'memory': memory,
+                'memory_per_sign': memory / size}
+        seconds = measure(lambda: ascify_many(texts), repeat=3, minimum=0)
+        results['ascify_many[{0}]'.format(size)] = {
+                'seconds': seconds,
+                'per_second': size / seconds}
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / 'columns.npz')
+            columns.save(path)
+            seconds = measure(lambda: Columns.load(path), repeat=3, minimum=0)
+        results['Columns.load[{0}]'.format(size)] = {
+                'seconds': seconds,
+                'per_second': size / seconds}
+    return results
+
+
+def component_benchmarks(size=10000):
+    """
+    Compare parsing single components with parsing all of them.
+    """
+    texts = synthetic_corpus(size)
+    components = {'full': {}}
+    for component in 'holcm':
+        components[component] = {
+                flag: flag == component for flag in 'holcm'}
+    results = {}
+    for name, keywords in components.items():
+        seconds = measure(
+                lambda: [parse_hamnosys(text, **keywords) for text in texts],
+                repeat=3, minimum=0)
+        results['components[{0}]'.format(name)] = {
+                'seconds': seconds,
+                'per_second': size / seconds}
+    return results
+
+
+def spans_benchmarks(size=10000):
+    """
+    Compare parsing with spans with parsing into strings.
+    """
+    texts = synthetic_corpus(size)
+    results = {}
+    for name, spans in [('strings', False), ('spans', True)]:
+        seconds = measure(
+                lambda: [parse_hamnosys(text, spans=spans) for text in texts],
+                repeat=3, minimum=0)
+        memory = peak_memory(
+                lambda: [parse_hamnosys(text, spans=spans) for text in texts])
+        results['parse_hamnosys[{0}]'.format(name)] = {
+                'seconds': seconds,
+                'per_second': size / seconds,
+                'memory': memory,
+                'memory_per_sign': memory / size}
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                cwd=str(Path(__file__).parent),
+                universal_newlines=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+            'commit': commit,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'node': platform.node(),
+            'date': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+
+def report(results, baseline=None):
+    table = []
+    for name, result in results.items():
+        row = [
+                name,
+                '{0:,.0f}'.format(result['per_second']),
+                '{0:.2f}'.format(1e6 / result['per_second']),
+                '{0:,.0f}'.format(result['memory_per_sign'])
+                if 'memory' in result else '']
+        if baseline is not None:
+            if name in baseline:
+                row += ['{0:.2f}x'.format(
+                    result['per_second'] / baseline[name]['per_second'])]
+            else:
+                row += ['']
+        table += [row]
+    headers = ['benchmark', 'per second', 'us each', 'bytes/sign']
+    if baseline is not None:
+        headers += ['speed-up']
+    print(tabulate(table, headers=headers, tablefmt='pipe'))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+            '--sizes', nargs='*', type=int, default=[1000, 10000, 100000],
+            help='sizes of the synthetic corpora (up to 1000000)')
+    parser.add_argument('--output', help='write the results to a JSON file')
+    parser.add_argument(
+            '--compare', help='compare with results in a JSON file')
+    args = parser.parse_args(args)
+
+    results = micro_benchmarks()
+    results.update(corpus_benchmarks(args.sizes))
+    results.update(component_benchmarks())
+    results.update(spans_benchmarks())
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+    report(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(
+                    {'environment': environment(), 'results': results},
+                    f, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
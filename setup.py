@@ -11,8 +11,6 @@ setup(
     classifiers=[
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
     ],
@@ -25,9 +23,9 @@ setup(
     include_package_data=True,
     zip_safe=False,
     platforms='any',
-    python_requires='>=3.5',
+    python_requires='>=3.7',
     install_requires=[
-        'clldutils>=3.5', 'tabulate'
+        'clldutils>=3.5', 'tabulate', 'numpy'
     ],
     extras_require={
         'dev': ['flake8', 'wheel', 'twine'],
@@ -41,6 +39,7 @@ setup(
     },
     entry_points={
         'console_scripts': [
+            'pysign=pysign.cli:main',
         ]
     },
 )
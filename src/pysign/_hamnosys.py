@@ -0,0 +1,212 @@
+# generated by pysign.data.write_tables, do not edit
+TABLE = {
+    ' ': {'ID': '1', 'Name': 'asciispace', 'Unicode': '0020', 'Keyboard': ''},
+    '+': {'ID': '2', 'Name': 'asciiplus', 'Unicode': '002B', 'Keyboard': ''},
+    ',': {'ID': '36', 'Name': 'comma', 'Unicode': '002C', 'Keyboard': ''},
+    '.': {'ID': '35', 'Name': 'fullstop', 'Unicode': '002E', 'Keyboard': ''},
+    '?': {'ID': '34', 'Name': 'query', 'Unicode': '003F', 'Keyboard': ''},
+    '{': {'ID': '225', 'Name': 'altbegin', 'Unicode': '007B', 'Keyboard': ''},
+    '|': {'ID': '38', 'Name': 'metaalt', 'Unicode': '007C', 'Keyboard': ''},
+    '}': {'ID': '226', 'Name': 'altend', 'Unicode': '007D', 'Keyboard': ''},
+    '\ue000': {'ID': '50', 'Name': 'fist', 'Unicode': 'E000', 'Keyboard': 'D'},
+    '\ue001': {'ID': '51', 'Name': 'flathand', 'Unicode': 'E001', 'Keyboard': 'E'},
+    '\ue002': {'ID': '52', 'Name': 'finger2', 'Unicode': 'E002', 'Keyboard': 'F'},
+    '\ue003': {'ID': '53', 'Name': 'finger23', 'Unicode': 'E003', 'Keyboard': 'G'},
+    '\ue004': {'ID': '54', 'Name': 'finger23spread', 'Unicode': 'E004', 'Keyboard': 'H'},
+    '\ue005': {'ID': '55', 'Name': 'finger2345', 'Unicode': 'E005', 'Keyboard': 'I'},
+    '\ue006': {'ID': '58', 'Name': 'pinch12', 'Unicode': 'E006', 'Keyboard': 'M'},
+    '\ue007': {'ID': '59', 'Name': 'pinchall', 'Unicode': 'E007', 'Keyboard': 'N'},
+    '\ue008': {'ID': '60', 'Name': 'pinch12open', 'Unicode': 'E008', 'Keyboard': 'O'},
+    '\ue009': {'ID': '61', 'Name': 'cee12', 'Unicode': 'E009', 'Keyboard': 'P'},
+    '\ue00a': {'ID': '62', 'Name': 'ceeall', 'Unicode': 'E00A', 'Keyboard': 'Q'},
+    '\ue00b': {'ID': '63', 'Name': 'ceeopen', 'Unicode': 'E00B', 'Keyboard': 'R'},
+    '\ue00c': {'ID': '56', 'Name': 'thumboutmod', 'Unicode': 'E00C', 'Keyboard': 'J'},
+    '\ue00d': {'ID': '57', 'Name': 'thumbacrossmod', 'Unicode': 'E00D', 'Keyboard': 'K'},
+    '\ue00e': {'ID': '64', 'Name': 'thumbopenmod', 'Unicode': 'E00E', 'Keyboard': 'L'},
+    '\ue010': {'ID': '65', 'Name': 'fingerstraightmod', 'Unicode': 'E010', 'Keyboard': 'A'},
+    '\ue011': {'ID': '66', 'Name': 'fingerbendmod', 'Unicode': 'E011', 'Keyboard': 'B'},
+    '\ue012': {'ID': '67', 'Name': 'fingerhookmod', 'Unicode': 'E012', 'Keyboard': 'C'},
+    '\ue013': {'ID': '69', 'Name': 'doublebent', 'Unicode': 'E013', 'Keyboard': '6'},
+    '\ue014': {'ID': '70', 'Name': 'doublehooked', 'Unicode': 'E014', 'Keyboard': '7'},
+    '\ue020': {'ID': '72', 'Name': 'extfingeru', 'Unicode': 'E020', 'Keyboard': ''},
+    '\ue021': {'ID': '73', 'Name': 'extfingerur', 'Unicode': 'E021', 'Keyboard': ''},
+    '\ue022': {'ID': '74', 'Name': 'extfingerr', 'Unicode': 'E022', 'Keyboard': ''},
+    '\ue023': {'ID': '75', 'Name': 'extfingerdr', 'Unicode': 'E023', 'Keyboard': ''},
+    '\ue024': {'ID': '76', 'Name': 'extfingerd', 'Unicode': 'E024', 'Keyboard': ''},
+    '\ue025': {'ID': '77', 'Name': 'extfingerdl', 'Unicode': 'E025', 'Keyboard': ''},
+    '\ue026': {'ID': '78', 'Name': 'extfingerl', 'Unicode': 'E026', 'Keyboard': ''},
+    '\ue027': {'ID': '79', 'Name': 'extfingerul', 'Unicode': 'E027', 'Keyboard': ''},
+    '\ue028': {'ID': '80', 'Name': 'extfingerol', 'Unicode': 'E028', 'Keyboard': ''},
+    '\ue029': {'ID': '81', 'Name': 'extfingero', 'Unicode': 'E029', 'Keyboard': ''},
+    '\ue02a': {'ID': '82', 'Name': 'extfingeror', 'Unicode': 'E02A', 'Keyboard': ''},
+    '\ue02b': {'ID': '83', 'Name': 'extfingeril', 'Unicode': 'E02B', 'Keyboard': ''},
+    '\ue02c': {'ID': '84', 'Name': 'extfingeri', 'Unicode': 'E02C', 'Keyboard': ''},
+    '\ue02d': {'ID': '85', 'Name': 'extfingerir', 'Unicode': 'E02D', 'Keyboard': ''},
+    '\ue02e': {'ID': '86', 'Name': 'extfingerui', 'Unicode': 'E02E', 'Keyboard': ''},
+    '\ue02f': {'ID': '87', 'Name': 'extfingerdi', 'Unicode': 'E02F', 'Keyboard': ''},
+    '\ue030': {'ID': '88', 'Name': 'extfingerdo', 'Unicode': 'E030', 'Keyboard': ''},
+    '\ue031': {'ID': '89', 'Name': 'extfingeruo', 'Unicode': 'E031', 'Keyboard': ''},
+    '\ue038': {'ID': '96', 'Name': 'palmu', 'Unicode': 'E038', 'Keyboard': ''},
+    '\ue039': {'ID': '97', 'Name': 'palmur', 'Unicode': 'E039', 'Keyboard': ''},
+    '\ue03a': {'ID': '98', 'Name': 'palmr', 'Unicode': 'E03A', 'Keyboard': ''},
+    '\ue03b': {'ID': '99', 'Name': 'palmdr', 'Unicode': 'E03B', 'Keyboard': ''},
+    '\ue03c': {'ID': '100', 'Name': 'palmd', 'Unicode': 'E03C', 'Keyboard': ''},
+    '\ue03d': {'ID': '101', 'Name': 'palmdl', 'Unicode': 'E03D', 'Keyboard': ''},
+    '\ue03e': {'ID': '102', 'Name': 'palml', 'Unicode': 'E03E', 'Keyboard': ''},
+    '\ue03f': {'ID': '103', 'Name': 'palmul', 'Unicode': 'E03F', 'Keyboard': ''},
+    '\ue040': {'ID': '113', 'Name': 'head', 'Unicode': 'E040', 'Keyboard': ''},
+    '\ue041': {'ID': '114', 'Name': 'headtop', 'Unicode': 'E041', 'Keyboard': ''},
+    '\ue042': {'ID': '115', 'Name': 'forehead', 'Unicode': 'E042', 'Keyboard': ''},
+    '\ue043': {'ID': '116', 'Name': 'eyebrows', 'Unicode': 'E043', 'Keyboard': ''},
+    '\ue044': {'ID': '117', 'Name': 'eyes', 'Unicode': 'E044', 'Keyboard': ''},
+    '\ue045': {'ID': '118', 'Name': 'nose', 'Unicode': 'E045', 'Keyboard': ''},
+    '\ue046': {'ID': '94', 'Name': 'nostrils', 'Unicode': 'E046', 'Keyboard': ''},
+    '\ue047': {'ID': '119', 'Name': 'ear', 'Unicode': 'E047', 'Keyboard': ''},
+    '\ue048': {'ID': '93', 'Name': 'earlobe', 'Unicode': 'E048', 'Keyboard': ''},
+    '\ue049': {'ID': '120', 'Name': 'cheek', 'Unicode': 'E049', 'Keyboard': ''},
+    '\ue04a': {'ID': '121', 'Name': 'lips', 'Unicode': 'E04A', 'Keyboard': ''},
+    '\ue04b': {'ID': '109', 'Name': 'tongue', 'Unicode': 'E04B', 'Keyboard': ''},
+    '\ue04c': {'ID': '110', 'Name': 'teeth', 'Unicode': 'E04C', 'Keyboard': ''},
+    '\ue04d': {'ID': '122', 'Name': 'chin', 'Unicode': 'E04D', 'Keyboard': ''},
+    '\ue04e': {'ID': '123', 'Name': 'underchin', 'Unicode': 'E04E', 'Keyboard': ''},
+    '\ue04f': {'ID': '124', 'Name': 'neck', 'Unicode': 'E04F', 'Keyboard': ''},
+    '\ue050': {'ID': '95', 'Name': 'shouldertop', 'Unicode': 'E050', 'Keyboard': ''},
+    '\ue051': {'ID': '125', 'Name': 'shoulders', 'Unicode': 'E051', 'Keyboard': ''},
+    '\ue052': {'ID': '126', 'Name': 'chest', 'Unicode': 'E052', 'Keyboard': ''},
+    '\ue053': {'ID': '111', 'Name': 'stomach', 'Unicode': 'E053', 'Keyboard': ''},
+    '\ue054': {'ID': '128', 'Name': 'belowstomach', 'Unicode': 'E054', 'Keyboard': ''},
+    '\ue058': {'ID': '129', 'Name': 'lrbeside', 'Unicode': 'E058', 'Keyboard': ''},
+    '\ue059': {'ID': '130', 'Name': 'lrat', 'Unicode': 'E059', 'Keyboard': ''},
+    '\ue05a': {'ID': '158', 'Name': 'coreftag', 'Unicode': 'E05A', 'Keyboard': ''},
+    '\ue05b': {'ID': '159', 'Name': 'corefref', 'Unicode': 'E05B', 'Keyboard': ''},
+    '\ue05f': {'ID': '112', 'Name': 'neutralspace', 'Unicode': 'E05F', 'Keyboard': ''},
+    '\ue060': {'ID': '131', 'Name': 'upperarm', 'Unicode': 'E060', 'Keyboard': ''},
+    '\ue061': {'ID': '132', 'Name': 'elbow', 'Unicode': 'E061', 'Keyboard': ''},
+    '\ue062': {'ID': '133', 'Name': 'elbowinside', 'Unicode': 'E062', 'Keyboard': ''},
+    '\ue063': {'ID': '134', 'Name': 'lowerarm', 'Unicode': 'E063', 'Keyboard': ''},
+    '\ue064': {'ID': '135', 'Name': 'wristback', 'Unicode': 'E064', 'Keyboard': ''},
+    '\ue065': {'ID': '136', 'Name': 'wristpulse', 'Unicode': 'E065', 'Keyboard': ''},
+    '\ue066': {'ID': '137', 'Name': 'thumbball', 'Unicode': 'E066', 'Keyboard': ''},
+    '\ue067': {'ID': '138', 'Name': 'palm', 'Unicode': 'E067', 'Keyboard': ''},
+    '\ue068': {'ID': '139', 'Name': 'handback', 'Unicode': 'E068', 'Keyboard': ''},
+    '\ue069': {'ID': '145', 'Name': 'thumbside', 'Unicode': 'E069', 'Keyboard': ''},
+    '\ue06a': {'ID': '146', 'Name': 'pinkyside', 'Unicode': 'E06A', 'Keyboard': ''},
+    '\ue070': {'ID': '140', 'Name': 'thumb', 'Unicode': 'E070', 'Keyboard': '1'},
+    '\ue071': {'ID': '141', 'Name': 'indexfinger', 'Unicode': 'E071', 'Keyboard': '2'},
+    '\ue072': {'ID': '142', 'Name': 'middlefinger', 'Unicode': 'E072', 'Keyboard': '3'},
+    '\ue073': {'ID': '143', 'Name': 'ringfinger', 'Unicode': 'E073', 'Keyboard': '4'},
+    '\ue074': {'ID': '144', 'Name': 'pinky', 'Unicode': 'E074', 'Keyboard': '5'},
+    '\ue075': {'ID': '148', 'Name': 'fingertip', 'Unicode': 'E075', 'Keyboard': 'T'},
+    '\ue076': {'ID': '149', 'Name': 'fingernail', 'Unicode': 'E076', 'Keyboard': 'U'},
+    '\ue077': {'ID': '150', 'Name': 'fingerpad', 'Unicode': 'E077', 'Keyboard': 'V'},
+    '\ue078': {'ID': '151', 'Name': 'fingermidjoint', 'Unicode': 'E078', 'Keyboard': 'W'},
+    '\ue079': {'ID': '152', 'Name': 'fingerbase', 'Unicode': 'E079', 'Keyboard': 'X'},
+    '\ue07a': {'ID': '153', 'Name': 'fingerside', 'Unicode': 'E07A', 'Keyboard': 'Y'},
+    '\ue07c': {'ID': '154', 'Name': 'wristtopulse', 'Unicode': 'E07C', 'Keyboard': ''},
+    '\ue07d': {'ID': '155', 'Name': 'wristtoback', 'Unicode': 'E07D', 'Keyboard': ''},
+    '\ue07e': {'ID': '156', 'Name': 'wristtothumb', 'Unicode': 'E07E', 'Keyboard': ''},
+    '\ue07f': {'ID': '157', 'Name': 'wristtopinky', 'Unicode': 'E07F', 'Keyboard': ''},
+    '\ue080': {'ID': '161', 'Name': 'moveu', 'Unicode': 'E080', 'Keyboard': ''},
+    '\ue081': {'ID': '162', 'Name': 'moveur', 'Unicode': 'E081', 'Keyboard': ''},
+    '\ue082': {'ID': '163', 'Name': 'mover', 'Unicode': 'E082', 'Keyboard': ''},
+    '\ue083': {'ID': '164', 'Name': 'movedr', 'Unicode': 'E083', 'Keyboard': ''},
+    '\ue084': {'ID': '165', 'Name': 'moved', 'Unicode': 'E084', 'Keyboard': ''},
+    '\ue085': {'ID': '166', 'Name': 'movedl', 'Unicode': 'E085', 'Keyboard': ''},
+    '\ue086': {'ID': '167', 'Name': 'movel', 'Unicode': 'E086', 'Keyboard': ''},
+    '\ue087': {'ID': '168', 'Name': 'moveul', 'Unicode': 'E087', 'Keyboard': ''},
+    '\ue088': {'ID': '169', 'Name': 'moveol', 'Unicode': 'E088', 'Keyboard': ''},
+    '\ue089': {'ID': '170', 'Name': 'moveo', 'Unicode': 'E089', 'Keyboard': ''},
+    '\ue08a': {'ID': '171', 'Name': 'moveor', 'Unicode': 'E08A', 'Keyboard': ''},
+    '\ue08b': {'ID': '172', 'Name': 'moveil', 'Unicode': 'E08B', 'Keyboard': ''},
+    '\ue08c': {'ID': '173', 'Name': 'movei', 'Unicode': 'E08C', 'Keyboard': ''},
+    '\ue08d': {'ID': '174', 'Name': 'moveir', 'Unicode': 'E08D', 'Keyboard': ''},
+    '\ue08e': {'ID': '175', 'Name': 'moveui', 'Unicode': 'E08E', 'Keyboard': ''},
+    '\ue08f': {'ID': '176', 'Name': 'movedi', 'Unicode': 'E08F', 'Keyboard': ''},
+    '\ue090': {'ID': '177', 'Name': 'movedo', 'Unicode': 'E090', 'Keyboard': ''},
+    '\ue091': {'ID': '178', 'Name': 'moveuo', 'Unicode': 'E091', 'Keyboard': ''},
+    '\ue092': {'ID': '192', 'Name': 'circleo', 'Unicode': 'E092', 'Keyboard': ''},
+    '\ue093': {'ID': '193', 'Name': 'circlei', 'Unicode': 'E093', 'Keyboard': ''},
+    '\ue094': {'ID': '194', 'Name': 'circled', 'Unicode': 'E094', 'Keyboard': ''},
+    '\ue095': {'ID': '195', 'Name': 'circleu', 'Unicode': 'E095', 'Keyboard': ''},
+    '\ue096': {'ID': '196', 'Name': 'circlel', 'Unicode': 'E096', 'Keyboard': ''},
+    '\ue097': {'ID': '197', 'Name': 'circler', 'Unicode': 'E097', 'Keyboard': ''},
+    '\ue098': {'ID': '240', 'Name': 'circleul', 'Unicode': 'E098', 'Keyboard': ''},
+    '\ue099': {'ID': '241', 'Name': 'circledr', 'Unicode': 'E099', 'Keyboard': ''},
+    '\ue09a': {'ID': '242', 'Name': 'circleur', 'Unicode': 'E09A', 'Keyboard': ''},
+    '\ue09b': {'ID': '243', 'Name': 'circledl', 'Unicode': 'E09B', 'Keyboard': ''},
+    '\ue09c': {'ID': '244', 'Name': 'circleol', 'Unicode': 'E09C', 'Keyboard': ''},
+    '\ue09d': {'ID': '245', 'Name': 'circleir', 'Unicode': 'E09D', 'Keyboard': ''},
+    '\ue09e': {'ID': '246', 'Name': 'circleor', 'Unicode': 'E09E', 'Keyboard': ''},
+    '\ue09f': {'ID': '247', 'Name': 'circleil', 'Unicode': 'E09F', 'Keyboard': ''},
+    '\ue0a0': {'ID': '249', 'Name': 'circleui', 'Unicode': 'E0A0', 'Keyboard': ''},
+    '\ue0a1': {'ID': '248', 'Name': 'circledo', 'Unicode': 'E0A1', 'Keyboard': ''},
+    '\ue0a2': {'ID': '250', 'Name': 'circleuo', 'Unicode': 'E0A2', 'Keyboard': ''},
+    '\ue0a3': {'ID': '251', 'Name': 'circledi', 'Unicode': 'E0A3', 'Keyboard': ''},
+    '\ue0a4': {'ID': '189', 'Name': 'fingerplay', 'Unicode': 'E0A4', 'Keyboard': ''},
+    '\ue0a5': {'ID': '227', 'Name': 'nodding', 'Unicode': 'E0A5', 'Keyboard': ''},
+    '\ue0a6': {'ID': '228', 'Name': 'swinging', 'Unicode': 'E0A6', 'Keyboard': ''},
+    '\ue0a7': {'ID': '229', 'Name': 'twisting', 'Unicode': 'E0A7', 'Keyboard': ''},
+    '\ue0a8': {'ID': '230', 'Name': 'stircw', 'Unicode': 'E0A8', 'Keyboard': ''},
+    '\ue0a9': {'ID': '231', 'Name': 'stirccw', 'Unicode': 'E0A9', 'Keyboard': ''},
+    '\ue0aa': {'ID': '104', 'Name': 'replace', 'Unicode': 'E0AA', 'Keyboard': ''},
+    '\ue0ad': {'ID': '179', 'Name': 'movecross', 'Unicode': 'E0AD', 'Keyboard': ''},
+    '\ue0ae': {'ID': '180', 'Name': 'moveX', 'Unicode': 'E0AE', 'Keyboard': ''},
+    '\ue0af': {'ID': '160', 'Name': 'nomotion', 'Unicode': 'E0AF', 'Keyboard': ''},
+    '\ue0b0': {'ID': '39', 'Name': 'clocku', 'Unicode': 'E0B0', 'Keyboard': ''},
+    '\ue0b1': {'ID': '40', 'Name': 'clockul', 'Unicode': 'E0B1', 'Keyboard': ''},
+    '\ue0b2': {'ID': '41', 'Name': 'clockl', 'Unicode': 'E0B2', 'Keyboard': ''},
+    '\ue0b3': {'ID': '42', 'Name': 'clockdl', 'Unicode': 'E0B3', 'Keyboard': ''},
+    '\ue0b4': {'ID': '43', 'Name': 'clockd', 'Unicode': 'E0B4', 'Keyboard': ''},
+    '\ue0b5': {'ID': '44', 'Name': 'clockdr', 'Unicode': 'E0B5', 'Keyboard': ''},
+    '\ue0b6': {'ID': '45', 'Name': 'clockr', 'Unicode': 'E0B6', 'Keyboard': ''},
+    '\ue0b7': {'ID': '46', 'Name': 'clockur', 'Unicode': 'E0B7', 'Keyboard': ''},
+    '\ue0b8': {'ID': '47', 'Name': 'clockfull', 'Unicode': 'E0B8', 'Keyboard': ''},
+    '\ue0b9': {'ID': '183', 'Name': 'arcl', 'Unicode': 'E0B9', 'Keyboard': ''},
+    '\ue0ba': {'ID': '184', 'Name': 'arcu', 'Unicode': 'E0BA', 'Keyboard': ''},
+    '\ue0bb': {'ID': '185', 'Name': 'arcr', 'Unicode': 'E0BB', 'Keyboard': ''},
+    '\ue0bc': {'ID': '186', 'Name': 'arcd', 'Unicode': 'E0BC', 'Keyboard': ''},
+    '\ue0bd': {'ID': '187', 'Name': 'wavy', 'Unicode': 'E0BD', 'Keyboard': ''},
+    '\ue0be': {'ID': '188', 'Name': 'zigzag', 'Unicode': 'E0BE', 'Keyboard': ''},
+    '\ue0c0': {'ID': '220', 'Name': 'ellipseh', 'Unicode': 'E0C0', 'Keyboard': ''},
+    '\ue0c1': {'ID': '221', 'Name': 'ellipseur', 'Unicode': 'E0C1', 'Keyboard': ''},
+    '\ue0c2': {'ID': '222', 'Name': 'ellipsev', 'Unicode': 'E0C2', 'Keyboard': ''},
+    '\ue0c3': {'ID': '223', 'Name': 'ellipseul', 'Unicode': 'E0C3', 'Keyboard': ''},
+    '\ue0c4': {'ID': '198', 'Name': 'increasing', 'Unicode': 'E0C4', 'Keyboard': ''},
+    '\ue0c5': {'ID': '199', 'Name': 'decreasing', 'Unicode': 'E0C5', 'Keyboard': ''},
+    '\ue0c6': {'ID': '181', 'Name': 'smallmod', 'Unicode': 'E0C6', 'Keyboard': ''},
+    '\ue0c7': {'ID': '182', 'Name': 'largemod', 'Unicode': 'E0C7', 'Keyboard': ''},
+    '\ue0c8': {'ID': '204', 'Name': 'fast', 'Unicode': 'E0C8', 'Keyboard': ''},
+    '\ue0c9': {'ID': '205', 'Name': 'slow', 'Unicode': 'E0C9', 'Keyboard': ''},
+    '\ue0ca': {'ID': '206', 'Name': 'tense', 'Unicode': 'E0CA', 'Keyboard': ''},
+    '\ue0cb': {'ID': '207', 'Name': 'rest', 'Unicode': 'E0CB', 'Keyboard': ''},
+    '\ue0cc': {'ID': '208', 'Name': 'halt', 'Unicode': 'E0CC', 'Keyboard': ''},
+    '\ue0d0': {'ID': '200', 'Name': 'close', 'Unicode': 'E0D0', 'Keyboard': ''},
+    '\ue0d1': {'ID': '201', 'Name': 'touch', 'Unicode': 'E0D1', 'Keyboard': ''},
+    '\ue0d2': {'ID': '202', 'Name': 'interlock', 'Unicode': 'E0D2', 'Keyboard': ''},
+    '\ue0d3': {'ID': '203', 'Name': 'cross', 'Unicode': 'E0D3', 'Keyboard': ''},
+    '\ue0d4': {'ID': '105', 'Name': 'armextended', 'Unicode': 'E0D4', 'Keyboard': ''},
+    '\ue0d5': {'ID': '106', 'Name': 'behind', 'Unicode': 'E0D5', 'Keyboard': ''},
+    '\ue0d6': {'ID': '217', 'Name': 'brushing', 'Unicode': 'E0D6', 'Keyboard': ''},
+    '\ue0d8': {'ID': '209', 'Name': 'repeatfromstart', 'Unicode': 'E0D8', 'Keyboard': ''},
+    '\ue0d9': {'ID': '210', 'Name': 'repeatfromstartseveral', 'Unicode': 'E0D9', 'Keyboard': ''},
+    '\ue0da': {'ID': '211', 'Name': 'repeatcontinue', 'Unicode': 'E0DA', 'Keyboard': ''},
+    '\ue0db': {'ID': '212', 'Name': 'repeatcontinueseveral', 'Unicode': 'E0DB', 'Keyboard': ''},
+    '\ue0dc': {'ID': '216', 'Name': 'repeatreverse', 'Unicode': 'E0DC', 'Keyboard': ''},
+    '\ue0dd': {'ID': '215', 'Name': 'alternatingmotion', 'Unicode': 'E0DD', 'Keyboard': ''},
+    '\ue0e0': {'ID': '213', 'Name': 'seqbegin', 'Unicode': 'E0E0', 'Keyboard': ''},
+    '\ue0e1': {'ID': '214', 'Name': 'seqend', 'Unicode': 'E0E1', 'Keyboard': ''},
+    '\ue0e2': {'ID': '190', 'Name': 'parbegin', 'Unicode': 'E0E2', 'Keyboard': ''},
+    '\ue0e3': {'ID': '191', 'Name': 'parend', 'Unicode': 'E0E3', 'Keyboard': ''},
+    '\ue0e4': {'ID': '236', 'Name': 'fusionbegin', 'Unicode': 'E0E4', 'Keyboard': ''},
+    '\ue0e5': {'ID': '237', 'Name': 'fusionend', 'Unicode': 'E0E5', 'Keyboard': ''},
+    '\ue0e6': {'ID': '147', 'Name': 'between', 'Unicode': 'E0E6', 'Keyboard': 'S'},
+    '\ue0e7': {'ID': '37', 'Name': 'plus', 'Unicode': 'E0E7', 'Keyboard': ''},
+    '\ue0e8': {'ID': '48', 'Name': 'symmpar', 'Unicode': 'E0E8', 'Keyboard': ''},
+    '\ue0e9': {'ID': '49', 'Name': 'symmlr', 'Unicode': 'E0E9', 'Keyboard': ''},
+    '\ue0ea': {'ID': '68', 'Name': 'nondominant', 'Unicode': 'E0EA', 'Keyboard': ''},
+    '\ue0eb': {'ID': '218', 'Name': 'nonipsi', 'Unicode': 'E0EB', 'Keyboard': ''},
+    '\ue0ec': {'ID': '107', 'Name': 'etc', 'Unicode': 'E0EC', 'Keyboard': ''},
+    '\ue0ed': {'ID': '108', 'Name': 'orirelative', 'Unicode': 'E0ED', 'Keyboard': ''},
+    '\ue0f0': {'ID': '224', 'Name': 'mime', 'Unicode': 'E0F0', 'Keyboard': ''},
+    '\ue0f1': {'ID': '20', 'Name': 'version40', 'Unicode': 'E0F1', 'Keyboard': ''},
+    }
@@ -0,0 +1,211 @@
+# generated by pysign.data.write_tables, do not edit
+TABLE = {
+    ' ': {'': '0', 'NAME': 'hamspace', 'UNICODE': '20', 'SYMBOL': ' ', 'DOMAIN': '', 'TYPE': '', 'SUBDOMAIN': '', 'NOTE': 'unclear how it is used'},
+    '!': {'': '1', 'NAME': 'hamexclaim', 'UNICODE': '21', 'SYMBOL': '!', 'DOMAIN': 'sentence', 'TYPE': 'base', 'SUBDOMAIN': 'facial-expr', 'NOTE': ''},
+    ',': {'': '2', 'NAME': 'hamcomma', 'UNICODE': '002C', 'SYMBOL': ',', 'DOMAIN': 'sentence', 'TYPE': 'base', 'SUBDOMAIN': 'sequential', 'NOTE': ''},
+    '.': {'': '3', 'NAME': 'hamfullstop', 'UNICODE': '002E', 'SYMBOL': '.', 'DOMAIN': 'sentence', 'TYPE': 'base', 'SUBDOMAIN': 'facial-neutral', 'NOTE': ''},
+    '?': {'': '4', 'NAME': 'hamquery', 'UNICODE': '003F', 'SYMBOL': '?', 'DOMAIN': 'sentence', 'TYPE': 'base', 'SUBDOMAIN': 'facial-expr', 'NOTE': ''},
+    '{': {'': '5', 'NAME': 'hamaltbegin', 'UNICODE': '007B', 'SYMBOL': '{', 'DOMAIN': 'logical', 'TYPE': 'start', 'SUBDOMAIN': 'variation', 'NOTE': ''},
+    '|': {'': '6', 'NAME': 'hammetaalt', 'UNICODE': '007C', 'SYMBOL': '|', 'DOMAIN': 'logical', 'TYPE': 'or', 'SUBDOMAIN': 'variation', 'NOTE': ''},
+    '}': {'': '7', 'NAME': 'hamaltend', 'UNICODE': '007D', 'SYMBOL': '}', 'DOMAIN': 'logical', 'TYPE': 'stop', 'SUBDOMAIN': 'variation', 'NOTE': ''},
+    '\ue000': {'': '8', 'NAME': 'hamfist', 'UNICODE': 'E000', 'SYMBOL': '\ue000', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue001': {'': '9', 'NAME': 'hamflathand', 'UNICODE': 'E001', 'SYMBOL': '\ue001', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue002': {'': '10', 'NAME': 'hamfinger2', 'UNICODE': 'E002', 'SYMBOL': '\ue002', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue003': {'': '11', 'NAME': 'hamfinger23', 'UNICODE': 'E003', 'SYMBOL': '\ue003', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue004': {'': '12', 'NAME': 'hamfinger23spread', 'UNICODE': 'E004', 'SYMBOL': '\ue004', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue005': {'': '13', 'NAME': 'hamfinger2345', 'UNICODE': 'E005', 'SYMBOL': '\ue005', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue006': {'': '14', 'NAME': 'hampinch12', 'UNICODE': 'E006', 'SYMBOL': '\ue006', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue007': {'': '15', 'NAME': 'hampinchall', 'UNICODE': 'E007', 'SYMBOL': '\ue007', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue008': {'': '16', 'NAME': 'hampinch12open', 'UNICODE': 'E008', 'SYMBOL': '\ue008', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue009': {'': '17', 'NAME': 'hamcee12', 'UNICODE': 'E009', 'SYMBOL': '\ue009', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue00a': {'': '18', 'NAME': 'hamceeall', 'UNICODE': 'E00A', 'SYMBOL': '\ue00a', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue00b': {'': '19', 'NAME': 'hamceeopen', 'UNICODE': 'E00B', 'SYMBOL': '\ue00b', 'DOMAIN': 'handshape', 'TYPE': 'base', 'SUBDOMAIN': 'fingers', 'NOTE': ''},
+    '\ue00c': {'': '20', 'NAME': 'hamthumboutmod', 'UNICODE': 'E00C', 'SYMBOL': '\ue00c', 'DOMAIN': 'handshape', 'TYPE': 'diacritic', 'SUBDOMAIN': 'thumb', 'NOTE': ''},
+    '\ue00d': {'': '21', 'NAME': 'hamthumbacrossmod', 'UNICODE': 'E00D', 'SYMBOL': '\ue00d', 'DOMAIN': 'handshape', 'TYPE': 'diacritic', 'SUBDOMAIN': 'thumb', 'NOTE': ''},
+    '\ue00e': {'': '22', 'NAME': 'hamthumbopenmod', 'UNICODE': 'E00E', 'SYMBOL': '\ue00e', 'DOMAIN': 'handshape', 'TYPE': 'diacritic', 'SUBDOMAIN': 'thumb', 'NOTE': ''},
+    '\ue010': {'': '23', 'NAME': 'hamfingerstraightmod', 'UNICODE': 'E010', 'SYMBOL': '\ue010', 'DOMAIN': 'handshape', 'TYPE': 'diacritic', 'SUBDOMAIN': 'flexion', 'NOTE': ''},
+    '\ue011': {'': '24', 'NAME': 'hamfingerbendmod', 'UNICODE': 'E011', 'SYMBOL': '\ue011', 'DOMAIN': 'handshape', 'TYPE': 'diacritic', 'SUBDOMAIN': 'flexion', 'NOTE': ''},
+    '\ue012': {'': '25', 'NAME': 'hamfingerhookmod', 'UNICODE': 'E012', 'SYMBOL': '\ue012', 'DOMAIN': 'handshape', 'TYPE': 'diacritic', 'SUBDOMAIN': 'flexion', 'NOTE': ''},
+    '\ue013': {'': '26', 'NAME': 'hamdoublebent', 'UNICODE': 'E013', 'SYMBOL': '\ue013', 'DOMAIN': 'handshape|location', 'TYPE': 'diacritic', 'SUBDOMAIN': 'flexion', 'NOTE': 'ambiguous'},
+    '\ue014': {'': '27', 'NAME': 'hamdoublehooked', 'UNICODE': 'E014', 'SYMBOL': '\ue014', 'DOMAIN': 'handshape|location', 'TYPE': 'diacritic', 'SUBDOMAIN': 'flexion', 'NOTE': 'ambiguous'},
+    '\ue020': {'': '28', 'NAME': 'hamextfingeru', 'UNICODE': 'E020', 'SYMBOL': '\ue020', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue021': {'': '29', 'NAME': 'hamextfingerur', 'UNICODE': 'E021', 'SYMBOL': '\ue021', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue022': {'': '30', 'NAME': 'hamextfingerr', 'UNICODE': 'E022', 'SYMBOL': '\ue022', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue023': {'': '31', 'NAME': 'hamextfingerdr', 'UNICODE': 'E023', 'SYMBOL': '\ue023', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue024': {'': '32', 'NAME': 'hamextfingerd', 'UNICODE': 'E024', 'SYMBOL': '\ue024', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue025': {'': '33', 'NAME': 'hamextfingerdl', 'UNICODE': 'E025', 'SYMBOL': '\ue025', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue026': {'': '34', 'NAME': 'hamextfingerl', 'UNICODE': 'E026', 'SYMBOL': '\ue026', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue027': {'': '35', 'NAME': 'hamextfingerul', 'UNICODE': 'E027', 'SYMBOL': '\ue027', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue028': {'': '36', 'NAME': 'hamextfingerol', 'UNICODE': 'E028', 'SYMBOL': '\ue028', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue029': {'': '37', 'NAME': 'hamextfingero', 'UNICODE': 'E029', 'SYMBOL': '\ue029', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue02a': {'': '38', 'NAME': 'hamextfingeror', 'UNICODE': 'E02A', 'SYMBOL': '\ue02a', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue02b': {'': '39', 'NAME': 'hamextfingeril', 'UNICODE': 'E02B', 'SYMBOL': '\ue02b', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue02c': {'': '40', 'NAME': 'hamextfingeri', 'UNICODE': 'E02C', 'SYMBOL': '\ue02c', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue02d': {'': '41', 'NAME': 'hamextfingerir', 'UNICODE': 'E02D', 'SYMBOL': '\ue02d', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue02e': {'': '42', 'NAME': 'hamextfingerui', 'UNICODE': 'E02E', 'SYMBOL': '\ue02e', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue02f': {'': '43', 'NAME': 'hamextfingerdi', 'UNICODE': 'E02F', 'SYMBOL': '\ue02f', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue030': {'': '44', 'NAME': 'hamextfingerdo', 'UNICODE': 'E030', 'SYMBOL': '\ue030', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue031': {'': '45', 'NAME': 'hamextfingeruo', 'UNICODE': 'E031', 'SYMBOL': '\ue031', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-finger', 'NOTE': ''},
+    '\ue038': {'': '46', 'NAME': 'hampalmu', 'UNICODE': 'E038', 'SYMBOL': '\ue038', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue039': {'': '47', 'NAME': 'hampalmur', 'UNICODE': 'E039', 'SYMBOL': '\ue039', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue03a': {'': '48', 'NAME': 'hampalmr', 'UNICODE': 'E03A', 'SYMBOL': '\ue03a', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue03b': {'': '49', 'NAME': 'hampalmdr', 'UNICODE': 'E03B', 'SYMBOL': '\ue03b', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue03c': {'': '50', 'NAME': 'hampalmd', 'UNICODE': 'E03C', 'SYMBOL': '\ue03c', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue03d': {'': '51', 'NAME': 'hampalmdl', 'UNICODE': 'E03D', 'SYMBOL': '\ue03d', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue03e': {'': '52', 'NAME': 'hampalml', 'UNICODE': 'E03E', 'SYMBOL': '\ue03e', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue03f': {'': '53', 'NAME': 'hampalmul', 'UNICODE': 'E03F', 'SYMBOL': '\ue03f', 'DOMAIN': 'orientation', 'TYPE': 'base', 'SUBDOMAIN': 'direction-palm', 'NOTE': ''},
+    '\ue040': {'': '54', 'NAME': 'hamhead', 'UNICODE': 'E040', 'SYMBOL': '\ue040', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'head', 'NOTE': ''},
+    '\ue041': {'': '55', 'NAME': 'hamheadtop', 'UNICODE': 'E041', 'SYMBOL': '\ue041', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'head', 'NOTE': ''},
+    '\ue042': {'': '56', 'NAME': 'hamforehead', 'UNICODE': 'E042', 'SYMBOL': '\ue042', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'head', 'NOTE': ''},
+    '\ue043': {'': '57', 'NAME': 'hameyebrows', 'UNICODE': 'E043', 'SYMBOL': '\ue043', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue044': {'': '58', 'NAME': 'hameyes', 'UNICODE': 'E044', 'SYMBOL': '\ue044', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue045': {'': '59', 'NAME': 'hamnose', 'UNICODE': 'E045', 'SYMBOL': '\ue045', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue046': {'': '60', 'NAME': 'hamnostrils', 'UNICODE': 'E046', 'SYMBOL': '\ue046', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue047': {'': '61', 'NAME': 'hamear', 'UNICODE': 'E047', 'SYMBOL': '\ue047', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue048': {'': '62', 'NAME': 'hamearlobe', 'UNICODE': 'E048', 'SYMBOL': '\ue048', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue049': {'': '63', 'NAME': 'hamcheek', 'UNICODE': 'E049', 'SYMBOL': '\ue049', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue04a': {'': '64', 'NAME': 'hamlips', 'UNICODE': 'E04A', 'SYMBOL': '\ue04a', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue04b': {'': '65', 'NAME': 'hamtongue', 'UNICODE': 'E04B', 'SYMBOL': '\ue04b', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue04c': {'': '66', 'NAME': 'hamteeth', 'UNICODE': 'E04C', 'SYMBOL': '\ue04c', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue04d': {'': '67', 'NAME': 'hamchin', 'UNICODE': 'E04D', 'SYMBOL': '\ue04d', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'face', 'NOTE': ''},
+    '\ue04e': {'': '68', 'NAME': 'hamunderchin', 'UNICODE': 'E04E', 'SYMBOL': '\ue04e', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'head', 'NOTE': ''},
+    '\ue04f': {'': '69', 'NAME': 'hamneck', 'UNICODE': 'E04F', 'SYMBOL': '\ue04f', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'head', 'NOTE': ''},
+    '\ue050': {'': '70', 'NAME': 'hamshouldertop', 'UNICODE': 'E050', 'SYMBOL': '\ue050', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'body', 'NOTE': ''},
+    '\ue051': {'': '71', 'NAME': 'hamshoulders', 'UNICODE': 'E051', 'SYMBOL': '\ue051', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'body', 'NOTE': ''},
+    '\ue052': {'': '72', 'NAME': 'hamchest', 'UNICODE': 'E052', 'SYMBOL': '\ue052', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'body', 'NOTE': ''},
+    '\ue053': {'': '73', 'NAME': 'hamstomach', 'UNICODE': 'E053', 'SYMBOL': '\ue053', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'body', 'NOTE': ''},
+    '\ue054': {'': '74', 'NAME': 'hambelowstomach', 'UNICODE': 'E054', 'SYMBOL': '\ue054', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'body', 'NOTE': ''},
+    '\ue058': {'': '75', 'NAME': 'hamlrbeside', 'UNICODE': 'E058', 'SYMBOL': '\ue058', 'DOMAIN': 'handshape|location', 'TYPE': 'diacritic', 'SUBDOMAIN': 'relative-space', 'NOTE': 'ambiguous'},
+    '\ue059': {'': '76', 'NAME': 'hamlrat', 'UNICODE': 'E059', 'SYMBOL': '\ue059', 'DOMAIN': 'location', 'TYPE': 'diacritic', 'SUBDOMAIN': 'relative-space', 'NOTE': ''},
+    '\ue05a': {'': '77', 'NAME': 'hamcoreftag', 'UNICODE': 'E05A', 'SYMBOL': '\ue05a', 'DOMAIN': 'location', 'TYPE': 'flag', 'SUBDOMAIN': 'index', 'NOTE': 'used in discourse to simplify notation'},
+    '\ue05b': {'': '78', 'NAME': 'hamcorefref', 'UNICODE': 'E05B', 'SYMBOL': '\ue05b', 'DOMAIN': 'location', 'TYPE': 'flag', 'SUBDOMAIN': 'index', 'NOTE': 'used in discourse to simplify notation'},
+    '\ue05f': {'': '79', 'NAME': 'hamneutralspace', 'UNICODE': 'E05F', 'SYMBOL': '\ue05f', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'space', 'NOTE': ''},
+    '\ue060': {'': '80', 'NAME': 'hamupperarm', 'UNICODE': 'E060', 'SYMBOL': '\ue060', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': ''},
+    '\ue061': {'': '81', 'NAME': 'hamelbow', 'UNICODE': 'E061', 'SYMBOL': '\ue061', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': 'deprecated'},
+    '\ue062': {'': '82', 'NAME': 'hamelbowinside', 'UNICODE': 'E062', 'SYMBOL': '\ue062', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': ''},
+    '\ue063': {'': '83', 'NAME': 'hamlowerarm', 'UNICODE': 'E063', 'SYMBOL': '\ue063', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': ''},
+    '\ue064': {'': '84', 'NAME': 'hamwristback', 'UNICODE': 'E064', 'SYMBOL': '\ue064', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': ''},
+    '\ue065': {'': '85', 'NAME': 'hamwristpulse', 'UNICODE': 'E065', 'SYMBOL': '\ue065', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': 'deprecated'},
+    '\ue066': {'': '86', 'NAME': 'hamthumbball', 'UNICODE': 'E066', 'SYMBOL': '\ue066', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'hand', 'NOTE': ''},
+    '\ue067': {'': '87', 'NAME': 'hampalm', 'UNICODE': 'E067', 'SYMBOL': '\ue067', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'hand', 'NOTE': ''},
+    '\ue068': {'': '88', 'NAME': 'hamhandback', 'UNICODE': 'E068', 'SYMBOL': '\ue068', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'hand', 'NOTE': ''},
+    '\ue069': {'': '89', 'NAME': 'hamthumbside', 'UNICODE': 'E069', 'SYMBOL': '\ue069', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'hand', 'NOTE': ''},
+    '\ue06a': {'': '90', 'NAME': 'hampinkyside', 'UNICODE': 'E06A', 'SYMBOL': '\ue06a', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'hand', 'NOTE': ''},
+    '\ue070': {'': '91', 'NAME': 'hamthumb', 'UNICODE': 'E070', 'SYMBOL': '\ue070', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger', 'NOTE': 'ambiguous'},
+    '\ue071': {'': '92', 'NAME': 'hamindexfinger', 'UNICODE': 'E071', 'SYMBOL': '\ue071', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger', 'NOTE': 'ambiguous'},
+    '\ue072': {'': '93', 'NAME': 'hammiddlefinger', 'UNICODE': 'E072', 'SYMBOL': '\ue072', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger', 'NOTE': 'ambiguous'},
+    '\ue073': {'': '94', 'NAME': 'hamringfinger', 'UNICODE': 'E073', 'SYMBOL': '\ue073', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger', 'NOTE': 'ambiguous'},
+    '\ue074': {'': '95', 'NAME': 'hampinky', 'UNICODE': 'E074', 'SYMBOL': '\ue074', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger', 'NOTE': 'ambiguous'},
+    '\ue075': {'': '96', 'NAME': 'hamfingertip', 'UNICODE': 'E075', 'SYMBOL': '\ue075', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger-part', 'NOTE': 'ambiguous'},
+    '\ue076': {'': '97', 'NAME': 'hamfingernail', 'UNICODE': 'E076', 'SYMBOL': '\ue076', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger-part', 'NOTE': 'ambiguous'},
+    '\ue077': {'': '98', 'NAME': 'hamfingerpad', 'UNICODE': 'E077', 'SYMBOL': '\ue077', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger-part', 'NOTE': 'deprecated; ambiguous'},
+    '\ue078': {'': '99', 'NAME': 'hamfingermidjoint', 'UNICODE': 'E078', 'SYMBOL': '\ue078', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger-part', 'NOTE': 'ambiguous'},
+    '\ue079': {'': '100', 'NAME': 'hamfingerbase', 'UNICODE': 'E079', 'SYMBOL': '\ue079', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger-part', 'NOTE': 'ambiguous'},
+    '\ue07a': {'': '101', 'NAME': 'hamfingerside', 'UNICODE': 'E07A', 'SYMBOL': '\ue07a', 'DOMAIN': 'handshape|location', 'TYPE': '', 'SUBDOMAIN': 'finger-part', 'NOTE': 'ambiguous'},
+    '\ue07c': {'': '102', 'NAME': 'hamwristtopulse', 'UNICODE': 'E07C', 'SYMBOL': '', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': "deprecated; can't find the symbols"},
+    '\ue07d': {'': '103', 'NAME': 'hamwristtoback', 'UNICODE': 'E07D', 'SYMBOL': '', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': "deprecated; can't find the symbols"},
+    '\ue07e': {'': '104', 'NAME': 'hamwristtothumb', 'UNICODE': 'E07E', 'SYMBOL': '', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': "deprecated; can't find the symbols"},
+    '\ue07f': {'': '105', 'NAME': 'hamwristtopinky', 'UNICODE': 'E07F', 'SYMBOL': '', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'arm', 'NOTE': "deprecated; can't find the symbols"},
+    '\ue080': {'': '106', 'NAME': 'hammoveu', 'UNICODE': 'E080', 'SYMBOL': '\ue080', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue081': {'': '107', 'NAME': 'hammoveur', 'UNICODE': 'E081', 'SYMBOL': '\ue081', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue082': {'': '108', 'NAME': 'hammover', 'UNICODE': 'E082', 'SYMBOL': '\ue082', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue083': {'': '109', 'NAME': 'hammovedr', 'UNICODE': 'E083', 'SYMBOL': '\ue083', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue084': {'': '110', 'NAME': 'hammoved', 'UNICODE': 'E084', 'SYMBOL': '\ue084', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue085': {'': '111', 'NAME': 'hammovedl', 'UNICODE': 'E085', 'SYMBOL': '\ue085', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue086': {'': '112', 'NAME': 'hammovel', 'UNICODE': 'E086', 'SYMBOL': '\ue086', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue087': {'': '113', 'NAME': 'hammoveul', 'UNICODE': 'E087', 'SYMBOL': '\ue087', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue088': {'': '114', 'NAME': 'hammoveol', 'UNICODE': 'E088', 'SYMBOL': '\ue088', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue089': {'': '115', 'NAME': 'hammoveo', 'UNICODE': 'E089', 'SYMBOL': '\ue089', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue08a': {'': '116', 'NAME': 'hammoveor', 'UNICODE': 'E08A', 'SYMBOL': '\ue08a', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue08b': {'': '117', 'NAME': 'hammoveil', 'UNICODE': 'E08B', 'SYMBOL': '\ue08b', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue08c': {'': '118', 'NAME': 'hammovei', 'UNICODE': 'E08C', 'SYMBOL': '\ue08c', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue08d': {'': '119', 'NAME': 'hammoveir', 'UNICODE': 'E08D', 'SYMBOL': '\ue08d', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue08e': {'': '120', 'NAME': 'hammoveui', 'UNICODE': 'E08E', 'SYMBOL': '\ue08e', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue08f': {'': '121', 'NAME': 'hammovedi', 'UNICODE': 'E08F', 'SYMBOL': '\ue08f', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue090': {'': '122', 'NAME': 'hammovedo', 'UNICODE': 'E090', 'SYMBOL': '\ue090', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue091': {'': '123', 'NAME': 'hammoveuo', 'UNICODE': 'E091', 'SYMBOL': '\ue091', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue092': {'': '124', 'NAME': 'hamcircleo', 'UNICODE': 'E092', 'SYMBOL': '\ue092', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue093': {'': '125', 'NAME': 'hamcirclei', 'UNICODE': 'E093', 'SYMBOL': '\ue093', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue094': {'': '126', 'NAME': 'hamcircled', 'UNICODE': 'E094', 'SYMBOL': '\ue094', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue095': {'': '127', 'NAME': 'hamcircleu', 'UNICODE': 'E095', 'SYMBOL': '\ue095', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue096': {'': '128', 'NAME': 'hamcirclel', 'UNICODE': 'E096', 'SYMBOL': '\ue096', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue097': {'': '129', 'NAME': 'hamcircler', 'UNICODE': 'E097', 'SYMBOL': '\ue097', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue098': {'': '130', 'NAME': 'hamcircleul', 'UNICODE': 'E098', 'SYMBOL': '\ue098', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue099': {'': '131', 'NAME': 'hamcircledr', 'UNICODE': 'E099', 'SYMBOL': '\ue099', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue09a': {'': '132', 'NAME': 'hamcircleur', 'UNICODE': 'E09A', 'SYMBOL': '\ue09a', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue09b': {'': '133', 'NAME': 'hamcircledl', 'UNICODE': 'E09B', 'SYMBOL': '\ue09b', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue09c': {'': '134', 'NAME': 'hamcircleol', 'UNICODE': 'E09C', 'SYMBOL': '\ue09c', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue09d': {'': '135', 'NAME': 'hamcircleir', 'UNICODE': 'E09D', 'SYMBOL': '\ue09d', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue09e': {'': '136', 'NAME': 'hamcircleor', 'UNICODE': 'E09E', 'SYMBOL': '\ue09e', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue09f': {'': '137', 'NAME': 'hamcircleil', 'UNICODE': 'E09F', 'SYMBOL': '\ue09f', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0a0': {'': '138', 'NAME': 'hamcircleui', 'UNICODE': 'E0A0', 'SYMBOL': '\ue0a0', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0a1': {'': '139', 'NAME': 'hamcircledo', 'UNICODE': 'E0A1', 'SYMBOL': '\ue0a1', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0a2': {'': '140', 'NAME': 'hamcircleuo', 'UNICODE': 'E0A2', 'SYMBOL': '\ue0a2', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0a3': {'': '141', 'NAME': 'hamcircledi', 'UNICODE': 'E0A3', 'SYMBOL': '\ue0a3', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0a4': {'': '142', 'NAME': 'hamfingerplay', 'UNICODE': 'E0A4', 'SYMBOL': '\ue0a4', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'internal', 'NOTE': ''},
+    '\ue0a5': {'': '143', 'NAME': 'hamnodding', 'UNICODE': 'E0A5', 'SYMBOL': '\ue0a5', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'wrist', 'NOTE': ''},
+    '\ue0a6': {'': '144', 'NAME': 'hamswinging', 'UNICODE': 'E0A6', 'SYMBOL': '\ue0a6', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'wrist', 'NOTE': ''},
+    '\ue0a7': {'': '145', 'NAME': 'hamtwisting', 'UNICODE': 'E0A7', 'SYMBOL': '\ue0a7', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'wrist', 'NOTE': ''},
+    '\ue0a8': {'': '146', 'NAME': 'hamstircw', 'UNICODE': 'E0A8', 'SYMBOL': '\ue0a8', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'wrist', 'NOTE': ''},
+    '\ue0a9': {'': '147', 'NAME': 'hamstirccw', 'UNICODE': 'E0A9', 'SYMBOL': '\ue0a9', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'wrist', 'NOTE': ''},
+    '\ue0aa': {'': '148', 'NAME': 'hamreplace', 'UNICODE': 'E0AA', 'SYMBOL': '\ue0aa', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'change', 'NOTE': ''},
+    '\ue0ad': {'': '149', 'NAME': 'hammovecross', 'UNICODE': 'E0AD', 'SYMBOL': '', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': "deprecated; can't find the symbols"},
+    '\ue0ae': {'': '150', 'NAME': 'hammoveX', 'UNICODE': 'E0AE', 'SYMBOL': '', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'path', 'NOTE': "deprecated; can't find the symbols"},
+    '\ue0af': {'': '151', 'NAME': 'hamnomotion', 'UNICODE': 'E0AF', 'SYMBOL': '\ue0af', 'DOMAIN': 'movement', 'TYPE': 'base', 'SUBDOMAIN': 'no-move', 'NOTE': ''},
+    '\ue0b0': {'': '152', 'NAME': 'hamclocku', 'UNICODE': 'E0B0', 'SYMBOL': '\ue0b0', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b1': {'': '153', 'NAME': 'hamclockul', 'UNICODE': 'E0B1', 'SYMBOL': '\ue0b1', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b2': {'': '154', 'NAME': 'hamclockl', 'UNICODE': 'E0B2', 'SYMBOL': '\ue0b2', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b3': {'': '155', 'NAME': 'hamclockdl', 'UNICODE': 'E0B3', 'SYMBOL': '\ue0b3', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b4': {'': '156', 'NAME': 'hamclockd', 'UNICODE': 'E0B4', 'SYMBOL': '\ue0b4', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b5': {'': '157', 'NAME': 'hamclockdr', 'UNICODE': 'E0B5', 'SYMBOL': '\ue0b5', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b6': {'': '158', 'NAME': 'hamclockr', 'UNICODE': 'E0B6', 'SYMBOL': '\ue0b6', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b7': {'': '159', 'NAME': 'hamclockur', 'UNICODE': 'E0B7', 'SYMBOL': '\ue0b7', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b8': {'': '160', 'NAME': 'hamclockfull', 'UNICODE': 'E0B8', 'SYMBOL': '\ue0b8', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'circle', 'NOTE': ''},
+    '\ue0b9': {'': '161', 'NAME': 'hamarcl', 'UNICODE': 'E0B9', 'SYMBOL': '\ue0b9', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue0ba': {'': '162', 'NAME': 'hamarcu', 'UNICODE': 'E0BA', 'SYMBOL': '\ue0ba', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue0bb': {'': '163', 'NAME': 'hamarcr', 'UNICODE': 'E0BB', 'SYMBOL': '\ue0bb', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue0bc': {'': '164', 'NAME': 'hamarcd', 'UNICODE': 'E0BC', 'SYMBOL': '\ue0bc', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': ''},
+    '\ue0bd': {'': '165', 'NAME': 'hamwavy', 'UNICODE': 'E0BD', 'SYMBOL': '\ue0bd', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': 'can also combine with subdomain : circle'},
+    '\ue0be': {'': '166', 'NAME': 'hamzigzag', 'UNICODE': 'E0BE', 'SYMBOL': '\ue0be', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': 'can also combine with subdomain : circle'},
+    '\ue0c0': {'': '167', 'NAME': 'hamellipseh', 'UNICODE': 'E0C0', 'SYMBOL': '\ue0c0', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': 'can also combine with subdomain : circle'},
+    '\ue0c1': {'': '168', 'NAME': 'hamellipseur', 'UNICODE': 'E0C1', 'SYMBOL': '\ue0c1', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': 'can also combine with subdomain : circle'},
+    '\ue0c2': {'': '169', 'NAME': 'hamellipsev', 'UNICODE': 'E0C2', 'SYMBOL': '\ue0c2', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': 'can also combine with subdomain : circle'},
+    '\ue0c3': {'': '170', 'NAME': 'hamellipseul', 'UNICODE': 'E0C3', 'SYMBOL': '\ue0c3', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'path', 'NOTE': 'can also combine with subdomain : circle'},
+    '\ue0c4': {'': '171', 'NAME': 'hamincreasing', 'UNICODE': 'E0C4', 'SYMBOL': '\ue0c4', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'repetition', 'NOTE': ''},
+    '\ue0c5': {'': '172', 'NAME': 'hamdecreasing', 'UNICODE': 'E0C5', 'SYMBOL': '\ue0c5', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'repetition', 'NOTE': ''},
+    '\ue0c6': {'': '173', 'NAME': 'hamsmallmod', 'UNICODE': 'E0C6', 'SYMBOL': '\ue0c6', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'size', 'NOTE': ''},
+    '\ue0c7': {'': '174', 'NAME': 'hamlargemod', 'UNICODE': 'E0C7', 'SYMBOL': '\ue0c7', 'DOMAIN': 'movement|symmetry', 'TYPE': 'diacritic', 'SUBDOMAIN': 'size', 'NOTE': 'ambiguous'},
+    '\ue0c8': {'': '175', 'NAME': 'hamfast', 'UNICODE': 'E0C8', 'SYMBOL': '\ue0c8', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'modality', 'NOTE': ''},
+    '\ue0c9': {'': '176', 'NAME': 'hamslow', 'UNICODE': 'E0C9', 'SYMBOL': '\ue0c9', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'modality', 'NOTE': ''},
+    '\ue0ca': {'': '177', 'NAME': 'hamtense', 'UNICODE': 'E0CA', 'SYMBOL': '\ue0ca', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'modality', 'NOTE': ''},
+    '\ue0cb': {'': '178', 'NAME': 'hamrest', 'UNICODE': 'E0CB', 'SYMBOL': '\ue0cb', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'modality', 'NOTE': ''},
+    '\ue0cc': {'': '179', 'NAME': 'hamhalt', 'UNICODE': 'E0CC', 'SYMBOL': '\ue0cc', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'modality', 'NOTE': ''},
+    '\ue0d0': {'': '180', 'NAME': 'hamclose', 'UNICODE': 'E0D0', 'SYMBOL': '\ue0d0', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'contact', 'NOTE': 'perhaps make this separate type, contact'},
+    '\ue0d1': {'': '181', 'NAME': 'hamtouch', 'UNICODE': 'E0D1', 'SYMBOL': '\ue0d1', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'contact', 'NOTE': 'perhaps make this separate type, contact'},
+    '\ue0d2': {'': '182', 'NAME': 'haminterlock', 'UNICODE': 'E0D2', 'SYMBOL': '\ue0d2', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'contact', 'NOTE': 'perhaps make this separate type, contact'},
+    '\ue0d3': {'': '183', 'NAME': 'hamcross', 'UNICODE': 'E0D3', 'SYMBOL': '\ue0d3', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'contact', 'NOTE': 'perhaps make this separate type, contact'},
+    '\ue0d4': {'': '184', 'NAME': 'hamarmextended', 'UNICODE': 'E0D4', 'SYMBOL': '\ue0d4', 'DOMAIN': 'location', 'TYPE': 'diacritic', 'SUBDOMAIN': 'relative-space', 'NOTE': ''},
+    '\ue0d5': {'': '185', 'NAME': 'hambehind', 'UNICODE': 'E0D5', 'SYMBOL': '\ue0d5', 'DOMAIN': 'location', 'TYPE': 'diacritic', 'SUBDOMAIN': 'relative-space', 'NOTE': ''},
+    '\ue0d6': {'': '186', 'NAME': 'hambrushing', 'UNICODE': 'E0D6', 'SYMBOL': '\ue0d6', 'DOMAIN': 'location', 'TYPE': 'base', 'SUBDOMAIN': 'contact', 'NOTE': 'perhaps make this separate type, contact'},
+    '\ue0d8': {'': '187', 'NAME': 'hamrepeatfromstart', 'UNICODE': 'E0D8', 'SYMBOL': '\ue0d8', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'repetition', 'NOTE': ''},
+    '\ue0d9': {'': '188', 'NAME': 'hamrepeatfromstartseveral', 'UNICODE': 'E0D9', 'SYMBOL': '\ue0d9', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'repetition', 'NOTE': ''},
+    '\ue0da': {'': '189', 'NAME': 'hamrepeatcontinue', 'UNICODE': 'E0DA', 'SYMBOL': '\ue0da', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'repetition', 'NOTE': ''},
+    '\ue0db': {'': '190', 'NAME': 'hamrepeatcontinueseveral', 'UNICODE': 'E0DB', 'SYMBOL': '\ue0db', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'repetition', 'NOTE': ''},
+    '\ue0dc': {'': '191', 'NAME': 'hamrepeatreverse', 'UNICODE': 'E0DC', 'SYMBOL': '\ue0dc', 'DOMAIN': 'movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'repetition', 'NOTE': ''},
+    '\ue0dd': {'': '192', 'NAME': 'hamalternatingmotion', 'UNICODE': 'E0DD', 'SYMBOL': '\ue0dd', 'DOMAIN': 'symmetry|movement', 'TYPE': 'diacritic', 'SUBDOMAIN': 'alternation', 'NOTE': 'ambiguous: after symmetry or after movement'},
+    '\ue0e0': {'': '193', 'NAME': 'hamseqbegin', 'UNICODE': 'E0E0', 'SYMBOL': '\ue0e0', 'DOMAIN': 'group', 'TYPE': 'start', 'SUBDOMAIN': 'group', 'NOTE': 'just used for grouping'},
+    '\ue0e1': {'': '194', 'NAME': 'hamseqend', 'UNICODE': 'E0E1', 'SYMBOL': '\ue0e1', 'DOMAIN': 'group', 'TYPE': 'stop', 'SUBDOMAIN': 'group', 'NOTE': 'just used for grouping'},
+    '\ue0e2': {'': '195', 'NAME': 'hamparbegin', 'UNICODE': 'E0E2', 'SYMBOL': '\ue0e2', 'DOMAIN': 'group', 'TYPE': 'start', 'SUBDOMAIN': 'dom-nondom|simultaneous', 'NOTE': 'ambiguous: groups simultaneous movement symbols or marks dominant-nondominant values'},
+    '\ue0e3': {'': '196', 'NAME': 'hamparend', 'UNICODE': 'E0E3', 'SYMBOL': '\ue0e3', 'DOMAIN': 'group', 'TYPE': 'stop', 'SUBDOMAIN': 'dom-nondom|simultaneous', 'NOTE': 'ambiguous: groups simultaneous movement symbols or marks dominant-nondominant values'},
+    '\ue0e4': {'': '197', 'NAME': 'hamfusionbegin', 'UNICODE': 'E0E4', 'SYMBOL': '\ue0e4', 'DOMAIN': 'group', 'TYPE': 'start', 'SUBDOMAIN': 'fuse', 'NOTE': 'applies to movements'},
+    '\ue0e5': {'': '198', 'NAME': 'hamfusionend', 'UNICODE': 'E0E5', 'SYMBOL': '\ue0e5', 'DOMAIN': 'group', 'TYPE': 'stop', 'SUBDOMAIN': 'fuse', 'NOTE': 'applies to movements'},
+    '\ue0e6': {'': '199', 'NAME': 'hambetween', 'UNICODE': 'E0E6', 'SYMBOL': '\ue0e6', 'DOMAIN': 'handshape|any', 'TYPE': 'diacritic|flag', 'SUBDOMAIN': 'thumb|intermediate', 'NOTE': 'ambiguous: as flag means intermediate value between two handshapes; as diacritic means thumb position between fingers'},
+    '\ue0e7': {'': '200', 'NAME': 'hamplus', 'UNICODE': 'E0E7', 'SYMBOL': '\ue0e7', 'DOMAIN': 'group', 'TYPE': 'flag', 'SUBDOMAIN': 'dom-nondom', 'NOTE': ''},
+    '\ue0e8': {'': '201', 'NAME': 'hamsymmpar', 'UNICODE': 'E0E8', 'SYMBOL': '\ue0e8', 'DOMAIN': 'symmetry', 'TYPE': 'base', 'SUBDOMAIN': 'plane', 'NOTE': ''},
+    '\ue0e9': {'': '202', 'NAME': 'hamsymmlr', 'UNICODE': 'E0E9', 'SYMBOL': '\ue0e9', 'DOMAIN': 'symmetry', 'TYPE': 'base', 'SUBDOMAIN': 'plane', 'NOTE': ''},
+    '\ue0ea': {'': '203', 'NAME': 'hamnondominant', 'UNICODE': 'E0EA', 'SYMBOL': '\ue0ea', 'DOMAIN': 'symmetry', 'TYPE': 'flag', 'SUBDOMAIN': 'reverse-dominance', 'NOTE': ''},
+    '\ue0eb': {'': '204', 'NAME': 'hamnonipsi', 'UNICODE': 'E0EB', 'SYMBOL': '\ue0eb', 'DOMAIN': 'symmetry', 'TYPE': 'flag', 'SUBDOMAIN': 'reverse-dominance', 'NOTE': ''},
+    '\ue0ec': {'': '205', 'NAME': 'hametc', 'UNICODE': 'E0EC', 'SYMBOL': '\ue0ec', 'DOMAIN': 'any', 'TYPE': 'diacritic', 'SUBDOMAIN': 'underspecification', 'NOTE': 'can be applied in any domain or subdomain'},
+    '\ue0ed': {'': '206', 'NAME': 'hamorirelative', 'UNICODE': 'E0ED', 'SYMBOL': '\ue0ed', 'DOMAIN': 'orientation', 'TYPE': 'diacritic', 'SUBDOMAIN': 'relative', 'NOTE': ''},
+    '\ue0f0': {'': '207', 'NAME': 'hammime', 'UNICODE': 'E0F0', 'SYMBOL': '\ue0f0', 'DOMAIN': 'sentence', 'TYPE': 'facial', 'SUBDOMAIN': 'place-holder', 'NOTE': ''},
+    }
@@ -0,0 +1,268 @@
+"""
+Command line interface for parsing, converting, and comparing corpora.
+
+Usage:
+    pysign parse [INPUT] [--column NAME] [--output FILE] [--workers N]
+    pysign ascify [INPUT] [--column NAME] [--output FILE]
+    pysign distance [INPUT] --output FILE.npy [--square] [--hand HAND]
+                    [--tilesize N]
+    pysign validate [INPUT] [--column NAME] [--output FILE] [--workers N]
+
+The input is a TSV or CSV file with a header, from which the transcriptions
+are taken from the column passed with `--column`, or a text file with one
+transcription per line. Without an input, or with `-`, it is read from
+standard input. Columns are separated by tabs in files with the extension
+`.tsv`, and by commas otherwise, unless `--delimiter` is passed. The output
+is written to standard output if no file is passed, so that the commands
+can be combined with other tools in pipes.
+"""
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+
+import numpy as np
+
+from pysign import corpus
+from pysign.distance import distance_matrix, distance_memmap
+from pysign.parse import ascify_many, parse_many, Sign, Hand
+
+
+class Progress(object):
+    """
+    Report the number of processed transcriptions on standard error.
+
+    Notes
+    -----
+    The report is updated every `interval` seconds if the stream is a
+    terminal, and written once more when `close` is called.
+    """
+
+    def __init__(self, enabled=True, interval=0.5, stream=None):
+        self.enabled = enabled
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.live = enabled and self.stream.isatty()
+        self.count = 0
+        self.started = self.shown = time.perf_counter()
+
+    def update(self, count):
+        self.count += count
+        now = time.perf_counter()
+        if self.live and now - self.shown >= self.interval:
+            self.shown = now
+            self.stream.write('\r' + self.message(now))
+            self.stream.flush()
+
+    def message(self, now=None):
+        seconds = (now or time.perf_counter()) - self.started
+        return '{0:,} transcriptions in {1:.1f} s ({2:,.0f}/s)'.format(
+                self.count, seconds, self.count / max(seconds, 1e-9))
+
+    def close(self):
+        if self.enabled:
+            self.stream.write(
+                    ('\r' if self.live else '') + self.message() + '\n')
+            self.stream.flush()
+
+
+@contextmanager
+def _open(path, mode):
+    if path in (None, '-'):
+        yield sys.stdin if mode == 'r' else sys.stdout
+    else:
+        with open(path, mode, encoding='utf-8', newline='') as f:
+            yield f
+
+
+class UsageError(Exception):
+    """
+    Error in the arguments, which is reported with the usage of a command.
+    """
+
+
+def read_rows(f, column=None, delimiter=None):
+    """
+    Yield the rows of a corpus and their transcriptions, one by one.
+
+    Notes
+    -----
+    With a `column`, the rows are read with `pysign.corpus.read_rows`, which
+    guesses the delimiter from the name of the file unless it is passed.
+    Without a `column`, each line is a transcription and the rows are `None`.
+    """
+    if column is None:
+        for line in f:
+            yield None, line.rstrip('\r\n')
+        return
+    try:
+        yield from corpus.read_rows(f, column, delimiter)
+    except KeyError as error:
+        raise UsageError(error.args[0])
+
+
+def _chunks(args, f):
+    """
+    Yield chunks of tuples `(row, text, data, error)` parsed in parallel.
+    """
+    rows = deque()
+
+    def texts():
+        for row, text in read_rows(f, args.column, args.delimiter):
+            rows.append(row)
+            yield text
+
+    for chunk in parse_many(
+            texts(), workers=args.workers, chunksize=args.chunksize):
+        yield [(rows.popleft(), text, data, error)
+               for text, data, error in chunk]
+
+
+def parse(args):
+    """
+    Parse transcriptions into JSON lines.
+    """
+    progress = Progress(not args.quiet)
+    with _open(args.input, 'r') as f, _open(args.output, 'w') as out:
+        for chunk in _chunks(args, f):
+            lines = []
+            for row, text, data, error in chunk:
+                record = {'text': text}
+                if row is not None:
+                    record['row'] = row
+                if error is None:
+                    record['data'] = data
+                else:
+                    record['error'] = '{0}: {1}'.format(
+                            type(error).__name__, error)
+                lines.append(json.dumps(record, ensure_ascii=False) + '\n')
+            out.write(''.join(lines))
+            progress.update(len(chunk))
+    progress.close()
+
+
+def ascify(args):
+    """
+    Convert transcriptions to names of symbols, one line per transcription.
+    """
+    progress = Progress(not args.quiet)
+    with _open(args.input, 'r') as f, _open(args.output, 'w') as out:
+        texts = (text for row, text in read_rows(
+            f, args.column, args.delimiter))
+        for chunk in iter(lambda: list(islice(texts, args.chunksize)), []):
+            out.write(''.join(name + '\n' for name in ascify_many(chunk)))
+            progress.update(len(chunk))
+    progress.close()
+
+
+def validate(args):
+    """
+    Report the transcriptions which cannot be parsed.
+    """
+    progress, failed = Progress(not args.quiet), 0
+    with _open(args.input, 'r') as f, _open(args.output, 'w') as out:
+        for chunk in _chunks(args, f):
+            for i, (row, text, data, error) in enumerate(
+                    chunk, start=progress.count + 1):
+                if error is not None:
+                    failed += 1
+                    out.write('{0}\t{1}\t{2}: {3}\n'.format(
+                        i, text, type(error).__name__, error))
+            progress.update(len(chunk))
+    progress.close()
+    if not args.quiet:
+        sys.stderr.write('{0:,} of {1:,} transcriptions are invalid\n'.format(
+            failed, progress.count))
+    return 1 if failed else 0
+
+
+def distance(args):
+    """
+    Write the distances between all pairs of signs to a NumPy file.
+    """
+    progress, signs = Progress(not args.quiet), []
+    with _open(args.input, 'r') as f:
+        for chunk in _chunks(args, f):
+            for row, text, data, error in chunk:
+                if error is not None:
+                    raise ValueError('cannot parse {0}: {1}'.format(
+                        text, error))
+                signs.append(Sign(
+                    text=text,
+                    dominant=Hand(**data['dominant']),
+                    nondominant=Hand(**data['nondominant']),
+                    meta=data['meta'],
+                    symmetry=data['symmetry']))
+            progress.update(len(chunk))
+    progress.close()
+    if args.tilesize:
+        distance_memmap(
+                signs, args.output, square=args.square, hand=args.hand,
+                dtype=np.dtype(args.dtype), tilesize=args.tilesize)
+    else:
+        np.save(args.output, distance_matrix(
+            signs, square=args.square, hand=args.hand,
+            dtype=np.dtype(args.dtype)))
+
+
+COMMANDS = {
+        'parse': parse,
+        'ascify': ascify,
+        'distance': distance,
+        'validate': validate,
+        }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+            prog='pysign', description=__doc__.split('\n')[1])
+    subparsers = parser.add_subparsers(dest='command')
+    for name, command in COMMANDS.items():
+        subparser = subparsers.add_parser(
+                name, help=command.__doc__.strip().split('\n')[0])
+        subparser.add_argument(
+                'input', nargs='?', default='-',
+                help='TSV, CSV, or text file, - for standard input')
+        subparser.add_argument(
+                '--column', help='column with the transcriptions')
+        subparser.add_argument(
+                '--delimiter', help='delimiter of the columns')
+        subparser.add_argument(
+                '--output', required=name == 'distance',
+                help='output file, standard output by default')
+        subparser.add_argument(
+                '--chunksize', type=int, default=1000,
+                help='number of transcriptions read and written at once')
+        subparser.add_argument(
+                '--quiet', action='store_true', help='do not show progress')
+        if name != 'ascify':
+            subparser.add_argument(
+                    '--workers', type=int, default=1,
+                    help='number of processes, 0 for one per CPU')
+        if name == 'distance':
+            subparser.add_argument('--hand', default='dominant')
+            subparser.add_argument(
+                    '--square', action='store_true',
+                    help='square instead of condensed matrix')
+            subparser.add_argument('--dtype', default='float32')
+            subparser.add_argument(
+                    '--tilesize', type=int,
+                    help='write the matrix tile by tile to a memory map, '
+                    'resuming an interrupted computation')
+    args = parser.parse_args(args)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    if getattr(args, 'workers', None) == 0:
+        args.workers = None
+    try:
+        return COMMANDS[args.command](args) or 0
+    except UsageError as error:
+        subparsers.choices[args.command].error(str(error))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Module for clustering signs on condensed distance matrices.
+"""
+import numpy as np
+
+METHODS = ('average', 'single')
+
+
+def _size(condensed):
+    n = int(round((1 + np.sqrt(1 + 8 * len(condensed))) / 2))
+    if n * (n - 1) // 2 != len(condensed):
+        raise ValueError('condensed matrix has an invalid length {0}'.format(
+            len(condensed)))
+    return n
+
+
+def _starts(n):
+    # the distance of k to j > k is at position starts[k] + j
+    k = np.arange(n, dtype=np.int64)
+    return k * n - k * (k + 1) // 2 - k - 1
+
+
+def _row(starts, i):
+    """
+    Return the positions of the distances of `i` to all items in a
+    condensed matrix (the position of `i` itself is 0).
+    """
+    positions = starts + i
+    positions[i:] = starts[i] + np.arange(i, len(starts))
+    positions[i] = 0
+    return positions
+
+
+def _find(parents, i):
+    while parents[i] != i:
+        parents[i] = parents[parents[i]]
+        i = parents[i]
+    return i
+
+
+def _label(n, merges):
+    """
+    Turn merges `(item, item, distance)` into a linkage matrix.
+    """
+    merges = sorted(merges, key=lambda merge: merge[2])
+    parents = list(range(n))
+    # number of the cluster of each root, and sizes by cluster number
+    clusters = list(range(n))
+    sizes = [1] * n
+    linkage = np.zeros((len(merges), 4), dtype=np.float64)
+    for step, (i, j, distance) in enumerate(merges):
+        i, j = _find(parents, i), _find(parents, j)
+        a, b = sorted([clusters[i], clusters[j]])
+        sizes.append(sizes[a] + sizes[b])
+        linkage[step] = [a, b, distance, sizes[-1]]
+        parents[j] = i
+        clusters[i] = n + step
+    return linkage
+
+
+def _average(condensed, n):
+    active = np.ones(n, dtype=bool)
+    sizes = np.ones(n, dtype=np.float64)
+    merges, chain = [], []
+    starts = _starts(n)
+    for step in range(n - 1):
+        if not chain:
+            chain = [int(np.flatnonzero(active)[0])]
+        while True:
+            x = chain[-1]
+            positions = _row(starts, x)
+            row = condensed[positions].astype(np.float64)
+            row[~active] = np.inf
+            row[x] = np.inf
+            y = int(np.argmin(row))
+            # ties are broken in favor of the previous item in the chain,
+            # so that the chain ends in a pair of reciprocal neighbors
+            if len(chain) > 1 and row[chain[-2]] <= row[y]:
+                y = chain[-2]
+                break
+            chain.append(y)
+        chain = chain[:-2]
+        distance = row[y]
+        merges.append((x, y, distance))
+        # the merged cluster takes the place of x
+        update = active.copy()
+        update[[x, y]] = False
+        targets = positions[update]
+        condensed[targets] = (
+                sizes[x] * row[update] +
+                sizes[y] * condensed[_row(starts, y)[update]]) / (
+                        sizes[x] + sizes[y])
+        sizes[x] += sizes[y]
+        active[y] = False
+    return merges
+
+
+def _single(condensed, n):
+    # minimum spanning tree with Prim's algorithm
+    distances = np.full(n, np.inf)
+    parents = np.zeros(n, dtype=np.int64)
+    done = np.zeros(n, dtype=bool)
+    merges = []
+    starts = _starts(n)
+    current = 0
+    for step in range(n - 1):
+        done[current] = True
+        row = condensed[_row(starts, current)]
+        closer = (row < distances) & ~done
+        distances[closer] = row[closer]
+        parents[closer] = current
+        distances[done] = np.inf
+        current = int(np.argmin(distances))
+        merges.append((int(parents[current]), current, distances[current]))
+    return merges
+
+
+def linkage(condensed, method='average', overwrite=False):
+    """
+    Cluster items hierarchically on a condensed distance matrix.
+
+    Notes
+    -----
+    `condensed` is the upper triangle of a distance matrix, row by row, as
+    returned by `pysign.distance.distance_matrix`. `method` is `"average"`
+    (UPGMA) or `"single"` linkage. Average linkage updates the distances in
+    a copy of the matrix, or in the matrix itself if `overwrite` is set, so
+    that the memory used is that of the condensed matrix and a few arrays
+    with one value per item. It uses the nearest-neighbor chain algorithm,
+    single linkage a minimum spanning tree, both in quadratic time.
+
+    Returns a linkage matrix like `scipy.cluster.hierarchy.linkage`, with
+    one row `(cluster, cluster, distance, size)` per merge, sorted by
+    distance. Items are the clusters `0` to `n - 1`, the cluster made in
+    row `i` is `n + i`.
+    """
+    if method not in METHODS:
+        raise ValueError('unknown method {0}'.format(method))
+    condensed = np.asarray(condensed)
+    n = _size(condensed)
+    if n < 2:
+        return np.zeros((0, 4), dtype=np.float64)
+    if method == 'single':
+        return _label(n, _single(condensed, n))
+    if not overwrite:
+        condensed = condensed.copy()
+    return _label(n, _average(condensed, n))
+
+
+def flat_clusters(linkage, threshold):
+    """
+    Return the flat clusters in which no two merged clusters are further
+    apart than `threshold`.
+
+    Notes
+    -----
+    Returns an array with the number of the cluster of each item, numbered
+    from 0 in the order of the first item in each cluster.
+    """
+    n = len(linkage) + 1
+    parents = list(range(n))
+    # an item in each cluster of the linkage
+    items = list(range(n))
+    for a, b, distance, size in linkage.tolist():
+        items.append(items[int(a)])
+        if distance <= threshold:
+            i, j = _find(parents, items[int(a)]), _find(parents, items[int(b)])
+            parents[max(i, j)] = min(i, j)
+    roots, labels = {}, np.zeros(n, dtype=np.int64)
+    for i in range(n):
+        labels[i] = roots.setdefault(_find(parents, i), len(roots))
+    return labels
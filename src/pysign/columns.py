@@ -0,0 +1,135 @@
+"""
+Module for storing the components of many signs as columns of integers.
+"""
+import json
+from array import array
+
+import numpy as np
+
+from pysign.parse import _freeze
+
+HANDS = ('dominant', 'nondominant')
+COMPONENTS = ('shape', 'orientation', 'location', 'contact', 'movement')
+
+# one column for the value and one for the change of each component of both
+# hands, followed by the repetition of the dominant hand and the symmetry
+COLUMNS = tuple(
+        '{0}_{1}{2}'.format(hand, component, suffix)
+        for hand in HANDS for component in COMPONENTS
+        for suffix in ['', '_change']) + ('repetition', 'symmetry')
+
+
+def _values(sign):
+    """
+    Return the values of the columns for a `Sign` or the output of
+    `parse_hamnosys`.
+    """
+    if isinstance(sign, dict):
+        hands = [sign[hand] for hand in HANDS]
+        symmetry = sign['symmetry']
+    else:
+        hands = [
+                {component: getattr(getattr(sign, hand), component) for
+                 component in COMPONENTS + ('repetition', )}
+                for hand in HANDS]
+        symmetry = sign.symmetry
+    values = []
+    for hand in hands:
+        for component in COMPONENTS:
+            value = list(hand.get(component) or []) + ['', '']
+            values += value[:2]
+    values += [(hands[0].get('repetition') or [''])[0], ''.join(symmetry)]
+    return values
+
+
+class Columns(object):
+    """
+    Components of many signs, encoded as integers.
+
+    Notes
+    -----
+    `codes` is an array with one row per sign and one column per name in
+    `COLUMNS`. All columns share the same `vocabulary`, a list of the values
+    of the components, in which the empty value has the code 0. Values which
+    are not strings, like the decomposition of complex movements, are lists,
+    like in the output of `parse_hamnosys`.
+    """
+
+    def __init__(self, codes=None, vocabulary=None):
+        self.vocabulary = list(vocabulary or [''])
+        self._codes = {
+                _freeze(value): code for code, value in
+                enumerate(self.vocabulary)}
+        self.codes = codes if codes is not None else np.zeros(
+                (0, len(COLUMNS)), dtype=np.uint32)
+
+    @classmethod
+    def from_signs(cls, signs, vocabulary=None):
+        """
+        Encode `Sign` objects or the output of `parse_hamnosys`.
+
+        Notes
+        -----
+        Passing the `vocabulary` of other columns keeps the codes of both
+        compatible, new values are added to the end of the vocabulary. The
+        codes are appended to an array of unsigned integers which grows in
+        place, so that the signs are never held as rows of Python objects.
+        """
+        columns = cls(vocabulary=vocabulary)
+        codes, index = array('I'), columns._codes
+        for sign in signs:
+            for value in _values(sign):
+                key = _freeze(value) if value else ''
+                if key not in index:
+                    index[key] = len(columns.vocabulary)
+                    columns.vocabulary.append(value)
+                codes.append(index[key])
+        columns.codes = np.frombuffer(codes, dtype=np.uint32).reshape(
+                -1, len(COLUMNS))
+        return columns
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, name):
+        return self.codes[:, COLUMNS.index(name)]
+
+    def decode(self, row):
+        """
+        Return the values of the components of a sign as a dictionary.
+        """
+        return {
+                name: self.vocabulary[code] for name, code in
+                zip(COLUMNS, self.codes[row].tolist())}
+
+    def save(self, path):
+        """
+        Write the columns to a NumPy `.npz` file.
+
+        Notes
+        -----
+        The vocabulary is stored as an array of JSON strings, so that the file
+        can be read without pickling.
+        """
+        np.savez(
+                path,
+                columns=np.array(COLUMNS, dtype=str),
+                codes=self.codes,
+                vocabulary=np.array([
+                    json.dumps(value, ensure_ascii=False) for value in
+                    self.vocabulary], dtype=str))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read columns written with `save`.
+        """
+        with np.load(path) as data:
+            if tuple(data['columns'].tolist()) != COLUMNS:
+                raise ValueError('the columns in {0} differ from {1}'.format(
+                    path, COLUMNS))
+            return cls(
+                    codes=data['codes'],
+                    vocabulary=[
+                        json.loads(value) for value in
+                        data['vocabulary'].tolist()])
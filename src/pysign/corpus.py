@@ -0,0 +1,66 @@
+"""
+Module for reading sign corpora from delimited text files.
+"""
+from collections import deque
+from pathlib import Path
+
+from csvw.dsv import UnicodeDictReader
+
+from pysign.parse import Sign
+
+
+def read_rows(path, column, delimiter=None):
+    """
+    Iterate over the rows of a corpus and their transcriptions.
+
+    Notes
+    -----
+    `path` is a TSV or CSV file with a header, or an open file, and `column`
+    the name of the column with the HamNoSys transcriptions. The delimiter is
+    a tab for files with the extension `.tsv` and a comma otherwise, unless
+    it is passed. Yields pairs `(row, text)`, and raises a `KeyError` if a
+    row has no `column`.
+    """
+    if delimiter is None:
+        name = str(getattr(path, 'name', path))
+        delimiter = '\t' if Path(name).suffix.lower() == '.tsv' else ','
+    with UnicodeDictReader(path, delimiter=delimiter) as reader:
+        for row in reader:
+            if column not in row:
+                raise KeyError('no column {0} in {1}'.format(
+                    column, getattr(path, 'name', path)))
+            yield row, row[column]
+
+
+def read_signs(path, column, delimiter=None, skip_errors=False, failed=None,
+               workers=1, chunksize=100):
+    """
+    Iterate over the rows of a corpus and the signs parsed from them.
+
+    Notes
+    -----
+    `path` and `column` are passed to `read_rows`, which also guesses the
+    delimiter if it is not passed. Rows are read and parsed lazily, so the
+    function yields pairs `(row, sign)` with bounded memory, also when
+    parsing in `workers` processes (see `pysign.parse.parse_many`).
+
+    Rows that cannot be parsed raise the parser error, unless `skip_errors`
+    is set, or `failed` is a list, to which the pairs `(row, error)` are
+    appended instead.
+    """
+    rows = deque()
+
+    def texts():
+        for row, text in read_rows(path, column, delimiter):
+            rows.append(row)
+            yield text
+
+    for chunk in Sign.from_texts(texts(), workers=workers, chunksize=chunksize):
+        for text, sign, error in chunk:
+            row = rows.popleft()
+            if error is None:
+                yield row, sign
+            elif failed is not None:
+                failed.append((row, error))
+            elif not skip_errors:
+                raise error
@@ -1,11 +1,102 @@
+#
+
+import importlib
 from pathlib import Path
-from csvw.dsv import UnicodeDictReader
 
 def data_path(*path):
     return Path(__file__).parent.joinpath('data', *path)
 
-with UnicodeDictReader(data_path('hamnosys.tsv'), delimiter="\t") as reader:
-    HAMNOSYS = {}
-    for row in reader:
-        HAMNOSYS[eval(r'"\u'+row['Unicode']+'"')] = row
 
+def read_hamnosys():
+    from csvw.dsv import UnicodeDictReader
+    with UnicodeDictReader(data_path('hamnosys.tsv'), delimiter="\t") as reader:
+        return {chr(int(row['Unicode'], 16)): dict(row) for row in reader}
+
+
+def read_hamsymbols():
+    from csvw.dsv import UnicodeDictReader
+    with UnicodeDictReader(data_path('hamsymbols.tsv'), delimiter="\t") as reader:
+        return {chr(int(row['UNICODE'], 16)): dict(row) for row in reader}
+
+
+# modules with the precompiled tables, generated by `write_tables`
+TABLES = {
+        '_hamnosys': read_hamnosys,
+        '_hamsymbols': read_hamsymbols,
+        }
+
+
+def write_tables():
+    """
+    Compile the symbol tables in the data folder to Python modules.
+
+    Notes
+    -----
+    The modules are loaded instead of the TSV files, which is much faster.
+    Run `python -m pysign.data` after modifying the TSV files.
+    """
+    for module, reader in TABLES.items():
+        with open(Path(__file__).parent.joinpath(module + '.py'), 'w') as f:
+            f.write('# generated by pysign.data.write_tables, do not edit\n')
+            f.write('TABLE = {\n')
+            for char, row in reader().items():
+                f.write('    {0!a}: {1!a},\n'.format(char, row))
+            f.write('    }\n')
+
+
+class LazyTable(object):
+    """
+    Symbol table which is loaded from its precompiled module on first access.
+
+    Notes
+    -----
+    Tables derived from other tables are built by the function `load`
+    instead, when they are first accessed.
+    """
+
+    def __init__(self, module=None, load=None):
+        self.module = module
+        self.load = load
+        self._table = None
+
+    @property
+    def table(self):
+        if self._table is None:
+            if self.load is not None:
+                self._table = self.load()
+            else:
+                self._table = importlib.import_module(
+                        'pysign.' + self.module).TABLE
+        return self._table
+
+    def __getitem__(self, char):
+        return self.table[char]
+
+    def __contains__(self, char):
+        return char in self.table
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+    def get(self, char, default=None):
+        return self.table.get(char, default)
+
+    def items(self):
+        return self.table.items()
+
+    def keys(self):
+        return self.table.keys()
+
+    def values(self):
+        return self.table.values()
+
+
+HAMNOSYS = LazyTable('_hamnosys')
+HAMSYMBOLS = LazyTable('_hamsymbols')
+
+
+if __name__ == '__main__':
+    write_tables()
@@ -0,0 +1,458 @@
+"""
+Module for computing distances between collections of hands and signs.
+"""
+import hashlib
+import json
+import mmap
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from pysign.data import HAMSYMBOLS
+from pysign.parse import WEIGHTS, _freeze, hand_symbols
+
+# distances of different symbols which share the features up to a level
+LEVELS = {'DOMAIN': 0.75, 'TYPE': 0.5, 'SUBDOMAIN': 0.25}
+
+
+def _hands(signs, hand):
+    return [getattr(sign, hand, sign) for sign in signs]
+
+
+def _encode(hands, attributes):
+    codes = np.zeros((len(hands), len(attributes)), dtype=np.int32)
+    vocabularies = []
+    for j, attribute in enumerate(attributes):
+        vocabulary = {}
+        for i, hand in enumerate(hands):
+            value = getattr(hand, attribute)
+            key = _freeze(value)
+            if key not in vocabulary:
+                vocabulary[key] = (len(vocabulary), value)
+            codes[i, j] = vocabulary[key][0]
+        vocabularies.append([value for _, value in vocabulary.values()])
+    return codes, vocabularies
+
+
+def encode(hands, attributes):
+    """
+    Encode the attributes of hands as integers.
+
+    Notes
+    -----
+    Returns an array with one row per hand and one column per attribute, in
+    which identical values of an attribute share the same code.
+    """
+    return _encode(hands, attributes)[0]
+
+
+class SubstitutionMatrix(object):
+    """
+    Graded distances between HamNoSys symbols and the values built from them.
+
+    Notes
+    -----
+    Symbols are compared by their features in `data/hamsymbols.tsv`:
+    different symbols sharing the domain, the domain and the type, or the
+    domain, the type, and the subdomain, have the distances in `levels`,
+    all others a distance of 1. Features with alternatives, like
+    `handshape|location`, are shared if one of the alternatives is.
+
+    Values of hand attributes are compared item by item (the value and the
+    change of a component, for example), and the items symbol by symbol,
+    with a distance of 1 for each symbol missing in one of them. The
+    distance is the mean over all positions, so that it is 0 for identical
+    values and 1 for values without similar symbols. Labels like
+    `"simultaneous"` count as symbols that are only similar to themselves.
+
+    Call the matrix with two values to compare them, for example as the
+    `compare` function of `Hand.distance`, where the results for the last
+    `cache` pairs of values are kept, or pass it to `distance_matrix`, which
+    looks up the distances of all pairs of values in tables.
+    """
+
+    def __init__(self, levels=None, cache=65536):
+        self.levels = levels or LEVELS
+        self.symbols = sorted(HAMSYMBOLS)
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        features = [
+                [set(filter(None, HAMSYMBOLS[symbol][name].split('|')))
+                 for name in ['DOMAIN', 'TYPE', 'SUBDOMAIN']]
+                for symbol in self.symbols]
+        self.matrix = np.ones(
+                (len(self.symbols), len(self.symbols)), dtype=np.float32)
+        for i, features1 in enumerate(features):
+            for j, features2 in enumerate(features):
+                for level, name in enumerate(['DOMAIN', 'TYPE', 'SUBDOMAIN']):
+                    if not features1[level] & features2[level]:
+                        break
+                    self.matrix[i, j] = self.levels[name]
+        np.fill_diagonal(self.matrix, 0)
+        self._distance = lru_cache(maxsize=cache)(self._distance)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_distance'] = self._distance.cache_info().maxsize
+        return state
+
+    def __setstate__(self, state):
+        cache = state.pop('_distance')
+        self.__dict__.update(state)
+        self._distance = lru_cache(maxsize=cache)(self._distance)
+
+    def symbol(self, symbol1, symbol2):
+        """
+        Return the distance between two symbols.
+        """
+        if symbol1 == symbol2:
+            return 0.0
+        if symbol1 in self.index and symbol2 in self.index:
+            return float(self.matrix[
+                self.index[symbol1], self.index[symbol2]])
+        return 1.0
+
+    @staticmethod
+    def _items(value):
+        if isinstance(value, (list, tuple)):
+            return [list(hand_symbols(item)) for item in value]
+        return [list(hand_symbols(value))]
+
+    def _distance(self, value1, value2):
+        items1, items2 = self._items(value1), self._items(value2)
+        total = count = 0
+        for i in range(max(len(items1), len(items2))):
+            item1 = items1[i] if i < len(items1) else []
+            item2 = items2[i] if i < len(items2) else []
+            for j in range(max(len(item1), len(item2))):
+                if j < len(item1) and j < len(item2):
+                    total += self.symbol(item1[j], item2[j])
+                else:
+                    total += 1
+                count += 1
+        return total / count if count else 0.0
+
+    def __call__(self, value1, value2):
+        # values are frozen to be hashable
+        return self._distance(_freeze(value1), _freeze(value2))
+
+    def table(self, values, blocksize=None):
+        """
+        Return the distances between all pairs of values as a square array.
+
+        Notes
+        -----
+        The values are converted to arrays of symbols, padded to the same
+        length, so that the distances are computed with array operations.
+        """
+        items = [self._items(value) for value in values]
+        widths = [0] * max([len(value) for value in items] or [0])
+        for value in items:
+            for i, item in enumerate(value):
+                widths[i] = max(widths[i], len(item))
+        # further symbols and labels follow the known symbols, then padding
+        index = dict(self.index)
+        for value in items:
+            for item in value:
+                for symbol in item:
+                    index.setdefault(symbol, len(index))
+        pad = len(index)
+        matrix = np.ones((pad + 1, pad + 1), dtype=np.float32)
+        matrix[:len(self.symbols), :len(self.symbols)] = self.matrix
+        np.fill_diagonal(matrix, 0)
+        tokens = np.full((len(values), sum(widths)), pad, dtype=np.int32)
+        for i, value in enumerate(items):
+            start = 0
+            for item, width in zip(value, widths):
+                tokens[i, start:start + len(item)] = [
+                        index[symbol] for symbol in item]
+                start += width
+
+        n, width = tokens.shape
+        table = np.zeros((n, n), dtype=np.float32)
+        blocksize = blocksize or max(1, 2 ** 22 // max(n * width, 1))
+        filled = tokens != pad
+        for start in range(0, n, blocksize):
+            rows = slice(start, min(start + blocksize, n))
+            total = matrix[
+                    tokens[rows, np.newaxis, :],
+                    tokens[np.newaxis, :, :]].sum(axis=2)
+            count = (
+                    filled[rows, np.newaxis, :] |
+                    filled[np.newaxis, :, :]).sum(axis=2)
+            table[rows] = total / np.maximum(count, 1)
+        return table
+
+
+@lru_cache(maxsize=None)
+def substitution_matrix():
+    """
+    Return the `SubstitutionMatrix` with the default levels.
+    """
+    return SubstitutionMatrix()
+
+
+def _block(codes, weights, rows, columns, tables=None):
+    scores = np.zeros((len(rows), len(columns)), dtype=np.float64)
+    for j, weight in enumerate(weights):
+        if tables is None:
+            scores += weight * (
+                    codes[rows, j][:, np.newaxis] !=
+                    codes[columns, j][np.newaxis, :])
+        else:
+            scores += weight * tables[j][
+                    codes[rows, j][:, np.newaxis],
+                    codes[columns, j][np.newaxis, :]]
+    return scores / sum(weights)
+
+
+def _prepare(signs, weights, hand, substitution):
+    weights = weights or WEIGHTS
+    attributes = sorted(weights)
+    weights = [weights[attribute] for attribute in attributes]
+    codes, vocabularies = _encode(_hands(signs, hand), attributes)
+    if substitution is True:
+        substitution = substitution_matrix()
+    tables = [
+            substitution.table(vocabulary) for vocabulary in vocabularies
+            ] if substitution else None
+    return codes, weights, tables
+
+
+def _fill(matrix, codes, weights, tables, start, stop, blocksize):
+    """
+    Fill the rows from `start` to `stop` of a square or condensed matrix.
+    """
+    n = len(codes)
+    for first in range(start, stop, blocksize):
+        rows = np.arange(first, min(first + blocksize, stop))
+        if matrix.ndim == 2:
+            matrix[rows] = _block(codes, weights, rows, np.arange(n), tables)
+            continue
+        block = _block(
+                codes, weights, rows, np.arange(first + 1, n), tables)
+        for offset, i in enumerate(rows):
+            position = i * n - i * (i + 1) // 2
+            matrix[position:position + n - i - 1] = block[offset, i - first:]
+
+
+# arrays in shared memory, attached in each worker process
+_shared = {}
+
+
+def _attach(specs, weights):
+    from multiprocessing import shared_memory
+    _shared.clear()
+    for key, (name, shape, dtype) in specs.items():
+        # the memory is removed by the parent process, whose resource
+        # tracker the workers share, so it is not unregistered here
+        memory = shared_memory.SharedMemory(name=name)
+        _shared[key] = (
+                memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf))
+    _shared['weights'] = weights
+
+
+def _fill_shared(start, stop, blocksize):
+    tables = None
+    if 'table0' in _shared:
+        tables = [
+                _shared['table{0}'.format(j)][1]
+                for j in range(len(_shared['weights']))]
+    _fill(
+            _shared['matrix'][1], _shared['codes'][1], _shared['weights'],
+            tables, start, stop, blocksize)
+    return stop - start
+
+
+def _move(array, mapping, chunksize=2 ** 24):
+    """
+    Copy an array out of the shared memory `mapping`, removing the pages
+    which are copied if the system supports it, so that the memory used
+    does not grow by the size of the array.
+    """
+    result = np.empty_like(array)
+    source, target = array.reshape(-1), result.reshape(-1)
+    step = chunksize // array.itemsize
+    for start in range(0, len(source), step):
+        target[start:start + step] = source[start:start + step]
+        if hasattr(mmap, 'MADV_REMOVE'):
+            mapping.madvise(
+                    mmap.MADV_REMOVE, start * array.itemsize, chunksize)
+    return result
+
+
+def _parallel(shape, dtype, codes, weights, tables, blocksize, workers):
+    """
+    Compute a matrix in worker processes sharing the codes, the tables, and
+    the matrix itself.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    memories, specs = {}, {}
+
+    def share(key, shape, dtype):
+        memories[key] = shared_memory.SharedMemory(
+                create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        specs[key] = (memories[key].name, shape, dtype.str)
+        return np.ndarray(shape, dtype, buffer=memories[key].buf)
+
+    matrix = None
+    try:
+        share('codes', codes.shape, codes.dtype)[...] = codes
+        for j, table in enumerate(tables or []):
+            share('table{0}'.format(j), table.shape, table.dtype)[...] = table
+        # new shared memory is filled with zeros
+        matrix = share('matrix', shape, dtype)
+
+        # row ranges with about the same number of distances, several per
+        # worker, so that workers which finish early take over more rows
+        n = len(codes)
+        if len(shape) == 2:
+            bounds = np.linspace(0, n, 4 * workers + 1)
+        else:
+            rows = np.arange(n + 1)
+            bounds = np.searchsorted(
+                    rows * n - rows * (rows + 1) // 2,
+                    np.linspace(0, shape[0], 4 * workers + 1))
+        bounds = sorted(set(int(bound) for bound in bounds) | {0, n})
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach,
+                initargs=(specs, weights)) as executor:
+            list(executor.map(
+                _fill_shared, bounds[:-1], bounds[1:],
+                [blocksize] * (len(bounds) - 1)))
+        result = _move(matrix, memories['matrix'].buf.obj)
+    finally:
+        # the memory cannot be closed while arrays use it
+        matrix = None
+        for memory in memories.values():
+            memory.close()
+            memory.unlink()
+    return result
+
+
+def distance_matrix(signs, weights=None, square=False, hand='dominant',
+                    dtype=np.float32, blocksize=None, substitution=None,
+                    workers=1):
+    """
+    Compute the distances between all pairs of hands or signs.
+
+    Notes
+    -----
+    `signs` are `Hand` objects, or `Sign` objects from which the hand named
+    by `hand` is taken. Distances are computed like in `Hand.distance` with
+    the default identity comparison, using `weights` or the default weights.
+    The result is a condensed matrix (the upper triangle, row by row, like
+    in `scipy.spatial.distance.pdist`) or, if `square` is set, a square
+    matrix. `blocksize` is the number of rows computed at once.
+
+    With a `SubstitutionMatrix` (or `True` for the default one) passed as
+    `substitution`, values are compared with graded distances instead of
+    the identity, looked up in one table per attribute with the distances
+    of all pairs of its values.
+
+    With more than one of `workers` (or `None` for one per CPU), the rows
+    are computed in parallel by processes which share the encoded signs and
+    the matrix in shared memory, so that only the numbers of the rows are
+    sent to them. The matrix is copied out of shared memory once, when it
+    is complete.
+    """
+    codes, weights, tables = _prepare(signs, weights, hand, substitution)
+    n = len(codes)
+    blocksize = blocksize or max(1, 2 ** 22 // max(n, 1))
+    shape = (n, n) if square else (n * (n - 1) // 2, )
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and n > 1:
+        return _parallel(
+                shape, np.dtype(dtype), codes, weights, tables, blocksize,
+                workers)
+    matrix = np.zeros(shape, dtype=dtype)
+    _fill(matrix, codes, weights, tables, 0, n, blocksize)
+    return matrix
+
+
+def distance_memmap(signs, path, weights=None, square=False, hand='dominant',
+                    dtype=np.float32, tilesize=2048, substitution=None,
+                    max_tiles=None):
+    """
+    Compute the distances between all pairs of hands or signs into a file.
+
+    Notes
+    -----
+    The matrix is computed like with `distance_matrix`, but tile by tile,
+    with `tilesize` rows and columns, and written to a NumPy `.npy` file at
+    `path` through a memory map, so that it does not have to fit into
+    memory. `dtype` is `numpy.float32` or, to halve the size of the file,
+    `numpy.float16`.
+
+    The tiles which are done are recorded in the file `path + ".tiles"`, so
+    that an interrupted computation continues with the missing tiles when
+    the function is called again with the same signs and arguments. The
+    record starts with the arguments and a hash of the encoded signs, and a
+    `ValueError` is raised if they differ from those of the call.
+    `max_tiles` limits the number of tiles computed in one call. Returns the
+    matrix as a read-only memory map, which is complete if no tiles are
+    missing.
+    """
+    if substitution is True:
+        substitution = substitution_matrix()
+    arguments = {
+            'weights': dict(weights or WEIGHTS), 'hand': hand,
+            'substitution': substitution.levels if substitution else None}
+    codes, weights, tables = _prepare(signs, weights, hand, substitution)
+    n = len(codes)
+    shape = (n, n) if square else (n * (n - 1) // 2, )
+    # the tables depend on the values behind the codes
+    digest = hashlib.sha256(np.ascontiguousarray(codes))
+    for table in tables or []:
+        digest.update(np.ascontiguousarray(table))
+    header = json.dumps(dict(
+        arguments, size=n, square=square, dtype=np.dtype(dtype).str,
+        tilesize=tilesize, codes=digest.hexdigest()), sort_keys=True)
+    record = str(path) + '.tiles'
+    done = set()
+    if os.path.exists(record) and os.path.exists(path):
+        with open(record) as f:
+            if f.readline().strip() != header:
+                raise ValueError(
+                    '{0} was computed with other arguments'.format(path))
+            done = set(tuple(map(int, line.split())) for line in f)
+        matrix = np.lib.format.open_memmap(path, mode='r+')
+    else:
+        matrix = np.lib.format.open_memmap(
+                path, mode='w+', dtype=dtype, shape=shape)
+        with open(record, 'w') as f:
+            f.write(header + '\n')
+
+    computed = 0
+    with open(record, 'a') as f:
+        for start in range(0, n, tilesize):
+            end = min(start + tilesize, n)
+            for column in range(start, n, tilesize):
+                if (start, column) in done:
+                    continue
+                if max_tiles is not None and computed >= max_tiles:
+                    break
+                stop = min(column + tilesize, n)
+                block = _block(
+                        codes, weights, np.arange(start, end),
+                        np.arange(column, stop), tables)
+                if square:
+                    matrix[start:end, column:stop] = block
+                    matrix[column:stop, start:end] = block.T
+                else:
+                    # only the part of the tile right of the diagonal
+                    for i in range(start, end):
+                        first = max(column, i + 1)
+                        if first >= stop:
+                            continue
+                        position = i * n - i * (i + 1) // 2 + first - i - 1
+                        matrix[position:position + stop - first] = block[
+                                i - start, first - column:]
+                matrix.flush()
+                f.write('{0} {1}\n'.format(start, column))
+                f.flush()
+                os.fsync(f.fileno())
+                computed += 1
+    del matrix
+    return np.load(path, mmap_mode='r')
@@ -0,0 +1,296 @@
+"""
+Module for indexing collections of signs for fast lookup.
+"""
+import heapq
+import random
+from array import array
+from functools import partial, reduce
+from itertools import count
+
+import numpy as np
+
+from pysign.parse import hand_symbols
+
+# tolerance for rounding errors when pruning with the triangle inequality
+EPSILON = 1e-9
+
+# posting lists with more than one in this many signs are combined with
+# masks over all signs instead of sorted arrays
+DENSE = 16
+
+
+class VPTree(object):
+    """
+    Vantage-point tree for finding similar signs.
+
+    Notes
+    -----
+    The tree is built over `signs` and compares them with `distance`, by
+    default the weighted `Hand.distance` of the hands named by `hand` (for
+    `Hand` objects, the objects themselves are compared). The distance must
+    be a metric for the queries to be exact, which is the case for
+    `Hand.distance` with the default comparison. The number of distances
+    computed by all queries so far is counted in `evaluations`.
+    """
+
+    def __init__(self, signs, distance=None, hand='dominant', weights=None,
+                 seed=1):
+        self.signs = list(signs)
+        if distance is None:
+            def distance(sign1, sign2):
+                return getattr(sign1, hand, sign1).distance(
+                        getattr(sign2, hand, sign2), weights=weights)
+        self.distance = distance
+        self.evaluations = 0
+        self._random = random.Random(seed)
+        self.root = self._build(list(range(len(self.signs))))
+
+    def _build(self, indices):
+        # nodes are lists [vantage point, median, inside, outside]
+        if not indices:
+            return None
+        root = [None, 0, None, None]
+        todo = [(root, indices)]
+        while todo:
+            node, indices = todo.pop()
+            vantage = indices.pop(self._random.randrange(len(indices)))
+            node[0] = vantage
+            if not indices:
+                continue
+            distances = sorted(
+                    (self.distance(self.signs[vantage], self.signs[i]), i)
+                    for i in indices)
+            half = len(distances) // 2
+            node[1] = distances[half][0]
+            for position, part in [(2, distances[:half]), (3, distances[half:])]:
+                if part:
+                    node[position] = [None, 0, None, None]
+                    todo.append((node[position], [i for _, i in part]))
+        return root
+
+    def _distance(self, sign, index):
+        self.evaluations += 1
+        return self.distance(sign, self.signs[index])
+
+    def within(self, sign, radius):
+        """
+        Return all signs with a distance of at most `radius` to `sign`.
+
+        Notes
+        -----
+        Returns pairs `(sign, distance)`, sorted by distance.
+        """
+        found = []
+        todo = [self.root] if self.root else []
+        while todo:
+            vantage, median, inside, outside = todo.pop()
+            d = self._distance(sign, vantage)
+            if d <= radius:
+                found.append((d, vantage))
+            if inside and d - radius <= median + EPSILON:
+                todo.append(inside)
+            if outside and d + radius >= median - EPSILON:
+                todo.append(outside)
+        return [(self.signs[i], d) for d, i in sorted(found)]
+
+    def k_nearest(self, sign, k=1):
+        """
+        Return the `k` signs closest to `sign`.
+
+        Notes
+        -----
+        Returns pairs `(sign, distance)`, sorted by distance.
+        """
+        # max-heap of the best candidates as (-distance, -index)
+        best = []
+        # min-heap of the nodes to visit with a lower bound of their distance
+        counter = count()
+        todo = [(0, next(counter), self.root)] if self.root else []
+        while todo:
+            bound, _, node = heapq.heappop(todo)
+            if len(best) == k and bound > -best[0][0] + EPSILON:
+                break
+            vantage, median, inside, outside = node
+            d = self._distance(sign, vantage)
+            if len(best) < k:
+                heapq.heappush(best, (-d, -vantage))
+            elif d < -best[0][0]:
+                heapq.heapreplace(best, (-d, -vantage))
+            if inside:
+                heapq.heappush(
+                        todo, (max(bound, d - median), next(counter), inside))
+            if outside:
+                heapq.heappush(
+                        todo, (max(bound, median - d), next(counter), outside))
+        return [(self.signs[-i], -d) for d, i in sorted(best, reverse=True)]
+
+    def __len__(self):
+        return len(self.signs)
+
+
+def _contains(postings, values, size):
+    """
+    Return a mask of the values which are in a sorted array of sign numbers.
+
+    Notes
+    -----
+    Short arrays of values are searched in the sorted array. Long ones are
+    looked up in a mask over all `size` signs, which is faster once the
+    values are dense.
+    """
+    if len(values) * DENSE > size:
+        mask = np.zeros(size, dtype=bool)
+        mask[postings] = True
+        return mask[values]
+    positions = np.searchsorted(postings, values)
+    found = positions < len(postings)
+    found[found] = postings[positions[found]] == values[found]
+    return found
+
+
+def _union(postings1, postings2, size):
+    """
+    Return the sorted union of two sorted arrays of sign numbers.
+    """
+    if (len(postings1) + len(postings2)) * DENSE > size:
+        mask = np.zeros(size, dtype=bool)
+        mask[postings1] = True
+        mask[postings2] = True
+        return np.flatnonzero(mask).astype(np.uint32)
+    # a stable sort merges the two sorted runs in linear time
+    postings = np.concatenate([postings1, postings2])
+    postings.sort(kind='stable')
+    unique = np.ones(len(postings), dtype=bool)
+    unique[1:] = postings[1:] != postings[:-1]
+    return postings[unique]
+
+
+class FeatureIndex(object):
+    """
+    Inverted index from the symbols of hands to the signs using them.
+
+    Notes
+    -----
+    Signs are numbered in the order in which they are added. Each key
+    `(hand, attribute, symbol)`, like `("dominant", "shape", "\\ue002")`,
+    points to a sorted posting list with the numbers of the signs in which
+    the hand has the symbol in the attribute. Queries are keys, or nested
+    tuples combining queries with `"and"`, `"or"`, and `"not"`, like
+    `("and", key1, ("or", key2, key3), ("not", key4))`.
+    """
+    hands = ('dominant', 'nondominant')
+    attributes = (
+            'shape', 'orientation', 'location', 'contact', 'movement',
+            'repetition')
+
+    def __init__(self, signs=None):
+        self.postings = {}
+        self.size = 0
+        for sign in signs or []:
+            self.add(sign)
+
+    def add(self, sign):
+        """
+        Add a sign to the index and return its number.
+        """
+        idx = self.size
+        for hand in self.hands:
+            for attribute in self.attributes:
+                value = getattr(getattr(sign, hand), attribute)
+                for symbol in set(hand_symbols(value)):
+                    key = (hand, attribute, symbol)
+                    if key not in self.postings:
+                        self.postings[key] = array('I')
+                    self.postings[key].append(idx)
+        self.size += 1
+        return idx
+
+    def __len__(self):
+        return self.size
+
+    def get(self, hand, attribute, symbol):
+        """
+        Return the numbers of the signs with a symbol as an array.
+
+        Notes
+        -----
+        The array is a copy, so that the index can still grow while it is
+        held.
+        """
+        return self._postings((hand, attribute, symbol)).copy()
+
+    def _postings(self, key):
+        # a view on the posting list, which must not outlive the query
+        if key not in self.postings:
+            return np.zeros(0, dtype=np.uint32)
+        return np.frombuffer(self.postings[key], dtype=np.uint32)
+
+    def _evaluate(self, query):
+        if query[0] == 'and':
+            # the shortest list is looked up in the others, and negated
+            # queries are subtracted from it
+            results = sorted(
+                    (self._evaluate(q) for q in query[1:] if q[0] != 'not'),
+                    key=len)
+            if results:
+                result = results[0]
+            else:
+                result = np.arange(self.size, dtype=np.uint32)
+            for other in results[1:]:
+                result = result[_contains(other, result, self.size)]
+            for q in query[1:]:
+                if q[0] == 'not':
+                    result = result[~_contains(
+                            self._evaluate(q[1]), result, self.size)]
+            return result
+        if query[0] == 'or':
+            return reduce(
+                    partial(_union, size=self.size),
+                    map(self._evaluate, query[1:]))
+        if query[0] == 'not':
+            mask = np.ones(self.size, dtype=bool)
+            mask[self._evaluate(query[1])] = False
+            return np.flatnonzero(mask).astype(np.uint32)
+        return self._postings(query)
+
+    def query(self, query):
+        """
+        Return the numbers of the signs matching a query as an array.
+
+        Notes
+        -----
+        Queries are evaluated on the sorted posting lists. For `"and"`, the
+        shortest list is searched in the others, so that selective queries
+        take time in the length of their lists, not in the size of the
+        index. Dense lists are combined with masks over all signs, and so is
+        a `"not"` which is not part of an `"and"`.
+        """
+        return self._evaluate(query).astype(np.uint32)
+
+    def save(self, path):
+        """
+        Write the index to a NumPy `.npz` file.
+        """
+        keys = list(self.postings)
+        lengths = [len(self.postings[key]) for key in keys]
+        np.savez(
+                path,
+                size=self.size,
+                keys=np.array(keys, dtype=str).reshape(len(keys), 3),
+                offsets=np.cumsum([0] + lengths),
+                postings=np.concatenate(
+                    [self._postings(key) for key in keys] or [[]]).astype(np.uint32))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read an index written with `save`.
+        """
+        index = cls()
+        with np.load(path) as data:
+            index.size = int(data['size'])
+            offsets, postings = data['offsets'], data['postings']
+            for i, key in enumerate(data['keys'].tolist()):
+                index.postings[tuple(key)] = array(
+                        'I', postings[offsets[i]:offsets[i + 1]].tobytes())
+        return index
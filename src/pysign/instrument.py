@@ -0,0 +1,208 @@
+"""
+Module for instrumenting the parser, to see which of its branches fire.
+"""
+import ast
+import inspect
+import json
+import sys
+import textwrap
+import time
+from collections import Counter
+
+from pysign import parse
+from pysign.parse import parse_hamnosys
+
+# names of the character classes in pysign.parse
+CLASS_NAMES = {
+        getattr(parse, name): name for name in [
+            'OTHER', 'SPACE', 'SYMMETRY', 'HANDSHAPE', 'HANDSHAPE_DIACRITIC',
+            'ORIENTATION', 'ORIENTATION_DIACRITIC', 'LOCATION',
+            'LOCATION_DIACRITIC', 'CONTACT', 'BRUSH', 'MOVEMENT',
+            'MOVEMENT_DIACRITIC', 'REPETITION', 'AMBIGUOUS',
+            'AMBIGUOUS_LOCATION', 'OPEN_BRACKET', 'CLOSE_BRACKET', 'OPEN_PAR',
+            'CLOSE_PAR', 'OPEN_FUSE', 'CLOSE_FUSE', 'DOMINANCE']}
+
+# phases of the parser, named by the variables tested in the post-processing
+PHASES = {
+        'h': 'handshape',
+        'o': 'orientation',
+        'l': 'location',
+        'contact': 'contact',
+        'm': 'movement',
+        'repeat': 'repetition'
+        }
+
+
+def parser_lines(function=parse_hamnosys):
+    """
+    Analyze the source of the parser.
+
+    Notes
+    -----
+    Returns a dictionary from the line numbers of the first statements of
+    all branches to labels of the branches, a dictionary from line numbers to
+    the phases of the parser, and the line number of the first statement in
+    the scanning loop. The post-processing after the loop is split into
+    phases by the variables tested in its top-level `if` statements.
+
+    The phases are assigned to the lines of the top-level statements of the
+    parser, so that they match the line events of `sys.settrace`, which
+    CPython reports for the line of each statement which is executed. Other
+    implementations of Python may report lines differently, in which case
+    the times of the phases are not reliable.
+    """
+    lines, first = inspect.getsourcelines(function)
+    tree = ast.parse(textwrap.dedent(''.join(lines)))
+    offset = first - 1
+
+    def label(lineno):
+        return '{0}: {1}'.format(
+                lineno + offset, lines[lineno - 1].strip().split(' #')[0])
+
+    branches = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.If):
+            branches[node.body[0].lineno + offset] = label(node.lineno)
+            orelse = node.orelse
+            if orelse and not (
+                    isinstance(orelse[0], ast.If) and
+                    lines[orelse[0].lineno - 1].strip().startswith('elif')):
+                lineno = orelse[0].lineno - 1
+                while lines[lineno - 1].strip() != 'else:':
+                    lineno -= 1
+                branches[orelse[0].lineno + offset] = label(lineno)
+
+    phases, loop = {}, None
+    body = tree.body[0].body
+    for node, following in zip(body, body[1:] + [None]):
+        phase = 'other'
+        if isinstance(node, ast.For):
+            phase, loop = 'scan', node.body[0].lineno + offset
+        elif isinstance(node, ast.If) and loop:
+            # the flags come first in tests like `if m and repeat != []`,
+            # so the last name guarded by them names the phase
+            names = [
+                    name.id for name in ast.walk(node.test)
+                    if isinstance(name, ast.Name) and name.id in PHASES]
+            if names:
+                phase = PHASES[names[-1]]
+        # end_lineno is only set from Python 3.8 on, before that statements
+        # are taken to end where the next one starts
+        end = getattr(node, 'end_lineno', None) or (
+                following.lineno - 1 if following else len(lines))
+        for lineno in range(node.lineno, end + 1):
+            phases[lineno + offset] = phase
+    return branches, phases, loop
+
+
+class ParseStats(object):
+    """
+    Collect statistics on the branches taken by `parse_hamnosys`.
+
+    Notes
+    -----
+    Statistics are collected for all calls of the parser in the current
+    thread within a `with` block. Outside of the block, the parser runs
+    without any instrumentation. The statistics count the calls, the
+    characters processed, and the branches taken, and measure the time
+    spent in the scanning loop and in the post-processing of the
+    components. The times include the overhead of the instrumentation, so
+    they are only meaningful in relation to each other.
+
+    If `trace` is set, the state transitions are recorded for each
+    character, as the environments (like `in_handshape`) which are on
+    before and after the character is processed.
+    """
+
+    def __init__(self, trace=False):
+        self.branches = Counter()
+        self.phases = Counter()
+        self.calls = 0
+        self.characters = 0
+        self.trace = [] if trace else None
+        self._branches, self._phases, self._loop = parser_lines()
+        self._code = parse_hamnosys.__code__
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = sys.gettrace()
+        sys.settrace(self._trace_calls)
+        return self
+
+    def __exit__(self, *args):
+        sys.settrace(self._previous)
+
+    def _trace_calls(self, frame, event, arg):
+        if event != 'call' or frame.f_code is not self._code:
+            return None
+        self.calls += 1
+        phase, last, pending = 'other', time.perf_counter(), []
+        index = None
+
+        def trace_lines(frame, event, arg):
+            nonlocal phase, last, index
+            now = time.perf_counter()
+            self.phases[phase] += now - last
+            last = now
+            if event == 'return':
+                self._transition(frame, pending)
+                return None
+            if event != 'line':
+                return trace_lines
+            lineno = frame.f_lineno
+            phase = self._phases.get(lineno, phase)
+            if lineno in self._branches:
+                self.branches[self._branches[lineno]] += 1
+            # statements on several lines can fire more than once
+            if lineno == self._loop and frame.f_locals['i'] != index:
+                index = frame.f_locals['i']
+                self.characters += 1
+                if self.trace is not None:
+                    self._transition(frame, pending)
+                    char = frame.f_locals['char']
+                    pending.append({
+                        'call': self.calls,
+                        'index': index,
+                        'char': char,
+                        'class': CLASS_NAMES[parse.CLASSES.get(
+                            char, parse.OTHER)],
+                        'before': self._state(frame)})
+            elif pending and phase != 'scan':
+                self._transition(frame, pending)
+            return trace_lines
+        return trace_lines
+
+    @staticmethod
+    def _state(frame):
+        return [
+                name for name, value in frame.f_locals.items()
+                if name.startswith('in_') and value is True]
+
+    def _transition(self, frame, pending):
+        if pending:
+            step = pending.pop()
+            step['after'] = self._state(frame)
+            self.trace.append(step)
+
+    def as_dict(self):
+        """
+        Return the statistics as a dictionary.
+        """
+        data = {
+                'calls': self.calls,
+                'characters': self.characters,
+                'phases': dict(self.phases),
+                'branches': dict(sorted(
+                    self.branches.items(),
+                    key=lambda item: int(item[0].split(':')[0]))),
+                }
+        if self.trace is not None:
+            data['trace'] = self.trace
+        return data
+
+    def to_json(self, path):
+        """
+        Write the statistics to a JSON file.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
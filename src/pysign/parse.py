@@ -1,16 +1,230 @@
 """
 Module for parsing segmented HamNoSys transcriptions.
 """
-from pysign.data import HAMNOSYS
+import os
+import re
+import sys
+from collections import deque, OrderedDict
+from functools import lru_cache, partial
+from itertools import islice
+
+from pysign.data import HAMNOSYS, HAMSYMBOLS, LazyTable
 import attr
-from tabulate import tabulate
+
+
+# character classes used to dispatch the parser
+(OTHER, SPACE, SYMMETRY, HANDSHAPE, HANDSHAPE_DIACRITIC, ORIENTATION,
+ ORIENTATION_DIACRITIC, LOCATION, LOCATION_DIACRITIC, CONTACT, BRUSH,
+ MOVEMENT, MOVEMENT_DIACRITIC, REPETITION, AMBIGUOUS, AMBIGUOUS_LOCATION,
+ OPEN_BRACKET, CLOSE_BRACKET, OPEN_PAR, CLOSE_PAR, OPEN_FUSE, CLOSE_FUSE,
+ DOMINANCE) = range(23)
+
+# (DOMAIN, TYPE, SUBDOMAIN) patterns in hamsymbols.tsv, None matches any
+# value, the first matching pattern determines the class
+CLASS_RULES = [
+    ('symmetry', 'base', None, SYMMETRY),
+    ('symmetry', 'flag', None, SYMMETRY),
+    ('handshape', 'base', None, HANDSHAPE),
+    ('handshape', 'diacritic', 'thumb', HANDSHAPE_DIACRITIC),
+    ('handshape', 'diacritic', 'flexion', AMBIGUOUS),
+    ('handshape|location', 'diacritic', 'flexion', AMBIGUOUS),
+    ('handshape|location', None, None, AMBIGUOUS_LOCATION),
+    ('orientation', 'base', None, ORIENTATION),
+    ('orientation', 'diacritic', None, ORIENTATION_DIACRITIC),
+    ('location', 'base', 'contact', CONTACT),
+    ('location', 'base', None, LOCATION),
+    ('location', 'diacritic', None, LOCATION_DIACRITIC),
+    ('movement', 'base', None, MOVEMENT),
+    ('movement', 'diacritic', None, MOVEMENT_DIACRITIC),
+    ('movement|symmetry', None, None, AMBIGUOUS),
+    ('symmetry|movement', None, None, AMBIGUOUS),
+    ('handshape|any', None, None, AMBIGUOUS),
+    ('any', None, None, AMBIGUOUS),
+    ('group', 'start', 'dom-nondom|simultaneous', OPEN_BRACKET),
+    ('group', 'stop', 'dom-nondom|simultaneous', CLOSE_BRACKET),
+    ('group', 'start', 'group', OPEN_PAR),
+    ('group', 'stop', 'group', CLOSE_PAR),
+    ('group', 'start', 'fuse', OPEN_FUSE),
+    ('group', 'stop', 'fuse', CLOSE_FUSE),
+    ('group', 'flag', 'dom-nondom', DOMINANCE),
+    ]
+
+# symbols which the parser treats differently from their description
+CLASS_OVERRIDES = {
+    'hamspace': SPACE,
+    'hambrushing': BRUSH,
+    'hamlrat': LOCATION,
+    'hamthumbside': AMBIGUOUS_LOCATION,
+    'hampinkyside': AMBIGUOUS_LOCATION,
+    'hamrepeatfromstart': REPETITION,
+    'hamrepeatfromstartseveral': REPETITION,
+    'hamrepeatcontinue': REPETITION,
+    'hamrepeatcontinueseveral': REPETITION,
+    'hamrepeatreverse': REPETITION,
+    # deprecated symbols, which are not parsed as part of any component
+    'hamelbow': OTHER,
+    'hamwristpulse': OTHER,
+    'hamwristtopulse': OTHER,
+    'hamwristtoback': OTHER,
+    'hamwristtothumb': OTHER,
+    'hamwristtopinky': OTHER,
+    'hammovecross': OTHER,
+    'hammoveX': OTHER,
+    'hamslow': OTHER,
+    }
+
+
+def character_classes(symbols=None):
+    """
+    Compile the lookup table from characters to character classes.
+
+    Notes
+    -----
+    The table is built from the DOMAIN, TYPE, and SUBDOMAIN columns of
+    `hamsymbols.tsv` with help of `CLASS_RULES` and `CLASS_OVERRIDES`.
+    Characters not in the table belong to the class `OTHER`.
+    """
+    symbols = symbols or HAMSYMBOLS
+    table = {}
+    for char, row in symbols.items():
+        if row['NAME'] in CLASS_OVERRIDES:
+            table[char] = CLASS_OVERRIDES[row['NAME']]
+            continue
+        for domain, type_, subdomain, cls in CLASS_RULES:
+            if domain == row['DOMAIN'] and \
+                    type_ in (None, row['TYPE']) and \
+                    subdomain in (None, row['SUBDOMAIN']):
+                table[char] = cls
+                break
+    return table
+
+
+# built on first access, so that importing the module does not load the
+# symbol tables
+CLASSES = LazyTable(load=character_classes)
+
+# classes of the characters which add to a component in any environment,
+# symmetry is always parsed
+COMPONENT_CLASSES = {
+    'h': (HANDSHAPE, HANDSHAPE_DIACRITIC),
+    'o': (ORIENTATION, ORIENTATION_DIACRITIC),
+    'c': (BRUSH, CONTACT),
+    'l': (LOCATION, LOCATION_DIACRITIC, CONTACT, AMBIGUOUS,
+          AMBIGUOUS_LOCATION),
+    }
+
+# the boundaries (start, end) of the characters in short texts, shared by
+# all calls which return spans
+BOUNDS = [(i, i + 1) for i in range(256)]
+
+@lru_cache(maxsize=None)
+def _last_symbol(h, o, c, l):
+    """
+    Return a pattern matching a text up to the last character which adds to
+    one of the selected components.
+    """
+    classes = {SYMMETRY}.union(*[
+        COMPONENT_CLASSES[component]
+        for component, flag in zip('hocl', (h, o, c, l)) if flag])
+    return re.compile('.*[{0}]'.format(''.join(
+        re.escape(char) for char, cls in sorted(CLASSES.items())
+        if cls in classes)), re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _names():
+    """
+    Return a translation table from code points to the names of HamNoSys
+    symbols, each preceded by a dot.
+    """
+    return {ord(char): '.' + row['Name'] for char, row in HAMNOSYS.items()}
+
+
+@lru_cache(maxsize=None)
+def _codes():
+    """
+    Return a dictionary from names to characters and a prefix trie of the
+    names, in which the key `None` marks the end of a name.
+    """
+    codes, trie = {}, {}
+    for char, row in HAMNOSYS.items():
+        codes[row['Name']] = char
+        node = trie
+        for letter in row['Name']:
+            node = node.setdefault(letter, {})
+        node[None] = char
+    return codes, trie
 
 
 def ascify(text, sep='.'):
+    if isinstance(text, str):
+        names = text.translate(_names())
+        # all names start with a dot, characters without names are kept
+        if names.count('.') == len(text):
+            return names[1:].replace('.asciispace.', ' ')
     return '.'.join(
             HAMNOSYS.get(char, {"Name": '<'+char+'>'})["Name"] for char in
             text).replace('.asciispace.', ' ')
 
+
+def ascify_many(texts):
+    """
+    Convert many texts to names like `ascify`.
+
+    Notes
+    -----
+    Each distinct text is converted once, which pays off for columns of
+    corpora, in which the same transcriptions recur. Returns a list.
+    """
+    texts = list(texts)
+    if not all(isinstance(text, str) for text in texts):
+        return [ascify(text) for text in texts]
+    names = {text: ascify(text) for text in set(texts)}
+    return [names[text] for text in texts]
+
+
+def _segment(names, trie):
+    """
+    Split names written without dots, preferring the longest names.
+    """
+    # chars[i] holds the characters for names[i:], or None if none fit
+    chars = [None] * len(names) + ['']
+    for i in range(len(names) - 1, -1, -1):
+        if names[i] == '<' and names[i + 2:i + 3] == '>' and \
+                chars[i + 3] is not None:
+            chars[i] = names[i + 1] + chars[i + 3]
+            continue
+        node = trie
+        for j in range(i, len(names)):
+            node = node.get(names[j])
+            if node is None:
+                break
+            if None in node and chars[j + 1] is not None:
+                chars[i] = node[None] + chars[j + 1]
+    if chars[0] is None:
+        raise ValueError('unknown names {0!r}'.format(names))
+    return chars[0]
+
+
+def deascify(text):
+    """
+    Convert names like those returned by `ascify` back to characters.
+
+    Notes
+    -----
+    Names are separated by dots, spaces stand for `asciispace`. Names which
+    are not separated are split with a prefix trie of the names, preferring
+    the longest names. Raises a `ValueError` for unknown names.
+    """
+    codes, trie = _codes()
+    chars = []
+    for name in text.replace(' ', '.asciispace.').split('.'):
+        char = codes.get(name)
+        if char is None:
+            char = _segment(name, trie)
+        chars.append(char)
+    return ''.join(chars)
+
 def parse_hamnosys(text,
                    h=True,
                    o=True,
@@ -18,24 +232,32 @@ def parse_hamnosys(text,
                    l=True,
                    m=True,
                    ascify_text=False,        
+                   spans=False,
                    ):
-    
-    # define character types
-    symmetry_base=""
-    handshape_base=""
-    handshape_diacritic=""
-    orientation_base=""
-    orientation_diacritic=""
-    location_base=""
-    location_diacritic=""
-    contact_base=""
-    brush=""
-    movement_base=""
-    movement_diacritic=""
-    repetition=""
+    """
+    Parse a HamNoSys transcription into its components.
+
+    Notes
+    -----
+    The flags `h`, `o`, `c`, `l`, and `m` select the handshape,
+    orientation, contact, location, and movement (with repetition) of the
+    hands. Components which are not selected are returned empty. Without
+    movement, the text is only scanned until no later character can add to
+    the selected components, so the meta information covers only the part
+    of the text which was scanned.
+
+    The text is scanned once, and lookups of other positions take constant
+    time, so that long texts with many signs are parsed in linear time.
+
+    If `spans` is set, the parts of the components are returned as `Span`
+    objects, which point into the text instead of copying it. While the text
+    is scanned, the parts are tuples of the boundaries of their characters,
+    and the spans are only created at the end. Spans take less memory than
+    the strings, but creating them takes longer than joining the short
+    strings of a typical sign.
+    """
+    # structural characters
     hand_internal_mov=""
-    ambiguous_diacritic=""
-    ambiguous_location = ""
     open_bracket=""
     open_par=""
     open_fuse=""
@@ -45,6 +267,14 @@ def parse_hamnosys(text,
     dominance_meta=""
 
     # set up environments and variables
+    classes = CLASSES.table
+    # the character classes are bound to local names, which are faster to
+    # look up in the loop than the module globals
+    (OTHER, SPACE, SYMMETRY, HANDSHAPE, HANDSHAPE_DIACRITIC, ORIENTATION,
+     ORIENTATION_DIACRITIC, LOCATION, LOCATION_DIACRITIC, CONTACT, BRUSH,
+     MOVEMENT, MOVEMENT_DIACRITIC, REPETITION, AMBIGUOUS, AMBIGUOUS_LOCATION,
+     OPEN_BRACKET, CLOSE_BRACKET, OPEN_PAR, CLOSE_PAR, OPEN_FUSE, CLOSE_FUSE,
+     DOMINANCE) = range(23)
     in_symmetry, symmetry = False, []
     in_handshape, handshape, handshapes_meta = False, [], []
     in_orientation, orientation, orientation_meta = False, [], []
@@ -57,11 +287,49 @@ def parse_hamnosys(text,
     in_repetition, in_special_repetition, repeat = False, False, []
     in_hand_internal = False
     rest = ''
+
+    # parts of components are built from units, which are the characters or,
+    # for spans, the boundaries (start, end) of the characters, so that the
+    # parts are flat tuples of boundaries
+    if not spans:
+        units = text
+    elif len(text) <= len(BOUNDS):
+        units = BOUNDS
+    else:
+        units = [(i, i + 1) for i in range(len(text))]
+
+    # position of the last dominance symbol, instead of searching the rest
+    # of the text at each bracket
+    last_dominance = text.rfind(dominance_meta)
+    # whether the dominance symbol was added to the meta symbols of a
+    # component, instead of searching the growing lists at each symbol
+    shape_dominance = orientation_dominance = location_dominance = False
+
+    # movements can contain symbols of all components
+    if m:
+        stop = len(text)
+    else:
+        match = _last_symbol(h, o, c, l).match(text)
+        stop = match.end() if match else 0
     
     for i, char in enumerate(text):
-        
+        # the environments are the only way to add to a component after the
+        # last character in `COMPONENT_CLASSES`
+        if i >= stop and not (
+                in_symmetry or
+                (h and in_handshape) or
+                (o and in_orientation) or
+                ((c or l) and in_contact) or
+                (l and in_location)):
+            break
+        cls = classes.get(char, OTHER)
+        unit = units[i]
+
+        # the branches are ordered by how often the classes occur in the
+        # example signs
+
         # turn off all environments after space
-        if char == ' ':
+        if cls == SPACE:
             in_symmetry = False
             in_handshape = False
             in_orientation = False
@@ -76,43 +344,15 @@ def parse_hamnosys(text,
             in_special_repetition = False
             in_hand_internal = False
             rest += char # not strictly necessary, but just to parse everything
-        
-        # characters unique to symmetry
-        elif char in symmetry_base:
-            # turn on symmetry environment
-            in_symmetry = True 
-            symmetry += [char]
-            
-        # characters unique to handshape
-        elif char in handshape_base:
-            in_handshape = True            
-            handshape += [char]
 
-            # turn off other environments
-            in_symmetry = False 
-            in_orientation = False
-            in_contact = False
-            in_brush = False
-            in_location = False
-            in_initial = False
-            in_repetition = False
-            in_special_repetition = False
-            in_hand_internal = False
-            # leave in_fusion on
-            # leave in_simultaneous on
-            # leave in_movement on
-                    
-        elif char in handshape_diacritic:
-            handshape[-1] += char
-        
         # characters unique to orientation
-        elif char in orientation_base:
+        elif cls == ORIENTATION:
             # two base characters in sequence
             if in_orientation:
-                orientation[-1] += char
+                orientation[-1] += unit
             else:
                 in_orientation = True 
-                orientation += [char]
+                orientation += [unit]
 
             # turn off other environments
             in_symmetry = False
@@ -127,42 +367,20 @@ def parse_hamnosys(text,
             # leave in_fusion on
             # leave in_simultaneous on
             # leave in_movement on
-                        
-        elif char == orientation_diacritic: 
-            orientation[-1] += char
-
-        # join brush and contact symbols
-        elif char == brush: 
-            in_brush = True
-            contact += [char]
-
-            # turn off other environments
-            in_symmetry = False
-            in_handshape = False
-            in_orientation = False
-            in_contact = False
-            in_location = False
-            in_initial = False
-            in_repetition = False
-            in_special_repetition = False
-            in_hand_internal = False
-            # leave in_fusion on
-            # leave in_simultaneous on
-            # leave in_movement on
 
         # characters unique to location
-        elif char in location_base:
+        elif cls == LOCATION:
             # two location base characters in sequence
             if in_location:
-                location[-1] += char
+                location[-1] += unit
             # more detailed transcription for initial position
             elif in_initial:
-                initial_position[-1] += char # follows another symbol
+                initial_position[-1] += unit # follows another symbol
             elif in_contact:
-                contact[-1] += char
+                contact[-1] += unit
             else:
                 in_location = True 
-                location += [char]
+                location += [unit]
 
             in_symmetry = False
             in_handshape = False
@@ -176,62 +394,28 @@ def parse_hamnosys(text,
             # leave in_simultaneous on
             # leave in_movement on
 
-        elif char in location_diacritic:
-            location[-1] += char
-        
-        # characters unique to contact
-        elif char in contact_base:
-            
-            # add contact to brush symbol if present
-            if in_brush: 
-                in_contact = True
-                contact[-1] += char
-                in_brush = False
-
-            # more detailed transcription for initial position
-            elif text[i-1] == close_bracket:
-                in_initial = True
-                initial_position += [char]
-            elif in_initial: # end of contact, location, contact sequence
-                initial_position[-1] += char
-                in_initial = False
-            else:    
-                in_contact = True
-                contact += [char]
-
-            in_symmetry = False
-            in_handshape = False
-            in_orientation = False
-            in_location = False
-            in_repetition = False
-            in_special_repetition = False
-            in_hand_internal = False
-            # leave in_fusion on
-            # leave in_simultaneous on
-            # leave in_movement on
-                
         # characters unique to movement
-        elif char in movement_base:
+        elif cls == MOVEMENT:
             
             if in_movement:
                 if in_simultaneous:
-                    movement[-1] += char
+                    movement[-1] += unit
                 elif in_fusion:
-                    movement[-1] += char
+                    movement[-1] += unit
                 elif in_special_repetition:
-                    movement[-1] += char
+                    movement[-1] += unit
                 else:
-                    movement += [char]
+                    movement += [unit]
 
             # for repeated movements
-            elif text[i-1] in repetition:
+            elif classes.get(text[i-1]) == REPETITION:
                 in_movement = True
-                movement[-1] += char
+                movement[-1] += unit
                 
             # beginning of simple movement
             else:
                 in_movement = True
-                movement += [char] 
+                movement += [unit] 
                 
             in_symmetry = False
             in_handshape = False
@@ -242,176 +426,236 @@ def parse_hamnosys(text,
             in_initial = False
             in_hand_internal = False
 
-        elif char in movement_diacritic:
-            if in_repetition:
-                repeat[-1] += char
-            else:
-                movement[-1] += char
-                
-        # keep fused movements together and parse at end
-        elif char == open_fuse:
-            movement += [char]
-            in_movement = True
-            in_fusion = True
-            
-            in_symmetry = False
-            in_handshape = False
+        # characters unique to handshape
+        elif cls == HANDSHAPE:
+            in_handshape = True            
+            handshape += [unit]
+
+            # turn off other environments
+            in_symmetry = False 
             in_orientation = False
-            in_brush = False
             in_contact = False
+            in_brush = False
             in_location = False
             in_initial = False
             in_repetition = False
             in_special_repetition = False
-            in_simultaneous = False
             in_hand_internal = False
-            
-        elif char == close_fuse:
-            if in_fusion:
-                movement[-1] += char
-
-                in_fusion = False
-                in_handshape = False # these sometimes occur in movement segment
-                in_orientation = False # these sometimes occur in movement segment
+            # leave in_fusion on
+            # leave in_simultaneous on
+            # leave in_movement on
 
-            else:
-                movement_meta += char # unparsed
-                in_fusion = False
-        
-        elif char in repetition:
-            # special type of repetition relating two movements
-            if in_special_repetition:
-                movement[-1] += char
-            # multiple normal repetition
-            elif in_repetition:
-                repeat[-1] += char
-            # normal repetition
-            else:
-                in_repetition = True
-                repeat += [char]
-        
-        # some diacritics can occur in most environments
-        elif char in ambiguous_diacritic: 
-            if in_symmetry:
-                symmetry[-1] += char
-            elif in_handshape:
-                handshape[-1] += char
-            elif in_orientation:
-                orientation[-1] += char
-            elif in_contact:
-                contact[-1] += char
-            elif in_location:
-                location[-1] += char
-            elif in_movement: 
-                if char in ambiguous_location: # can appear in movement segment
-                    if in_hand_internal:
-                        movement[-1] += char
-                    elif text[i-1] == hand_internal_mov:
-                        in_hand_internal = True
-                        movement[-1] += char
-                    else:
-                        in_location = True
-                        location += [char]
-                else:
-                    movement[-1] += char
-            # must be location
-            else:
-                in_location = True
-                location += [char] 
-            
         # check the next character after open bracket
-        elif char == open_bracket: 
-            if text[i+1] in ambiguous_diacritic: # I think this must be location                
+        elif cls == OPEN_BRACKET:
+            following = classes.get(text[i+1], OTHER)
+            if following in (AMBIGUOUS, AMBIGUOUS_LOCATION): # I think this must be location
                 location_meta += char
-            elif text[i+1] in handshape_base:
+            elif following == HANDSHAPE:
                 handshapes_meta += char                
-            elif text[i+1] in orientation_base: # seems unlikely
+            elif following == ORIENTATION: # seems unlikely
                 orientation_meta += char                
-            elif text[i+1] in contact_base: # seems unlikely
+            elif following == CONTACT: # seems unlikely
                 location_meta += char            
-            elif text[i+1] in location_base:
+            elif following == LOCATION:
                 location_meta += char                
-            elif text[i+1] in movement_base:
+            elif following == MOVEMENT:
                 # three options: (a) no dominance symbol, thus simultaneous
-                if dominance_meta not in text[i:]: # this may be a problem for compounds
+                if last_dominance < i: # this may be a problem for compounds
                     in_simultaneous = True
                     in_movement = True
-                    movement += [char]
+                    movement += [unit]
                 # (b) simultaneous and dominance symbol
-                elif dominance_meta in text[i:]: # this may be a problem for compounds
+                elif last_dominance >= i: # this may be a problem for compounds
                     if text[i-1] == open_bracket:
                         in_simultaneous = True
                         in_movement = True
-                        movement += [char]
+                        movement += [unit]
                     else:
                         movement_meta += char
                 # or (c) nondominant, no simultaneity
                 else:
                     movement_meta += char
-            elif text[i+1] == open_fuse:
+            elif following == OPEN_FUSE:
                 movement_meta += char
-            elif text[i+1] == open_bracket: # two open brackets, the second is movement
+            elif following == OPEN_BRACKET: # two open brackets, the second is movement
                 movement_meta += char
                 
             # grouping symbol; I think this must be movement
-            elif text[i+1] == open_par: 
+            elif following == OPEN_PAR:
+                movement_meta += char
+            else:
+                rest += char # unparsed
+
+        # assign close brackets
+        elif cls == CLOSE_BRACKET:
+            # close simlutaneous movement if open bracket in movement
+            if in_simultaneous:
+                movement[-1] += unit
+                in_movement = True # leave on to parse dominance_meta in 2-handed signs, with simultaneous
+                
+                in_handshape = False
+                in_orientation = False
+                in_contact = False
+                in_location = False
+                in_simultaneous = False
+                                        
+            elif in_handshape:
+                handshapes_meta += char
+                in_handshape = False
+                
+            elif in_orientation:
+                orientation_meta += char
+                in_orientation = False
+                
+            elif in_location:
+                location_meta += char
+                in_location = False
+                
+            elif in_contact:
+                location_meta += char
+                in_location = False
+
+            elif in_movement:
                 movement_meta += char
+                in_movement= False
+                
             else:
                 rest += char # unparsed
 
+        # some diacritics can occur in most environments
+        elif cls in (AMBIGUOUS, AMBIGUOUS_LOCATION):
+            if in_symmetry:
+                symmetry[-1] += unit
+            elif in_handshape:
+                handshape[-1] += unit
+            elif in_orientation:
+                orientation[-1] += unit
+            elif in_contact:
+                contact[-1] += unit
+            elif in_location:
+                location[-1] += unit
+            elif in_movement: 
+                if cls == AMBIGUOUS_LOCATION: # can appear in movement segment
+                    if in_hand_internal:
+                        movement[-1] += unit
+                    elif text[i-1] == hand_internal_mov:
+                        in_hand_internal = True
+                        movement[-1] += unit
+                    else:
+                        in_location = True
+                        location += [unit]
+                else:
+                    movement[-1] += unit
+            # must be location
+            else:
+                in_location = True
+                location += [unit] 
+
+        # characters unique to contact
+        elif cls == CONTACT:
+            
+            # add contact to brush symbol if present
+            if in_brush: 
+                in_contact = True
+                contact[-1] += unit
+                in_brush = False
+
+            # more detailed transcription for initial position
+            elif text[i-1] == close_bracket:
+                in_initial = True
+                initial_position += [unit]
+            elif in_initial: # end of contact, location, contact sequence
+                initial_position[-1] += unit
+                in_initial = False
+            else:    
+                in_contact = True
+                contact += [unit]
+
+            in_symmetry = False
+            in_handshape = False
+            in_orientation = False
+            in_location = False
+            in_repetition = False
+            in_special_repetition = False
+            in_hand_internal = False
+            # leave in_fusion on
+            # leave in_simultaneous on
+            # leave in_movement on
+
         # check the next character after open paragraph
-        elif char == open_par: 
-            if text[i+1] in ambiguous_diacritic: # I think this must be location                
+        elif cls == OPEN_PAR:
+            following = classes.get(text[i+1], OTHER)
+            if following in (AMBIGUOUS, AMBIGUOUS_LOCATION): # I think this must be location
                 location_meta += char
-            elif text[i+1] == handshape_base: # rare
-                handshapes_meta += char
-            elif text[i+1] == orientation_base: # rare
-                orientation_meta += char        
-            elif text[i+1] == brush:
+            elif following == BRUSH:
                 contact_meta += char
-            elif text[i+1] in contact_base:
+            elif following == CONTACT:
                 contact_meta += char            
-            elif text[i+1] in location_base:
+            elif following == LOCATION:
                 # for locations below the waist; turn on location environment
-                if text[i-1] in location_base:
+                if classes.get(text[i-1]) == LOCATION:
                     in_location = True
                     location_meta += char
                 else:
                     location_meta += char                
-            elif text[i+1] in movement_base:
+            elif following == MOVEMENT:
                 in_grouped_movement = True # to do: for groups of movement symbols
                 movement_meta += char
-            elif text[i+1] in repetition:
+            elif following == REPETITION:
                 in_movement = True
                 in_special_repetition = True
-                movement[-1] += char
+                movement[-1] += unit
             else:
                 rest += char # unparsed characters
-        
+
+        # assign close paragaph
+        elif cls == CLOSE_PAR:
+            if in_grouped_movement: # to do
+                movement_meta += char
+            elif in_contact:
+                contact_meta += char
+            elif in_handshape:
+                handshapes_meta += char
+            elif in_orientation:
+                orientation_meta += char
+            elif in_location:
+                location_meta += char
+            elif in_movement:
+                if in_special_repetition:
+                    movement[-1] += unit
+                else:
+                    movement_meta += char
+            else:
+                rest += char # unparsed
+
         # marker for 2-handed sign
-        elif char == dominance_meta: 
+        elif cls == DOMINANCE:
             if in_handshape:
                 # handshape change in movement environment
-                if dominance_meta not in handshapes_meta:
+                if not shape_dominance:
                     handshapes_meta += char
+                    shape_dominance = True
                 else:
                     movement_meta += char
             elif in_orientation:
                 # orientation change in movement environment
-                if dominance_meta not in orientation_meta:
+                if not orientation_dominance:
                     orientation_meta += char
+                    orientation_dominance = True
                 else:
                     movement_meta += char
             elif in_contact:
                 # may occur in movement environment
-                if dominance_meta not in location_meta:
+                if not location_dominance:
                     location_meta += char
+                    location_dominance = True
                 else:
                     movement_meta += char
             elif in_location:
                 # may occur in movement environment
-                if dominance_meta not in location_meta:
+                if not location_dominance:
                     location_meta += char
+                    location_dominance = True
                 else:
                     movement_meta += char
             elif in_movement:
@@ -432,63 +676,96 @@ def parse_hamnosys(text,
             in_fusion = False
             in_repetition = False
             in_special_repetition = False
-                
-        # assign close brackets
-        elif char == close_bracket:
-            # close simlutaneous movement if open bracket in movement
-            if in_simultaneous:
-                movement[-1] += char
-                in_movement = True # leave on to parse dominance_meta in 2-handed signs, with simultaneous
-                
-                in_handshape = False
-                in_orientation = False
-                in_contact = False
-                in_location = False
-                in_simultaneous = False
-                                        
-            elif in_handshape:
-                handshapes_meta += char
-                in_handshape = False
-                
-            elif in_orientation:
-                orientation_meta += char
-                in_orientation = False
-                
-            elif in_location:
-                location_meta += char
-                in_location = False
-                
-            elif in_contact:
-                location_meta += char
-                in_location = False
 
-            elif in_movement:
-                movement_meta += char
-                in_movement= False
-                
+        elif cls == HANDSHAPE_DIACRITIC:
+            handshape[-1] += unit
+
+        # characters unique to symmetry
+        elif cls == SYMMETRY:
+            # turn on symmetry environment
+            in_symmetry = True 
+            symmetry += [unit]
+
+        elif cls == MOVEMENT_DIACRITIC:
+            if in_repetition:
+                repeat[-1] += unit
             else:
-                rest += char # unparsed
-                
-        # assign close paragaph
-        elif char == close_par:
-            if in_grouped_movement: # to do
-                movement_meta += char
-            elif in_contact:
-                contact_meta += char
-            elif in_handshape:
-                handshapes_meta += char
-            elif in_orientation:
-                orientation_meta += char
-            elif in_location:
-                location_meta += char
-            elif in_movement:
-                if in_special_repetition:
-                    movement[-1] += char
-                else:
-                    movement_meta += char
+                movement[-1] += unit
+
+        elif cls == REPETITION:
+            # special type of repetition relating two movements
+            if in_special_repetition:
+                movement[-1] += unit
+            # multiple normal repetition
+            elif in_repetition:
+                repeat[-1] += unit
+            # normal repetition
             else:
-                rest += char # unparsed
+                in_repetition = True
+                repeat += [unit]
+
+        # join brush and contact symbols
+        elif cls == BRUSH:
+            in_brush = True
+            contact += [unit]
+
+            # turn off other environments
+            in_symmetry = False
+            in_handshape = False
+            in_orientation = False
+            in_contact = False
+            in_location = False
+            in_initial = False
+            in_repetition = False
+            in_special_repetition = False
+            in_hand_internal = False
+            # leave in_fusion on
+            # leave in_simultaneous on
+            # leave in_movement on
+
+        elif cls == ORIENTATION_DIACRITIC:
+            orientation[-1] += unit
+
+        elif cls == LOCATION_DIACRITIC:
+            location[-1] += unit
+
+        # keep fused movements together and parse at end
+        elif cls == OPEN_FUSE:
+            movement += [unit]
+            in_movement = True
+            in_fusion = True
+            
+            in_symmetry = False
+            in_handshape = False
+            in_orientation = False
+            in_brush = False
+            in_contact = False
+            in_location = False
+            in_initial = False
+            in_repetition = False
+            in_special_repetition = False
+            in_simultaneous = False
+            in_hand_internal = False
+
+        elif cls == CLOSE_FUSE:
+            if in_fusion:
+                movement[-1] += unit
+
+                in_fusion = False
+                in_handshape = False # these sometimes occur in movement segment
+                in_orientation = False # these sometimes occur in movement segment
+
+            else:
+                movement_meta += char # unparsed
+                in_fusion = False
                 
+    # the spans are only created from the boundaries once the text is scanned
+    if spans:
+        for parts in (symmetry, handshape, orientation, location,
+                      initial_position, contact, repeat):
+            if parts:
+                _spans(parts, text)
+
     # handshapes
     if h:
         # determine dominant hand, no symmetry
@@ -502,7 +779,7 @@ def parse_hamnosys(text,
                 if len (handshape) > 1:
                     handshape_change = handshape
                 else:
-                    handshape_change = ''.join(handshape)
+                    handshape_change = handshape[0]
             else:
                 handshape_change = ''
         # one hand, no symmetry
@@ -516,7 +793,7 @@ def parse_hamnosys(text,
                 if len(handshape) > 1:
                     handshape_change = handshape
                 else:
-                    handshape_change = ''.join(handshape)
+                    handshape_change = handshape[0]
             else:
                 handshape_change = ''
     else:
@@ -534,7 +811,7 @@ def parse_hamnosys(text,
                 if len(orientation) > 1:
                     orientation_change = orientation
                 else:
-                    orientation_change = ''.join(orientation)
+                    orientation_change = orientation[0]
             else:
                 orientation_change = ''
         # only one hand
@@ -545,7 +822,7 @@ def parse_hamnosys(text,
                 if len(orientation) > 1:
                     orientation_change = orientation
                 else:
-                    orientation_change = ''.join(orientation)
+                    orientation_change = orientation[0]
             else:
                 orientation_change = ''
     else:
@@ -563,7 +840,7 @@ def parse_hamnosys(text,
                 if len(location) > 1:
                     location_change = location
                 else:
-                    location_change = ''.join(location)
+                    location_change = location[0]
             else:
                 location_change = ''
             
@@ -575,7 +852,7 @@ def parse_hamnosys(text,
                 if len(location) > 1:
                     location_change = location
                 else:
-                    location_change = ''.join(location)
+                    location_change = location[0]
             else:
                 location_change = ''
             
@@ -587,7 +864,7 @@ def parse_hamnosys(text,
                 if len(location) > 1:
                     location_change = location
                 else:
-                    location_change = ''.join(location)
+                    location_change = location[0]
             else:
                 location_change = ''
     else:
@@ -598,14 +875,14 @@ def parse_hamnosys(text,
    
     # determine dominant contact: unsure if nondominant contact is possible transcription
     # may not occur in some signs
-    if len(contact) > 0:
+    if c and len(contact) > 0:
         if dominance_meta in location_meta:
             dominant_contact = contact.pop(0)
             if len(contact) > 0:
                 if len(contact) > 1:
                     contact_change = contact
                 else:
-                    contact_change = ''.join(contact)
+                    contact_change = contact[0]
             else:
                 contact_change = ''
     
@@ -616,7 +893,7 @@ def parse_hamnosys(text,
                 if len(contact) > 1:
                     contact_change = contact
                 else:
-                    contact_change = ''.join(contact)
+                    contact_change = contact[0]
             else:
                 contact_change = ''
     else:
@@ -628,47 +905,56 @@ def parse_hamnosys(text,
         # parse contents of simultaneous, fused, and special-repetition movements
         movement_updated = []
         for item in movement:
-            if open_bracket in item and close_bracket in item:
+            if spans:
+                # the parts are built from single characters, so each pair
+                # of boundaries is one character
+                item_units = [units[j] for j in item[::2]]
+                chars = ''.join([text[j] for j in item[::2]])
+            else:
+                chars = item_units = item
+            if open_bracket in chars and close_bracket in chars:
                 simul_mov = []
-                stripped_movement = item.strip('')
-                for i, char in enumerate(stripped_movement):
-                    if char in movement_base:
-                        simul_mov += [char]
-                    elif char in movement_diacritic:
-                        simul_mov[-1] += char
-                    elif char in ambiguous_location: # finger internal movement
-                        simul_mov[-1] += char
+                for char, unit in zip(chars, item_units):
+                    cls = classes.get(char, OTHER)
+                    if cls == MOVEMENT:
+                        simul_mov += [unit]
+                    elif cls == MOVEMENT_DIACRITIC:
+                        simul_mov[-1] += unit
+                    elif cls == AMBIGUOUS_LOCATION: # finger internal movement
+                        simul_mov[-1] += unit
                 simul_mov.append('simultaneous')
                 movement_updated.append(simul_mov)
-            elif open_fuse in item and close_fuse in item: 
+            elif open_fuse in chars and close_fuse in chars: 
                 fused_mov = []
-                stripped_movement = item.strip('')
-                for i, char in enumerate(stripped_movement):
-                    if char in movement_base:
-                        fused_mov += [char]
-                    elif char in movement_diacritic:
-                        fused_mov[-1] += char
-                    elif char in ambiguous_location: # finger internal movement
-                        fused_mov[-1] += char
+                for char, unit in zip(chars, item_units):
+                    cls = classes.get(char, OTHER)
+                    if cls == MOVEMENT:
+                        fused_mov += [unit]
+                    elif cls == MOVEMENT_DIACRITIC:
+                        fused_mov[-1] += unit
+                    elif cls == AMBIGUOUS_LOCATION: # finger internal movement
+                        fused_mov[-1] += unit
                 fused_mov.append('fused')
                 movement_updated.append(fused_mov)
-            elif open_par in item and close_par in item:
+            elif open_par in chars and close_par in chars:
                 repeated_mov = []
-                repeating = ''
-                stripped_movement = item.replace('', '').replace('', '')
-                for i, char in enumerate(stripped_movement):
-                    if char in movement_base:
-                        repeated_mov += [char]
-                    elif char in movement_diacritic:
-                        repeated_mov[-1] += char
-                    elif char in ambiguous_location: # finger internal movement
-                        repeated_mov[-1] += char
-                    elif char in repetition:
-                        repeating += char
-                repeated_mov.append(repeating)
+                repeating = () if spans else ''
+                for char, unit in zip(chars, item_units):
+                    cls = classes.get(char, OTHER)
+                    if cls == MOVEMENT:
+                        repeated_mov += [unit]
+                    elif cls == MOVEMENT_DIACRITIC:
+                        repeated_mov[-1] += unit
+                    elif cls == AMBIGUOUS_LOCATION: # finger internal movement
+                        repeated_mov[-1] += unit
+                    elif cls == REPETITION:
+                        repeating += unit
+                repeated_mov.append(repeating or '')
                 movement_updated.append(repeated_mov)
             else:
                 movement_updated.append(item)
+        if spans:
+            _spans(movement_updated, text)
         
         # determine dominant movement
         if dominance_meta in movement_meta:
@@ -678,7 +964,7 @@ def parse_hamnosys(text,
                 if len(movement_updated) > 1:
                     movement_change = movement_updated
                 else:
-                    movement_change = ''.join(movement_updated)
+                    movement_change = movement_updated[0]
             else:
                 movement_change = ''
         # only one hand
@@ -699,7 +985,7 @@ def parse_hamnosys(text,
         movement_change = ''
     
     # repetition symbols
-    if repeat != []:
+    if m and repeat != []:
         if len(repeat) > 1:
             repeat = repeat
         else:
@@ -739,6 +1025,257 @@ def parse_hamnosys(text,
             }
     return data
 
+
+@attr.s(slots=True, repr=False, weakref_slot=False)
+class Span(object):
+    """
+    Part of a component, given by its position in a text.
+
+    Notes
+    -----
+    The part runs from `start` to `end`. If it has gaps, `ranges` are the
+    pairs `(start, end)` of the stretches of the text which make it up.
+    The characters are only copied when the span is converted with `str`.
+    """
+    text = attr.ib()
+    start = attr.ib()
+    end = attr.ib()
+    ranges = attr.ib(default=None)
+
+    @classmethod
+    def from_bounds(cls, text, bounds):
+        """
+        Create a span from the flat sequence `start, end, start, end, ...`
+        of the boundaries of its stretches, in order.
+        """
+        start, end = bounds[0], bounds[-1]
+        # each stretch ends where the next one starts
+        if bounds[1:-1:2] == bounds[2::2]:
+            return cls(text, start, end)
+        ranges = []
+        for i in range(0, len(bounds), 2):
+            if ranges and ranges[-1][1] == bounds[i]:
+                ranges[-1] = (ranges[-1][0], bounds[i + 1])
+            else:
+                ranges.append((bounds[i], bounds[i + 1]))
+        return cls(text, start, end, tuple(ranges))
+
+    def __len__(self):
+        if self.ranges is None:
+            return self.end - self.start
+        return sum(end - start for start, end in self.ranges)
+
+    def __str__(self):
+        if self.ranges is None:
+            return self.text[self.start:self.end]
+        return ''.join(self.text[start:end] for start, end in self.ranges)
+
+    def __repr__(self):
+        return 'Span({0!r}, {1}, {2})'.format(str(self), self.start, self.end)
+
+
+def _spans(parts, text):
+    """
+    Replace the boundaries of the parts of a component by spans.
+    """
+    for i, part in enumerate(parts):
+        if type(part) is tuple:
+            # without gaps, each stretch ends where the next one starts
+            if part[1:-1:2] == part[2::2]:
+                parts[i] = Span(text, part[0], part[-1])
+            else:
+                parts[i] = Span.from_bounds(text, part)
+        elif type(part) is list:
+            _spans(part, text)
+    return parts
+
+
+def _text(data):
+    """
+    Convert spans in parsed data to strings.
+    """
+    if isinstance(data, dict):
+        return {key: _text(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_text(value) for value in data]
+    if isinstance(data, Span):
+        return str(data)
+    return data
+
+
+def _copy(data):
+    if isinstance(data, dict):
+        return {key: _copy(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy(value) for value in data]
+    return data
+
+
+class ParseCache(object):
+    """
+    Bounded cache of parsed transcriptions, with least recently used
+    entries being evicted first.
+
+    Notes
+    -----
+    Call the cache like `parse_hamnosys`. Each call returns a fresh copy of
+    the cached result, so callers can modify it without affecting the cache.
+    With `maxsize` set to None, the cache is unbounded, like
+    `functools.lru_cache`.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def __call__(self, text, **keywords):
+        key = (text, tuple(sorted(keywords.items())))
+        if key in self._data:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return _copy(self._data[key])
+        self.misses += 1
+        data = parse_hamnosys(text, **keywords)
+        self._data[key] = _copy(data)
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+        return data
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self):
+        return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize
+                }
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+def _parse_chunk(parser, texts):
+    results = []
+    for text in texts:
+        try:
+            results.append((text, parser(text), None))
+        except Exception as error:
+            results.append((text, None, error))
+    return results
+
+
+def _map_chunks(parser, texts, workers=None, chunksize=100):
+    """
+    Apply a parser to chunks of texts, using a pool of processes.
+
+    Notes
+    -----
+    Chunks are yielded in the order of the input as lists of triples `(text,
+    result, error)`. Only a small number of chunks is submitted to the pool
+    at the same time, so `texts` can be a generator over a large corpus.
+    """
+    texts = iter(texts)
+    chunks = iter(lambda: list(islice(texts, chunksize)), [])
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield _parse_chunk(parser, chunk)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_parse_chunk, parser, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def parse_many(texts, workers=None, chunksize=100, **keywords):
+    """
+    Parse many HamNoSys transcriptions in parallel.
+
+    Notes
+    -----
+    `workers` is the number of processes (defaulting to the number of CPUs,
+    with `1` parsing in the current process), `chunksize` the number of
+    texts sent to a process at once. Keywords are passed to
+    `parse_hamnosys`. The function yields chunks of triples `(text, data,
+    error)` in the order of the input, with `data` being `None` and `error`
+    the exception if a text could not be parsed.
+    """
+    return _map_chunks(
+            partial(parse_hamnosys, **keywords),
+            texts,
+            workers=workers,
+            chunksize=chunksize)
+
+
+# default weights for comparing hands
+WEIGHTS = {
+        'shape': 5,
+        'orientation': 3,
+        'location': 2,
+        'movement': 1,
+        'contact': 2,
+        'repetition': 2
+        }
+
+
+# default weights of the hands and the symmetry for comparing signs
+SIGN_WEIGHTS = {
+        'dominant': 2,
+        'nondominant': 1,
+        'symmetry': 1
+        }
+
+
+def _identity(value1, value2):
+    if value1 == value2:
+        return 0
+    return 1
+
+
+@lru_cache(maxsize=128)
+def _sign_terms(weights, sign_weights):
+    """
+    Return the terms `(weight, part, attribute)` of `Sign.distance`, ordered
+    by descending weight, and the sum of their weights.
+    """
+    weight_sum = sum(weight for _, weight in weights)
+    terms = []
+    for part, part_weight in sign_weights:
+        if part == 'symmetry':
+            terms += [(part_weight, part, None)]
+        else:
+            terms += [
+                    (part_weight * weight / weight_sum, part, attribute)
+                    for attribute, weight in weights]
+    terms.sort(key=lambda term: -term[0])
+    return terms, sum(term[0] for term in terms)
+
+
+def hand_symbols(value):
+    """
+    Yield the HamNoSys symbols in a value of a hand attribute.
+    """
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            yield from hand_symbols(item)
+    elif all(char in CLASSES for char in value):
+        yield from value
+    else:
+        # labels like "simultaneous" or "fused" in movements
+        yield value
+
+
 @attr.s
 class Hand(object):
     shape = attr.ib(default='')
@@ -762,15 +1299,8 @@ class Hand(object):
         very simple function that simply yields 1 in case of difference, and 0
         in case of identity.
         """
-        weights = weights or {
-                'shape': 5,
-                'orientation': 3,
-                'location': 2,
-                'movement': 1,
-                'contact': 2,
-                'repetition': 2
-                }
-        
+        weights = weights or WEIGHTS
+
         def identity(string1, string2):
             if string1 == string2:
                 return 0
@@ -796,10 +1326,14 @@ class Sign(object):
     nondominant = attr.ib(default='')
     meta = attr.ib(default={'handshape': '', 'orientation': '',
         'location': '', 'movement': '', 'rest': ''})
+    symmetry = attr.ib(default='')
     
     @classmethod
-    def from_text(cls, text):
-        data = parse_hamnosys(text)
+    def from_text(cls, text, cache=None):
+        if cache is not None:
+            data = cache(text)
+        else:
+            data = parse_hamnosys(text)
         dominant = Hand(**data['dominant'])
         nondominant = Hand(**data['nondominant'])
         meta = data['meta']
@@ -807,10 +1341,60 @@ class Sign(object):
                 text=text, 
                 dominant=dominant, 
                 nondominant=nondominant, 
-                meta=meta
+                meta=meta,
+                symmetry=data['symmetry']
                 )
 
+    @classmethod
+    def from_texts(cls, texts, workers=None, chunksize=100):
+        """
+        Create signs from many texts in parallel.
+
+        Notes
+        -----
+        Yields chunks of triples `(text, sign, error)` in the order of the
+        input, see `parse_many`.
+        """
+        return _map_chunks(
+                cls.from_text, texts, workers=workers, chunksize=chunksize)
+
+    def distance(self, other, weights=None, compare=None, max_distance=None,
+                 sign_weights=None):
+        """
+        Compare one sign with another.
+
+        Notes
+        -----
+        The distance is the weighted mean of the distances of the attributes
+        of both hands, compared like in `Hand.distance` with `weights` and
+        `compare`, and of the symmetry. The hands and the symmetry are
+        weighted with `sign_weights`, by default `SIGN_WEIGHTS`.
+
+        If `max_distance` is passed, the terms are compared in the order of
+        their weights, starting with the highest, and the comparison stops
+        as soon as the distance is known to exceed `max_distance`. The
+        distance returned is then the part computed so far, which is larger
+        than `max_distance`, but can be smaller than the full distance.
+        """
+        terms, weight_sum = _sign_terms(
+                tuple(sorted((weights or WEIGHTS).items())),
+                tuple(sorted((sign_weights or SIGN_WEIGHTS).items())))
+        compare = compare or _identity
+        limit = None if max_distance is None else max_distance * weight_sum
+        score = 0
+        for weight, part, attribute in terms:
+            if attribute is None:
+                score += weight * compare(self.symmetry, other.symmetry)
+            else:
+                score += weight * compare(
+                        getattr(getattr(self, part), attribute),
+                        getattr(getattr(other, part), attribute))
+            if limit is not None and score > limit:
+                break
+        return score / weight_sum
+
     def pprint(self, as_ascii=True):
+        from tabulate import tabulate
         if not as_ascii:
             modify = lambda x: x
         else:
@@ -827,6 +1411,112 @@ class Sign(object):
         print(tabulate(table, headers='firstrow', tablefmt='pipe'))
 
 
+def _freeze(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@attr.s(slots=True, frozen=True)
+class Meta(object):
+    handshape = attr.ib(default=(), converter=_freeze)
+    orientation = attr.ib(default=(), converter=_freeze)
+    contact = attr.ib(default=(), converter=_freeze)
+    location = attr.ib(default=(), converter=_freeze)
+    movement = attr.ib(default=(), converter=_freeze)
+    rest = attr.ib(default='')
+
+
+@attr.s(slots=True, frozen=True)
+class CompactHand(object):
+    """
+    Immutable variant of `Hand`, with lists converted to tuples.
+    """
+    shape = attr.ib(default='', converter=_freeze)
+    orientation = attr.ib(default='', converter=_freeze)
+    location = attr.ib(default='', converter=_freeze)
+    movement = attr.ib(default='', converter=_freeze)
+    is_dominant = attr.ib(default='')
+    contact = attr.ib(default='', converter=_freeze)
+    repetition = attr.ib(default='', converter=_freeze)
+
+    distance = Hand.distance
+
+
+@attr.s(slots=True, frozen=True)
+class CompactSign(object):
+    """
+    Immutable and hashable variant of `Sign`, using less memory.
+
+    Notes
+    -----
+    For the eleven signs in `examples/test-signs.tsv`, `sizeof` yields on
+    average 2187 bytes for a compact sign and 4261 bytes for a `Sign`
+    (Python 3.11). Symbols are interned, so that signs in a corpus share
+    them, which brings a corpus of these signs down to 1645 bytes per
+    compact sign, compared to 3496 bytes per `Sign`.
+    """
+    text = attr.ib(default='')
+    dominant = attr.ib(default=CompactHand())
+    nondominant = attr.ib(default=CompactHand())
+    meta = attr.ib(default=Meta())
+    symmetry = attr.ib(default=(), converter=_freeze)
+
+    @classmethod
+    def from_text(cls, text, cache=None):
+        if cache is not None:
+            data = cache(text)
+        else:
+            data = parse_hamnosys(text)
+        return cls(
+                text=text,
+                dominant=CompactHand(**data['dominant']),
+                nondominant=CompactHand(**data['nondominant']),
+                meta=Meta(**data['meta']),
+                symmetry=data['symmetry']
+                )
+
+    @classmethod
+    def from_texts(cls, texts, workers=None, chunksize=100):
+        return _map_chunks(
+                cls.from_text, texts, workers=workers, chunksize=chunksize)
+
+    distance = Sign.distance
+    pprint = Sign.pprint
+
+
+def sizeof(obj):
+    """
+    Return the memory in bytes used by an object and the objects it holds.
+
+    Notes
+    -----
+    Objects which are shared, like interned strings, are counted only once.
+    """
+    seen = set()
+    todo = [obj]
+    size = 0
+    while todo:
+        obj = todo.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            todo.extend(obj.keys())
+            todo.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            todo.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            todo.append(obj.__dict__)
+        elif hasattr(obj, '__slots__'):
+            todo.extend(getattr(obj, name) for name in obj.__slots__
+                        if hasattr(obj, name))
+    return size
+
+
 
 
 
@@ -1,3 +1,111 @@
 """
 Module for the segmentation of HamNoSys transcriptions.
 """
+import attr
+
+from pysign.parse import (
+        CLASSES, OTHER, SPACE, SYMMETRY, HANDSHAPE, HANDSHAPE_DIACRITIC,
+        ORIENTATION, ORIENTATION_DIACRITIC, LOCATION, LOCATION_DIACRITIC,
+        CONTACT, BRUSH, MOVEMENT, MOVEMENT_DIACRITIC, REPETITION, AMBIGUOUS,
+        AMBIGUOUS_LOCATION, OPEN_BRACKET, CLOSE_BRACKET, OPEN_PAR, CLOSE_PAR,
+        OPEN_FUSE, CLOSE_FUSE, DOMINANCE)
+
+# kinds of tokens started by the character classes
+KINDS = {
+    OTHER: 'other',
+    SPACE: 'space',
+    SYMMETRY: 'symmetry',
+    HANDSHAPE: 'handshape',
+    ORIENTATION: 'orientation',
+    LOCATION: 'location',
+    CONTACT: 'contact',
+    BRUSH: 'contact',
+    MOVEMENT: 'movement',
+    REPETITION: 'repetition',
+    OPEN_BRACKET: 'bracket',
+    CLOSE_BRACKET: 'bracket',
+    OPEN_PAR: 'bracket',
+    CLOSE_PAR: 'bracket',
+    OPEN_FUSE: 'bracket',
+    CLOSE_FUSE: 'bracket',
+    DOMINANCE: 'dominance',
+    }
+
+# kinds of tokens started by diacritics which do not follow a symbol
+DIACRITICS = {
+    HANDSHAPE_DIACRITIC: 'handshape',
+    ORIENTATION_DIACRITIC: 'orientation',
+    LOCATION_DIACRITIC: 'location',
+    MOVEMENT_DIACRITIC: 'movement',
+    AMBIGUOUS: 'location',
+    AMBIGUOUS_LOCATION: 'location',
+    }
+
+# kinds of tokens which take diacritics
+SYMBOLS = {
+    'symmetry', 'handshape', 'orientation', 'location', 'contact',
+    'movement', 'repetition'}
+
+# pairs of classes of which the second continues the token of the first,
+# like the two symbols of an orientation
+JOINED = {
+    (ORIENTATION, ORIENTATION),
+    (LOCATION, LOCATION),
+    (REPETITION, REPETITION),
+    (BRUSH, CONTACT),
+    (OTHER, OTHER),
+    }
+
+
+@attr.s(slots=True, frozen=True)
+class Token(object):
+    """
+    Segment of a transcription, from `start` to `end`.
+
+    Notes
+    -----
+    A token consists of one symbol, or of several for orientations,
+    locations, repetitions, brushing contacts, and unknown characters,
+    followed by the `diacritics` attached to it. Diacritics which do not
+    follow a symbol form a token of their own.
+    """
+    kind = attr.ib()
+    start = attr.ib()
+    end = attr.ib()
+    diacritics = attr.ib(default='')
+
+    def text(self, text):
+        """
+        Return the characters of the token in the transcription `text`.
+        """
+        return text[self.start:self.end]
+
+
+def segment(text):
+    """
+    Split a transcription into tokens in one pass.
+
+    Notes
+    -----
+    Yields `Token` objects, which together cover all of the text.
+    """
+    classes = CLASSES.table
+    kind, start, diacritics, last = None, 0, '', None
+    for i, char in enumerate(text):
+        cls = classes.get(char, OTHER)
+        if cls in DIACRITICS:
+            if kind in SYMBOLS:
+                diacritics += char
+                continue
+            new = DIACRITICS[cls]
+        elif (last, cls) in JOINED and not diacritics:
+            last = cls
+            continue
+        else:
+            new = KINDS[cls]
+        if kind is not None:
+            yield Token(kind, start, i, diacritics)
+        kind, start, last = new, i, cls
+        diacritics = char if cls in DIACRITICS else ''
+    if kind is not None:
+        yield Token(kind, start, len(text), diacritics)
@@ -0,0 +1,328 @@
+"""
+Module for serving the parser to other programs over HTTP.
+
+Usage:
+    python -m pysign.server [--host HOST] [--port PORT] [--unix PATH]
+                            [--workers N] [--batch-size N] [--delay SECONDS]
+
+Requests are JSON objects sent with `POST` to `/parse` (`{"text": ...}`,
+answered with the output of `parse_hamnosys`), `/sign` (`{"text": ...}`,
+answered with the attributes of the `Sign`), and `/distance` (`{"a": ...,
+"b": ..., "hand": "dominant", "weights": null}`, answered with the
+`Hand.distance` of two hands given as texts or as dictionaries of
+attributes). Answers are JSON objects with the `result` or an `error`.
+`GET /stats` returns the statistics of the server.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import attr
+
+from pysign.parse import ParseCache, Sign, Hand
+
+# cache of the parser in each worker process
+_cache = None
+
+
+def _parser():
+    global _cache
+    if _cache is None:
+        _cache = ParseCache()
+    return _cache
+
+
+def _hand(value, hand):
+    if isinstance(value, dict):
+        return Hand(**value)
+    return getattr(Sign.from_text(value, cache=_parser()), hand)
+
+
+def _parse(request):
+    return _parser()(request['text'])
+
+
+def _sign(request):
+    return attr.asdict(Sign.from_text(request['text'], cache=_parser()))
+
+
+def _distance(request):
+    hand = request.get('hand', 'dominant')
+    return _hand(request['a'], hand).distance(
+            _hand(request['b'], hand), weights=request.get('weights'))
+
+
+METHODS = {
+        'parse': _parse,
+        'sign': _sign,
+        'distance': _distance,
+        }
+
+
+def _warm(seconds):
+    # parsing a sign loads the symbol tables
+    _parser()("\ue002 \ue020\ue038 \ue052 \ue089")
+    time.sleep(seconds)
+
+
+def _run_batch(batch):
+    """
+    Answer a batch of pairs `(method, request)` in a worker.
+    """
+    results = []
+    for method, request in batch:
+        try:
+            results.append((METHODS[method](request), None))
+        except Exception as error:
+            results.append((None, '{0}: {1}'.format(
+                type(error).__name__, error)))
+    return results
+
+
+class Server(object):
+    """
+    Server which answers requests to the parser in batches.
+
+    Notes
+    -----
+    Requests which arrive at the same time are collected in batches of up
+    to `batch_size` requests, waiting at most `delay` seconds for a batch to
+    fill up, and each batch is answered by one of `workers` processes, which
+    keep their parser and its cache between batches. With `workers` set to
+    0, batches are answered by a thread of the server process. The latency
+    of the last `window` requests is kept for the statistics.
+    """
+
+    def __init__(self, workers=1, batch_size=64, delay=0.002, window=10000):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.delay = delay
+        if workers:
+            self.executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.counts = Counter()
+        self.latencies = deque(maxlen=window)
+        self.started = time.perf_counter()
+        self.servers = []
+        self._queue = None
+        self._batcher = None
+        self._slots = None
+
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        """
+        Start listening on a TCP port, or on a unix socket if `path` is set.
+        """
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(2 * max(self.workers, 1))
+        self._batcher = asyncio.ensure_future(self._batches())
+        # start all workers before accepting connections, since processes
+        # forked later would inherit the sockets of open connections
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(self.executor, _warm, 0.01)
+            for i in range(max(self.workers, 1))])
+        if path:
+            server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            server = await asyncio.start_server(self._handle, host, port)
+        self.servers.append(server)
+        return server
+
+    async def close(self):
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        if self._batcher:
+            self._batcher.cancel()
+        self.executor.shutdown()
+
+    async def submit(self, method, request):
+        """
+        Answer a request, raising a `ValueError` if it fails or if the method
+        is unknown.
+        """
+        if method not in METHODS:
+            raise ValueError('unknown method {0}'.format(method))
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((method, request, future))
+        try:
+            return await future
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    async def _batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.delay
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._queue.get(), max(0, deadline - loop.time())))
+                except asyncio.TimeoutError:
+                    break
+            await self._slots.acquire()
+            asyncio.ensure_future(self._answer(batch))
+
+    async def _answer(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                    self.executor, _run_batch,
+                    [(method, request) for method, request, _ in batch])
+        except Exception as error:
+            results = [(None, '{0}: {1}'.format(
+                type(error).__name__, error))] * len(batch)
+        finally:
+            self._slots.release()
+        self.counts['batches'] += 1
+        for (method, _, future), (result, error) in zip(batch, results):
+            self.counts[method] += 1
+            if future.done():
+                continue
+            if error:
+                self.counts['errors'] += 1
+                future.set_exception(ValueError(error))
+            else:
+                future.set_result(result)
+
+    def stats(self):
+        """
+        Return the statistics of the server.
+
+        Notes
+        -----
+        Latencies are given in milliseconds, from the arrival of a request
+        in the queue to its answer, and throughput in requests per second
+        since the start of the server.
+        """
+        requests = sum(self.counts[method] for method in METHODS)
+        seconds = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+
+        def percentile(value):
+            if not latencies:
+                return 0
+            return 1000 * latencies[min(
+                len(latencies) - 1, int(value * len(latencies)))]
+
+        return {
+                'requests': requests,
+                'methods': {method: self.counts[method] for method in METHODS},
+                'errors': self.counts['errors'],
+                'batches': self.counts['batches'],
+                'batch_size': requests / (self.counts['batches'] or 1),
+                'seconds': seconds,
+                'throughput': requests / seconds,
+                'latency': {
+                    'p50': percentile(0.5),
+                    'p90': percentile(0.9),
+                    'p99': percentile(0.99),
+                    'max': percentile(1)},
+                'workers': self.workers,
+                }
+
+    async def _dispatch(self, verb, target, body):
+        name = target.split('?')[0].strip('/')
+        if verb == 'GET' and name == 'stats':
+            return 200, self.stats()
+        if verb != 'POST' or name not in METHODS:
+            return 404, {'error': 'unknown request {0} {1}'.format(
+                verb, target)}
+        try:
+            request = json.loads(body.decode('utf-8'))
+        except ValueError as error:
+            return 400, {'error': 'invalid JSON: {0}'.format(error)}
+        try:
+            return 200, {'result': await self.submit(name, request)}
+        except ValueError as error:
+            return 422, {'error': str(error)}
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                verb, target, version = line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(
+                        int(headers.get('content-length', 0)))
+                status, data = await self._dispatch(verb, target, body)
+                payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+                close = version == 'HTTP/1.0' or headers.get(
+                        'connection', '').lower() == 'close'
+                writer.write((
+                    'HTTP/1.1 {0} {1}\r\n'
+                    'Content-Type: application/json; charset=utf-8\r\n'
+                    'Content-Length: {2}\r\n'
+                    'Connection: {3}\r\n\r\n').format(
+                        status, STATUS[status], len(payload),
+                        'close' if close else 'keep-alive').encode('latin-1'))
+                writer.write(payload)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+STATUS = {
+        200: 'OK',
+        400: 'Bad Request',
+        404: 'Not Found',
+        422: 'Unprocessable Entity',
+        }
+
+
+async def serve(host='127.0.0.1', port=8765, path=None, **keywords):
+    """
+    Run a `Server` until the process is stopped.
+    """
+    server = Server(**keywords)
+    await server.start(host=host, port=port, path=path)
+    try:
+        await asyncio.gather(*[
+            listener.serve_forever() for listener in server.servers])
+    finally:
+        await server.close()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='listen on a unix socket instead')
+    parser.add_argument(
+            '--workers', type=int, default=1,
+            help='number of parser processes, 0 to parse in the server')
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument(
+            '--delay', type=float, default=0.002,
+            help='seconds to wait for a batch to fill up')
+    args = parser.parse_args(args)
+    try:
+        asyncio.run(serve(
+            host=args.host, port=args.port, path=args.unix,
+            workers=args.workers, batch_size=args.batch_size,
+            delay=args.delay))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,215 @@
+"""
+Module for storing parsed signs in a binary file which is read with `mmap`.
+"""
+import json
+import mmap
+import struct
+from array import array
+from functools import lru_cache
+
+import attr
+import numpy as np
+
+from pysign.parse import Sign, Hand, _copy, _freeze
+
+MAGIC = b'PYSIGNS1'
+
+# magic, number of fields, number of signs, number of values in the pool
+HEADER = struct.Struct('<8sIIQ')
+
+HAND_FIELDS = tuple(field.name for field in attr.fields(Hand))
+
+# one record per sign, with the code of the value of each field in the pool
+FIELDS = ('text', 'meta', 'symmetry') + tuple(
+        '{0}.{1}'.format(hand, name) for hand in ['dominant', 'nondominant']
+        for name in HAND_FIELDS)
+
+
+def _padding(size):
+    return -size % 8
+
+
+def _record(sign):
+    meta = sign.meta if isinstance(sign.meta, dict) else attr.asdict(
+            sign.meta)
+    return [sign.text, meta, sign.symmetry] + [
+            getattr(getattr(sign, hand), name)
+            for hand in ['dominant', 'nondominant'] for name in HAND_FIELDS]
+
+
+def _same(value):
+    return value
+
+
+def _key(value):
+    if isinstance(value, dict):
+        return (dict, ) + tuple(
+                (key, _key(item)) for key, item in value.items())
+    return _freeze(value)
+
+
+def write_store(path, signs):
+    """
+    Write `Sign` objects to a binary store.
+
+    Notes
+    -----
+    The file consists of a header, a table of fixed-width records with one
+    unsigned 32-bit integer per name in `FIELDS`, the offsets of the values
+    in the pool, and the pool, in which each distinct value is stored once,
+    encoded as JSON. `CompactSign` objects can be stored as well, but are
+    read as `Sign` objects. Returns the number of signs written.
+    """
+    records, codes, pool = array('I'), {}, []
+    offsets, count = array('Q', [0]), 0
+    for sign in signs:
+        for value in _record(sign):
+            key = _key(value)
+            if key not in codes:
+                codes[key] = len(pool)
+                pool.append(json.dumps(
+                    value, ensure_ascii=False).encode('utf-8'))
+                offsets.append(offsets[-1] + len(pool[-1]))
+            records.append(codes[key])
+        count += 1
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(FIELDS), count, len(pool)))
+        f.write(np.asarray(records, dtype='<u4').tobytes())
+        f.write(b'\0' * _padding(4 * len(records)))
+        f.write(np.asarray(offsets, dtype='<u8').tobytes())
+        for value in pool:
+            f.write(value)
+    return count
+
+
+class SignStore(object):
+    """
+    Read-only access to signs written with `write_store`.
+
+    Notes
+    -----
+    The file is mapped into memory, so that processes opening the same file
+    share one copy of it, and only the pages which are accessed are read.
+    Looking up a sign by its number takes constant time, and `Sign` and
+    `Hand` objects are only created when they are requested. Stores can be
+    pickled, for example to pass them to worker processes, which then open
+    the file again.
+
+    The records are only given out as copies, since the map cannot be
+    closed while arrays point into it.
+    """
+
+    def __init__(self, path, cache=65536):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fields, self.size, values = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or fields != len(FIELDS):
+            self.close()
+            raise ValueError('{0} is not a sign store'.format(path))
+        start = HEADER.size
+        self._records = np.frombuffer(
+                self._mmap, dtype='<u4', count=self.size * fields,
+                offset=start).reshape(self.size, fields)
+        start += 4 * self.size * fields
+        start += _padding(start)
+        self._offsets = np.frombuffer(
+                self._mmap, dtype='<u8', count=values + 1, offset=start)
+        self._pool = start + 8 * (values + 1)
+        self._decode = lru_cache(maxsize=cache)(self._decode)
+
+    def __getstate__(self):
+        return {'path': self.path, 'cache': self._decode.cache_info().maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['cache'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        # the arrays hold references to the buffer of the map
+        self._records = self._offsets = None
+        self._mmap.close()
+
+    @property
+    def records(self):
+        """
+        A copy of the table of records, with one row per sign and the code of
+        each field in `FIELDS` in the columns.
+        """
+        return self._records.copy()
+
+    def record(self, idx):
+        """
+        Return a copy of the record of a sign.
+        """
+        return self._records[self._index(idx)].copy()
+
+    def __len__(self):
+        return self.size
+
+    def _index(self, idx):
+        if idx < 0:
+            idx += self.size
+        if not 0 <= idx < self.size:
+            raise IndexError('sign index out of range')
+        return idx
+
+    def _decode(self, code):
+        # returns the value with the fastest function to copy it
+        start, end = self._offsets[code:code + 2].tolist()
+        value = json.loads(
+                self._mmap[self._pool + start:self._pool + end].decode(
+                    'utf-8'))
+        if not isinstance(value, (list, dict)):
+            return value, _same
+        if isinstance(value, list) and all(
+                isinstance(item, str) for item in value):
+            return value, list
+        return value, _copy
+
+    def value(self, code):
+        """
+        Return the value with a code in the pool.
+        """
+        value, copy = self._decode(code)
+        return copy(value)
+
+    def get(self, idx, field):
+        """
+        Return the value of a field, as named in `FIELDS`, of a sign.
+        """
+        return self.value(
+                int(self._records[self._index(idx), FIELDS.index(field)]))
+
+    def text(self, idx):
+        return self.get(idx, 'text')
+
+    def hand(self, idx, hand='dominant'):
+        """
+        Return the `Hand` named by `hand` of a sign.
+        """
+        record = self._records[self._index(idx)].tolist()
+        start = FIELDS.index(hand + '.' + HAND_FIELDS[0])
+        return Hand(**{
+            name: self.value(code) for name, code in zip(
+                HAND_FIELDS, record[start:start + len(HAND_FIELDS)])})
+
+    def __getitem__(self, idx):
+        record = self._records[self._index(idx)].tolist()
+        values = [self.value(code) for code in record]
+        hands = len(HAND_FIELDS)
+        return Sign(
+                text=values[0],
+                dominant=Hand(*values[3:3 + hands]),
+                nondominant=Hand(*values[3 + hands:]),
+                meta=values[1],
+                symmetry=values[2])
+
+    def __iter__(self):
+        for idx in range(self.size):
+            yield self[idx]
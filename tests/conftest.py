@@ -0,0 +1,19 @@
+"""
+Shared test data.
+"""
+from pathlib import Path
+
+from csvw.dsv import UnicodeDictReader
+
+
+def read_signs():
+    """
+    Return the named transcriptions in examples/signs.tsv.
+    """
+    path = Path(__file__).parent.parent / 'examples' / 'signs.tsv'
+    with UnicodeDictReader(path, delimiter='\t') as reader:
+        return {row['name']: row['sign'] for row in reader}
+
+
+# typical transcriptions, by name
+SIGNS = read_signs()
@@ -0,0 +1,73 @@
+import json
+
+import numpy as np
+import pytest
+
+from pysign.cli import main
+from pysign.distance import distance_matrix
+from pysign.parse import parse_hamnosys, ascify, Sign
+
+from conftest import SIGNS
+
+texts = [SIGNS['one-handed'], SIGNS['two-handed'], SIGNS['simultaneous']]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / 'signs.tsv'
+    path.write_text(
+            'ID\tHamNoSys\n' + ''.join(
+                '{0}\t{1}\n'.format(i, text) for i, text in enumerate(texts)),
+            encoding='utf-8')
+    return str(path)
+
+
+def test_parse(corpus, tmp_path, capsys):
+    output = str(tmp_path / 'signs.jsonl')
+    for workers in [1, 2]:
+        assert main([
+            'parse', corpus, '--column', 'HamNoSys', '--output', output,
+            '--workers', str(workers), '--chunksize', '2']) == 0
+        with open(output, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        assert [record['row']['ID'] for record in records] == ['0', '1', '2']
+        assert [record['data'] for record in records] == [
+                parse_hamnosys(text) for text in texts]
+    assert '3 transcriptions' in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as info:
+        main(['parse', corpus, '--column', 'Sign', '--quiet'])
+    assert info.value.code == 2
+    assert 'no column Sign' in capsys.readouterr().err
+
+
+def test_ascify(corpus, capsys):
+    assert main(['ascify', corpus, '--column', 'HamNoSys', '--quiet']) == 0
+    assert capsys.readouterr().out.split('\n')[:-1] == [
+            ascify(text) for text in texts]
+
+
+def test_validate(tmp_path, capsys):
+    path = tmp_path / 'signs.txt'
+    path.write_text('\n'.join(texts + ['', texts[0]]), encoding='utf-8')
+    assert main(['validate', str(path)]) == 1
+    out, err = capsys.readouterr()
+    assert out.startswith('4\t\tIndexError')
+    assert '1 of 5 transcriptions are invalid' in err
+
+    path.write_text('\n'.join(texts), encoding='utf-8')
+    assert main(['validate', str(path), '--quiet']) == 0
+
+
+def test_distance(corpus, tmp_path):
+    output = str(tmp_path / 'distances.npy')
+    assert main([
+        'distance', corpus, '--column', 'HamNoSys', '--output', output,
+        '--square', '--quiet']) == 0
+    assert np.allclose(np.load(output), distance_matrix(
+        [Sign.from_text(text) for text in texts], square=True))
+    assert main([
+        'distance', corpus, '--column', 'HamNoSys', '--output', output,
+        '--tilesize', '2', '--quiet']) == 0
+    assert np.allclose(np.load(output), distance_matrix(
+        [Sign.from_text(text) for text in texts]))
@@ -0,0 +1,80 @@
+import random
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from pysign.cluster import linkage, flat_clusters
+from pysign.distance import distance_matrix
+from pysign.parse import Hand
+
+
+def naive(matrix, method):
+    """
+    Merge the closest clusters until one is left.
+    """
+    clusters = {i: [i] for i in range(len(matrix))}
+    merges = []
+    while len(clusters) > 1:
+        best = None
+        for a, b in combinations(sorted(clusters), 2):
+            distances = [matrix[i, j] for i in clusters[a] for j in clusters[b]]
+            d = min(distances) if method == 'single' else np.mean(distances)
+            if best is None or d < best[0]:
+                best = (d, a, b)
+        d, a, b = best
+        merges.append(d)
+        clusters[len(matrix) + len(merges) - 1] = clusters.pop(a) + clusters.pop(b)
+    return merges
+
+
+def test_linkage():
+    rng = np.random.RandomState(1)
+    points = rng.rand(40, 2)
+    square = np.sqrt(((points[:, None] - points[None]) ** 2).sum(axis=2))
+    condensed = square[np.triu_indices(40, 1)]
+    for method in ['average', 'single']:
+        result = linkage(condensed, method=method)
+        assert result.shape == (39, 4)
+        assert np.allclose(sorted(naive(square, method)), result[:, 2])
+        assert result[-1, 3] == 40
+        assert (np.diff(result[:, 2]) >= 0).all()
+        assert set(result[:, :2].flatten()) == set(range(78))
+    original = condensed.copy()
+    linkage(condensed)
+    assert (condensed == original).all()
+    linkage(condensed, overwrite=True)
+    assert not (condensed == original).all()
+
+    assert linkage([]).shape == (0, 4)
+    with pytest.raises(ValueError):
+        linkage([0.5, 0.5])
+    with pytest.raises(ValueError):
+        linkage([0.5], method='complete')
+
+
+def test_flat_clusters():
+    square = np.array([
+        [0, 1, 5, 6, 9],
+        [1, 0, 5, 6, 9],
+        [5, 5, 0, 2, 9],
+        [6, 6, 2, 0, 9],
+        [9, 9, 9, 9, 0]], dtype=float)
+    condensed = square[np.triu_indices(5, 1)]
+    for method in ['average', 'single']:
+        result = linkage(condensed, method=method)
+        assert flat_clusters(result, 0).tolist() == [0, 1, 2, 3, 4]
+        assert flat_clusters(result, 1).tolist() == [0, 0, 1, 2, 3]
+        assert flat_clusters(result, 2).tolist() == [0, 0, 1, 1, 2]
+        assert flat_clusters(result, 9).tolist() == [0, 0, 0, 0, 0]
+    assert flat_clusters(linkage(condensed), 5.5).tolist() == [0, 0, 0, 0, 1]
+    assert flat_clusters(
+            linkage(condensed, method='single'), 5).tolist() == [0, 0, 0, 0, 1]
+
+    rng = random.Random(1)
+    hands = [
+        Hand(shape=[rng.choice('ab'), ''], location=[rng.choice('cd'), ''])
+        for i in range(50)]
+    labels = flat_clusters(linkage(distance_matrix(hands)), 0)
+    assert len(set(labels)) == len(set(
+        (hand.shape[0], hand.location[0]) for hand in hands))
@@ -0,0 +1,47 @@
+import numpy as np
+
+from pysign.columns import Columns, COLUMNS
+from pysign.parse import parse_hamnosys, Sign
+
+from conftest import SIGNS
+
+texts = [
+    SIGNS['one-handed'],
+    SIGNS['two-handed'],
+    SIGNS['repeated'],
+    SIGNS['simultaneous'],
+    SIGNS['one-handed'],
+    ]
+
+
+def test_columns(tmp_path):
+    signs = [Sign.from_text(text) for text in texts]
+    columns = Columns.from_signs(signs)
+    assert columns.codes.shape == (5, len(COLUMNS))
+    assert columns.codes.dtype == np.uint32
+    assert columns.vocabulary[0] == ''
+    assert (columns.codes[0] == columns.codes[4]).all()
+    assert (columns['nondominant_shape'] == 0).sum() == 4
+    assert columns.decode(2)['symmetry'] == ''
+    assert columns.decode(3)['symmetry'] == '\ue0e8'
+    assert columns.decode(1)['nondominant_shape'] == '\ue001'
+    assert columns.decode(2)['dominant_movement'] == (
+            signs[2].dominant.movement[0])
+
+    other = Columns.from_signs([parse_hamnosys(text) for text in texts])
+    assert (other.codes == columns.codes).all()
+
+    extended = Columns.from_signs(signs[:1], vocabulary=columns.vocabulary)
+    assert (extended.codes[0] == columns.codes[0]).all()
+    assert extended.vocabulary == columns.vocabulary
+
+    path = tmp_path / 'columns.npz'
+    columns.save(path)
+    loaded = Columns.load(path)
+    assert len(loaded) == 5
+    assert (loaded.codes == columns.codes).all()
+    for row in range(5):
+        assert loaded.decode(row) == columns.decode(row)
+
+    assert len(Columns.from_signs([])) == 0
+    assert len(Columns.from_signs(iter(signs))) == 5
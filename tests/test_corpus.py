@@ -0,0 +1,48 @@
+import pytest
+
+from pysign.corpus import read_signs, read_rows
+from pysign.parse import Sign
+
+from conftest import SIGNS
+
+signs = [SIGNS['one-handed'], '', SIGNS['two-handed']]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / 'signs.tsv'
+    path.write_text(
+            'ID\tGloss\tHamNoSys\n' + ''.join(
+                '{0}\tgloss-{0}\t{1}\n'.format(i, sign) for i, sign in
+                enumerate(signs)),
+            encoding='utf-8')
+    return path
+
+
+def test_read_signs(corpus):
+    with pytest.raises(IndexError):
+        list(read_signs(corpus, 'HamNoSys'))
+
+    failed = []
+    parsed = list(read_signs(corpus, 'HamNoSys', failed=failed))
+    assert [row['ID'] for row, sign in parsed] == ['0', '2']
+    assert parsed[0][1] == Sign.from_text(signs[0])
+    assert failed[0][0]['Gloss'] == 'gloss-1'
+    assert isinstance(failed[0][1], IndexError)
+
+    parsed = list(read_signs(
+        corpus, 'HamNoSys', skip_errors=True, workers=2, chunksize=1))
+    assert [sign.text for row, sign in parsed] == [signs[0], signs[2]]
+
+
+def test_read_rows(corpus, tmp_path):
+    with open(str(corpus), encoding='utf-8', newline='') as f:
+        rows = list(read_rows(f, 'HamNoSys'))
+    assert [text for row, text in rows] == signs
+    assert rows[1][0]['Gloss'] == 'gloss-1'
+
+    path = tmp_path / 'signs.csv'
+    path.write_text('ID,HamNoSys\n0,' + signs[0] + '\n', encoding='utf-8')
+    assert [text for row, text in read_rows(path, 'HamNoSys')] == signs[:1]
+    with pytest.raises(KeyError):
+        list(read_rows(path, 'Gloss'))
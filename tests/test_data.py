@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+from pysign.data import (
+        HAMNOSYS, HAMSYMBOLS, read_hamnosys, read_hamsymbols, LazyTable)
+
+
+def test_tables():
+    # the precompiled modules must be regenerated when the TSV files change
+    assert dict(HAMNOSYS.items()) == read_hamnosys()
+    assert dict(HAMSYMBOLS.items()) == read_hamsymbols()
+    assert HAMNOSYS['\ue000']['Name'] == 'fist'
+    assert HAMSYMBOLS.get('\ue000')['DOMAIN'] == 'handshape'
+    assert '\ue000' in HAMSYMBOLS and len(HAMSYMBOLS) == 208
+
+
+def test_lazy_table():
+    table = LazyTable('_hamnosys')
+    assert table._table is None
+    assert table.get('x', 'y') == 'y'
+    assert table._table is HAMNOSYS.table
+    table = LazyTable(load=lambda: {'x': 1})
+    assert table._table is None
+    assert table['x'] == 1 and len(table) == 1
+
+
+def test_import():
+    # the symbol tables are loaded when they are first used
+    code = (
+            "import sys\n"
+            "import pysign, pysign.parse, pysign.segment\n"
+            "print(' '.join(sorted(sys.modules)))\n")
+    modules = subprocess.run(
+            [sys.executable, '-c', code], check=True,
+            stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+    for module in [
+            'csvw', 'tabulate', 'pysign._hamnosys', 'pysign._hamsymbols']:
+        assert module not in modules
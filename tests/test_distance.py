@@ -0,0 +1,183 @@
+import pickle
+import subprocess
+import sys
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from pysign.distance import (
+        encode, distance_matrix, distance_memmap, SubstitutionMatrix,
+        substitution_matrix)
+from pysign.parse import Sign, Hand, CompactSign, WEIGHTS
+
+from conftest import SIGNS
+
+texts = [
+    SIGNS['one-handed'],
+    SIGNS['two-handed'],
+    SIGNS['repeated'],
+    SIGNS['simultaneous'],
+    SIGNS['shape-change'],
+    SIGNS['other-movement'],
+    ]
+signs = [Sign.from_text(text) for text in texts]
+
+
+def test_encode():
+    codes = encode([sign.dominant for sign in signs], ['shape', 'movement'])
+    assert codes.shape == (6, 2)
+    assert codes[:, 0].tolist() == [0, 0, 1, 2, 3, 0]
+    assert codes[:, 1].tolist() == [0, 1, 2, 3, 4, 5]
+
+
+def test_distance_matrix():
+    weights = {'shape': 1, 'location': 3}
+    for kw in [{}, {'weights': weights}]:
+        condensed = distance_matrix(signs, blocksize=2, **kw)
+        expected = [
+                a.dominant.distance(b.dominant, **kw) for a, b in
+                combinations(signs, 2)]
+        assert condensed.dtype == np.float32
+        assert np.allclose(condensed, expected)
+
+        square = distance_matrix(signs, square=True, **kw)
+        assert square.shape == (6, 6)
+        assert np.allclose(square[np.triu_indices(6, 1)], condensed)
+        assert np.allclose(square, square.T)
+        assert np.allclose(np.diag(square), 0)
+
+    hands = [sign.nondominant for sign in signs]
+    assert np.allclose(
+            distance_matrix(hands, dtype=np.float64),
+            distance_matrix(signs, hand='nondominant'))
+    assert distance_matrix([Hand()]).shape == (0, )
+
+
+def test_substitution_matrix():
+    matrix = substitution_matrix()
+    assert matrix.symbol('\ue002', '\ue002') == 0
+    # two handshapes, a handshape and a diacritic, a handshape and a location
+    assert matrix.symbol('\ue001', '\ue002') == 0.25
+    assert matrix.symbol('\ue002', '\ue00d') == 0.75
+    assert matrix.symbol('\ue002', '\ue052') == 1
+    assert matrix.symbol('\ue038', '\ue03e') == 0.25
+    assert matrix.symbol('\ue020', '\ue038') == 0.5
+    assert matrix('', '') == 0
+    assert matrix(['\ue002', ''], ['\ue002\ue00d', '']) == 0.5
+    assert matrix(['\ue002', ''], ['\ue001', '\ue002']) == 0.625
+    assert matrix('simultaneous', 'simultaneous') == 0
+    assert matrix('simultaneous', 'fused') == 1
+
+    levels = {'DOMAIN': 1, 'TYPE': 1, 'SUBDOMAIN': 0.5}
+    assert SubstitutionMatrix(levels).symbol('\ue001', '\ue002') == 0.5
+
+    # the distances of the last pairs of values are kept
+    small = pickle.loads(pickle.dumps(SubstitutionMatrix(cache=2)))
+    for symbol in '\ue000\ue001\ue002':
+        assert small(symbol, '\ue002') == matrix(symbol, '\ue002')
+    assert small._distance.cache_info().currsize == 2
+
+    for hand in ['dominant', 'nondominant']:
+        condensed = distance_matrix(
+                signs, hand=hand, substitution=True, blocksize=2)
+        expected = [
+                getattr(a, hand).distance(getattr(b, hand), compare=matrix)
+                for a, b in combinations(signs, 2)]
+        assert np.allclose(condensed, expected)
+        assert (condensed <= distance_matrix(signs, hand=hand) + 1e-6).all()
+    values = [sign.dominant.movement for sign in signs]
+    table = matrix.table(values, blocksize=2)
+    assert np.allclose(table, table.T)
+    assert np.allclose(table, [[matrix(a, b) for b in values] for a in values])
+
+
+def test_sign_distance():
+    for a, b in combinations(signs, 2):
+        expected = (
+                2 * a.dominant.distance(b.dominant) +
+                a.nondominant.distance(b.nondominant) +
+                (a.symmetry != b.symmetry)) / 4
+        assert np.isclose(a.distance(b), expected)
+        assert np.isclose(
+                CompactSign.from_text(a.text).distance(
+                    CompactSign.from_text(b.text)), expected)
+        for cutoff in [0, 0.1, 0.3, 0.5, 1]:
+            d = a.distance(b, max_distance=cutoff)
+            if expected <= cutoff:
+                assert np.isclose(d, expected)
+            else:
+                assert cutoff < d <= expected + 1e-9
+    assert signs[0].distance(signs[0]) == 0
+    assert signs[0].distance(signs[1], sign_weights={'symmetry': 1}) == 0
+    assert signs[0].distance(signs[3], sign_weights={'symmetry': 1}) == 1
+
+    calls = []
+
+    def compare(value1, value2):
+        calls.append(value1)
+        return value1 != value2
+
+    # the symmetry has the highest weight, the shape of the dominant hand
+    # the second highest, which exceeds the cutoff
+    signs[0].distance(signs[2], compare=compare, max_distance=0.1)
+    assert calls == [signs[0].symmetry, signs[0].dominant.shape]
+    del calls[:]
+    signs[0].distance(signs[2], compare=compare)
+    assert len(calls) == 2 * len(WEIGHTS) + 1
+
+
+def test_distance_memmap(tmp_path):
+    hands = [sign.dominant for sign in signs] * 3
+    for square in [False, True]:
+        path = str(tmp_path / 'distances{0}.npy'.format(square))
+        expected = distance_matrix(hands, square=square)
+        # an interrupted computation is continued with the missing tiles
+        matrix = distance_memmap(
+                hands, path, square=square, tilesize=4, max_tiles=2)
+        assert not np.allclose(matrix, expected)
+        matrix = distance_memmap(hands, path, square=square, tilesize=4)
+        assert np.allclose(matrix, expected)
+        with open(path + '.tiles') as f:
+            assert len(f.readlines()) == 1 + 5 * 6 // 2
+
+    path = str(tmp_path / 'distances.npy')
+    matrix = distance_memmap(
+            signs, path, dtype=np.float16, tilesize=4, substitution=True)
+    assert matrix.dtype == np.float16
+    assert np.allclose(
+            matrix, distance_matrix(signs, substitution=True), atol=1e-3)
+    with pytest.raises(ValueError):
+        distance_memmap(signs, path, tilesize=2)
+    # resuming with other weights, hands, or signs
+    weights = dict(WEIGHTS, shape=2 * WEIGHTS['shape'])
+    for kw in [{'weights': weights}, {'hand': 'nondominant'},
+               {'substitution': None}]:
+        with pytest.raises(ValueError):
+            distance_memmap(signs, path, dtype=np.float16, tilesize=4,
+                            **dict({'substitution': True}, **kw))
+    with pytest.raises(ValueError):
+        distance_memmap(signs[::-1], path, dtype=np.float16, tilesize=4,
+                        substitution=True)
+    distance_memmap(signs, path, dtype=np.float16, tilesize=4,
+                    substitution=True)
+
+
+def test_distance_matrix_workers():
+    hands = [sign.dominant for sign in signs] * 5
+    for kw in [{}, {'square': True}, {'substitution': True}]:
+        assert np.allclose(
+                distance_matrix(hands, workers=3, blocksize=2, **kw),
+                distance_matrix(hands, **kw))
+    assert distance_matrix(hands[:1], workers=2).shape == (0, )
+
+    # the resource tracker, which the workers share, reports no errors
+    code = (
+            "from pysign.distance import distance_matrix\n"
+            "from pysign.parse import Hand\n"
+            "hands = [Hand(shape=[str(i), '']) for i in range(10)]\n"
+            "distance_matrix(hands, workers=2, blocksize=2)\n")
+    error = subprocess.run(
+            [sys.executable, '-c', code], check=True,
+            stderr=subprocess.PIPE, universal_newlines=True).stderr
+    assert 'Traceback' not in error
@@ -0,0 +1,79 @@
+import random
+
+from pysign.index import VPTree, FeatureIndex
+from pysign.parse import Sign, Hand
+
+from conftest import SIGNS
+
+texts = [
+    SIGNS['one-handed'],
+    SIGNS['two-handed'],
+    SIGNS['repeated'],
+    SIGNS['simultaneous'],
+    SIGNS['shape-change'],
+    ]
+hands = [Sign.from_text(text).dominant for text in texts]
+rng = random.Random(1)
+hands = [
+    Hand(**{a: getattr(rng.choice(hands), a) for a in [
+        'shape', 'orientation', 'location', 'movement', 'contact',
+        'repetition']}) for i in range(200)]
+
+
+def test_vptree():
+    tree = VPTree(hands)
+    assert len(tree) == 200
+    for hand in hands[:20]:
+        scan = sorted(hand.distance(other) for other in hands)
+        for k in [1, 5, 30]:
+            found = tree.k_nearest(hand, k)
+            assert [d for _, d in found] == scan[:k]
+            assert all(other.distance(hand) == d for other, d in found)
+        for radius in [0, 0.3, 1]:
+            found = tree.within(hand, radius)
+            assert [d for _, d in found] == [d for d in scan if d <= radius]
+    assert tree.evaluations < 20 * 7 * 200
+
+    signs = [Sign.from_text(text) for text in texts]
+    tree = VPTree(signs, hand='nondominant')
+    assert tree.k_nearest(signs[1], 1) == [(signs[1], 0)]
+    assert VPTree([]).within(signs[0], 1) == []
+
+
+def test_feature_index(tmp_path):
+    signs = [Sign.from_text(text) for text in texts]
+    index = FeatureIndex(signs[:3])
+    assert index.add(signs[3]) == 3
+    index.add(signs[4])
+    assert len(index) == 5
+    assert index.get('dominant', 'shape', '\ue002').tolist() == [0, 1]
+    assert index.get('nondominant', 'shape', '\ue001').tolist() == [1]
+    assert index.get('dominant', 'movement', 'simultaneous').tolist() == [3]
+    assert index.get('dominant', 'shape', 'x').tolist() == []
+
+    query = (
+            'and',
+            ('or', ('dominant', 'orientation', '\ue03e'),
+                ('dominant', 'orientation', '\ue038')),
+            ('not', ('dominant', 'location', '\ue053')))
+    assert index.query(query).tolist() == [0, 1, 4]
+    assert index.query(('not', query)).tolist() == [2, 3]
+    assert index.query(
+            ('and', ('not', ('dominant', 'shape', '\ue002')))).tolist() == \
+        [2, 3, 4]
+    assert index.query(('dominant', 'shape', 'x')).tolist() == []
+
+    # the arrays do not keep the posting lists from growing
+    shapes = index.get('dominant', 'shape', '\ue002')
+    result = index.query(('dominant', 'shape', '\ue002'))
+    index.add(signs[0])
+    assert shapes.tolist() == result.tolist() == [0, 1]
+    assert index.get('dominant', 'shape', '\ue002').tolist() == [0, 1, 5]
+    assert index.query(query).tolist() == [0, 1, 4, 5]
+
+    index.save(tmp_path / 'index.npz')
+    loaded = FeatureIndex.load(tmp_path / 'index.npz')
+    assert loaded.postings == index.postings
+    assert loaded.query(query).tolist() == [0, 1, 4, 5]
+    loaded.add(signs[0])
+    assert loaded.query(query).tolist() == [0, 1, 4, 5, 6]
@@ -0,0 +1,76 @@
+import ast
+import json
+
+from pysign.parse import parse_hamnosys
+from pysign.instrument import ParseStats, parser_lines
+
+from conftest import SIGNS
+
+one_handed = SIGNS['one-handed']
+two_handed = SIGNS['two-handed']
+repeated = SIGNS['repeated']
+
+
+def test_parser_lines():
+    branches, phases, loop = parser_lines()
+    labels = set(branches.values())
+    assert any(label.endswith('elif cls == HANDSHAPE:') for label in labels)
+    assert any('last_dominance >= i' in label for label in labels)
+    assert phases[loop] == 'scan'
+    assert {
+            'handshape', 'orientation', 'location', 'contact', 'movement',
+            'repetition'} <= set(phases.values())
+
+
+def test_parser_lines_without_end_lineno(monkeypatch):
+    # as on Python versions before 3.8
+    expected, parse = parser_lines()[1], ast.parse
+
+    def parse_without_end_lineno(source):
+        tree = parse(source)
+        for node in ast.walk(tree):
+            node.end_lineno = None
+        return tree
+
+    monkeypatch.setattr(ast, 'parse', parse_without_end_lineno)
+    phases = parser_lines()[1]
+    assert all(phases[lineno] == phase for lineno, phase in expected.items())
+
+
+def test_parse_stats(tmp_path):
+    with ParseStats() as stats:
+        result = parse_hamnosys(two_handed)
+    assert result == parse_hamnosys(two_handed)
+    assert stats.calls == 1
+    assert stats.characters == len(two_handed)
+    assert stats.trace is None
+    assert stats.phases['scan'] > 0
+    assert any(
+            'last_dominance >= i' in label and count
+            for label, count in stats.branches.items())
+
+    with ParseStats() as stats:
+        parse_hamnosys(repeated)
+    assert stats.phases['repetition'] > 0
+
+    # nothing is counted outside of the block
+    parse_hamnosys(one_handed)
+    assert stats.calls == 1
+
+    with ParseStats(trace=True) as stats:
+        parse_hamnosys(one_handed)
+        parse_hamnosys(two_handed)
+    assert stats.calls == 2
+    assert len(stats.trace) == len(one_handed) + len(two_handed)
+    assert stats.trace[0]['char'] == '\ue002'
+    assert stats.trace[0]['class'] == 'HANDSHAPE'
+    assert stats.trace[0]['before'] == []
+    assert stats.trace[0]['after'] == ['in_handshape']
+    assert stats.trace[1]['before'] == ['in_handshape']
+    assert stats.trace[-1]['call'] == 2
+
+    stats.to_json(str(tmp_path / 'stats.json'))
+    with open(str(tmp_path / 'stats.json')) as f:
+        data = json.load(f)
+    assert data['calls'] == 2
+    assert len(data['trace']) == len(stats.trace)
@@ -1,4 +1,15 @@
-from pysign.parse import parse_hamnosys, ascify
+import tracemalloc
+
+import pytest
+
+from pysign.data import HAMNOSYS
+from pysign.parse import parse_hamnosys, ascify, character_classes
+from pysign.parse import ascify_many, deascify
+from pysign.parse import parse_many, Sign, ParseCache, CompactSign, sizeof
+from pysign.parse import Span, _text, hand_symbols
+from pysign.parse import (
+        CLASSES, OTHER, SPACE, HANDSHAPE, MOVEMENT, REPETITION, BRUSH,
+        AMBIGUOUS_LOCATION, DOMINANCE)
 
 data = [
     ["   ", ["symmetry"], []],
@@ -205,6 +216,152 @@ def test_parse_hamnosys():
         if len(b) == 2:
             assert out[b[0]][b[1]] == c
 
+def test_ascify():
+    texts = [a for a, b, c in data[::19]] + ['', ' ', 'x  y']
+    for text in texts:
+        assert ascify(text) == '.'.join(
+                '<' + char + '>' if char in 'xy' else
+                HAMNOSYS[char]['Name'] for char in text).replace(
+                    '.asciispace.', ' ')
+        assert deascify(ascify(text)) == text
+        assert deascify(ascify(text).replace('.', '')) == text
+    assert ascify('\ue002 \ue020') == 'finger2 extfingeru'
+    assert ascify_many(texts + texts) == [ascify(text) for text in texts] * 2
+    assert ascify_many([['\ue002', 'simultaneous'], '\ue002']) == [
+            'finger2.<simultaneous>', 'finger2']
+    with pytest.raises(ValueError):
+        deascify('finger2.unknown')
+
+def test_character_classes():
+    assert CLASSES[' '] == SPACE
+    assert CLASSES['\ue002'] == HANDSHAPE
+    assert CLASSES['\ue089'] == MOVEMENT
+    assert CLASSES['\ue0d6'] == BRUSH
+    assert CLASSES['\ue0d9'] == REPETITION
+    assert CLASSES['\ue06a'] == AMBIGUOUS_LOCATION
+    assert CLASSES['\ue0e7'] == DOMINANCE
+    assert CLASSES.get('a', OTHER) == OTHER
+    assert character_classes() == CLASSES.table
+    # deprecated symbols are not part of any component
+    sign = '\ue002\ue020\ue038\ue052\ue089'
+    for char in '\ue061\ue065\ue07c\ue07d\ue07e\ue07f\ue0ad\ue0ae\ue0c9':
+        assert CLASSES[char] == OTHER
+        assert parse_hamnosys(sign + char) == parse_hamnosys(sign)
+
+def test_components():
+    fields = {'h': 'shape', 'o': 'orientation', 'c': 'contact',
+              'l': 'location', 'm': 'movement'}
+    for a, b, c in data[::19]:
+        full = parse_hamnosys(a)
+        for component, field in fields.items():
+            flags = {flag: flag == component for flag in fields}
+            out = parse_hamnosys(a, **flags)
+            for hand in ['dominant', 'nondominant']:
+                assert out[hand][field] == full[hand][field]
+                for other in set(fields.values()) - {field}:
+                    assert out[hand][other] in ([], ['', ''])
+            assert out['symmetry'] == full['symmetry']
+            if component == 'm':
+                assert out['dominant']['repetition'] == \
+                    full['dominant']['repetition']
+            else:
+                assert out['dominant']['repetition'] == ['']
+
+def test_spans():
+    for a, b, c in data[::19]:
+        out = parse_hamnosys(a, spans=True)
+        assert _text(out) == parse_hamnosys(a)
+        assert out['meta'] == parse_hamnosys(a)['meta']
+
+    text = (
+            "\ue001 \ue029\ue03e \ue053\ue0e0\ue0d0\ue06a\ue0e1 "
+            "\ue096\ue0e0\ue0d6\ue053\ue0e0\ue0d1\ue06a\ue0e1\ue0e1\ue0d9")
+    out = parse_hamnosys(text, spans=True)
+    shape = out['dominant']['shape'][0]
+    assert (shape.start, shape.end, shape.ranges) == (0, 1, None)
+    assert shape.text is text
+    contact = out['dominant']['contact'][1]
+    assert contact.ranges == ((13, 14), (16, 18))
+    assert str(contact) == "\ue0d6\ue0d1\ue06a"
+    assert len(contact) == 3
+    assert Span.from_bounds(text, (2, 3, 3, 4)) == Span(text, 2, 4)
+    assert Span.from_bounds(text, (2, 3, 3, 4, 6, 7)) == Span(
+            text, 2, 7, ((2, 4), (6, 7)))
+
+def test_spans_memory():
+    texts = [a for a, b, c in data] * 10
+    parse_hamnosys(texts[0], spans=True)
+    sizes = []
+    for spans in [False, True]:
+        tracemalloc.start()
+        results = [parse_hamnosys(text, spans=spans) for text in texts]
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del results
+    assert sizes[1] < sizes[0]
+
+def test_parse_many():
+    texts = [a for a, b, c in data[::19]] + ['']
+    for workers in [1, 2]:
+        results = [
+                result for chunk in parse_many(
+                    texts, workers=workers, chunksize=2) for result in chunk]
+        assert [text for text, _, _ in results] == texts
+        for text, out, error in results[:-1]:
+            assert error is None
+            assert out == parse_hamnosys(text)
+        assert results[-1][1] is None
+        assert isinstance(results[-1][2], IndexError)
+
+    chunks = list(Sign.from_texts(texts, workers=1, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2, 2, 2, 1]
+    assert chunks[0][0][1] == Sign.from_text(texts[0])
+
+def test_hand_symbols():
+    value = ['\ue0aa', ['\ue089', '\ue08c\ue0a4', 'simultaneous']]
+    assert list(hand_symbols(value)) == [
+            '\ue0aa', '\ue089', '\ue08c', '\ue0a4', 'simultaneous']
+    assert list(hand_symbols('')) == []
+
+def test_parse_cache():
+    texts = [a for a, b, c in data[::19]]
+    cache = ParseCache(maxsize=3)
+    first = cache(texts[0])
+    first['dominant']['shape'][0] = 'x'
+    first['meta']['rest'] += 'x'
+    assert cache(texts[0]) == parse_hamnosys(texts[0])
+    assert cache(texts[0], m=False) == parse_hamnosys(texts[0], m=False)
+    for text in texts[1:4]:
+        cache(text)
+    assert cache.info() == {
+            'hits': 1, 'misses': 5, 'evictions': 2, 'size': 3, 'maxsize': 3}
+    assert Sign.from_text(texts[3], cache=cache) == Sign.from_text(texts[3])
+    assert cache.hits == 2
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info()['hits'] == 0
+
+    cache = ParseCache(maxsize=None)
+    for text in texts * 2:
+        assert cache(text) == parse_hamnosys(text)
+    assert cache.info() == {
+            'hits': len(texts), 'misses': len(texts), 'evictions': 0,
+            'size': len(texts), 'maxsize': None}
+
+def test_compact_sign():
+    texts = [a for a, b, c in data[::19]]
+    for text in texts:
+        sign, compact = Sign.from_text(text), CompactSign.from_text(text)
+        assert compact == CompactSign.from_text(text)
+        assert hash(compact) == hash(CompactSign.from_text(text))
+        assert list(compact.dominant.shape) == sign.dominant.shape
+        assert list(compact.meta.rest) == list(sign.meta['rest'])
+        assert compact.dominant.distance(compact.nondominant) == \
+            sign.dominant.distance(sign.nondominant)
+        assert sizeof(compact) < sizeof(sign)
+    assert len(set(CompactSign.from_text(text) for text in texts * 2)) == \
+        len(texts)
+
 if __name__ == '__main__':
     from tabulate import tabulate
     table = []
@@ -0,0 +1,33 @@
+from pysign.segment import segment, Token
+
+from conftest import SIGNS
+
+texts = [
+    SIGNS['one-handed'],
+    SIGNS['two-handed'],
+    SIGNS['repeated'],
+    SIGNS['simultaneous'],
+    ]
+
+
+def test_segment():
+    for text in texts:
+        tokens = list(segment(text))
+        assert ''.join(token.text(text) for token in tokens) == text
+        for token, following in zip(tokens, tokens[1:]):
+            assert token.end == following.start
+            assert token.text(text).endswith(token.diacritics)
+
+    assert [token.kind for token in segment(texts[0])] == [
+            'handshape', 'space', 'orientation', 'space', 'location',
+            'space', 'movement']
+    tokens = list(segment(texts[1]))
+    assert [token.kind for token in tokens[:7]] == [
+            'bracket', 'handshape', 'dominance', 'handshape', 'bracket',
+            'space', 'bracket']
+    assert tokens[7] == Token('orientation', 7, 9)
+    assert list(segment(texts[3]))[2] == Token(
+            'handshape', 2, 5, '\ue011\ue00d')
+    assert list(segment('\ue0d9\ue0d9ab')) == [
+            Token('repetition', 0, 2), Token('other', 2, 4)]
+    assert list(segment('')) == []
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import attr
+import pytest
+
+from pysign.parse import parse_hamnosys, Sign
+from pysign.server import Server
+
+from conftest import SIGNS
+
+texts = [SIGNS['one-handed'], SIGNS['two-handed'], SIGNS['simultaneous']]
+
+
+async def request(connect, verb, target, data=None):
+    reader, writer = await connect()
+    body = json.dumps(data).encode('utf-8') if data is not None else b''
+    writer.write((
+        '{0} {1} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n'
+        'Content-Length: {2}\r\n\r\n').format(
+            verb, target, len(body)).encode('latin-1') + body)
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(payload.decode('utf-8'))
+
+
+async def session(server, connect):
+    requests = [('POST', '/parse', {'text': text}) for text in texts * 10]
+    answers = await asyncio.gather(*[
+        request(connect, *args) for args in requests])
+    for (_, _, data), (status, answer) in zip(requests, answers):
+        assert status == 200
+        assert answer['result'] == parse_hamnosys(data['text'])
+
+    status, answer = await request(
+            connect, 'POST', '/sign', {'text': texts[1]})
+    assert answer['result']['nondominant']['shape'] == (
+            Sign.from_text(texts[1]).nondominant.shape)
+
+    sign1, sign2 = Sign.from_text(texts[0]), Sign.from_text(texts[2])
+    status, answer = await request(
+            connect, 'POST', '/distance', {'a': texts[0], 'b': texts[2]})
+    assert answer['result'] == sign1.dominant.distance(sign2.dominant)
+    status, answer = await request(
+            connect, 'POST', '/distance', {
+                'a': attr.asdict(sign1.nondominant),
+                'b': texts[2], 'hand': 'nondominant'})
+    assert answer['result'] == sign1.nondominant.distance(sign2.nondominant)
+
+    status, answer = await request(connect, 'POST', '/parse', {'text': ''})
+    assert status == 422 and 'IndexError' in answer['error']
+    status, answer = await request(connect, 'POST', '/unknown', {})
+    assert status == 404
+    with pytest.raises(ValueError):
+        await server.submit('unknown', {})
+    status, answer = await request(connect, 'GET', '/stats')
+    assert status == 200
+    assert answer['requests'] == 34
+    assert answer['errors'] == 1
+    assert answer['batches'] < 34
+    assert answer['latency']['p50'] <= answer['latency']['max']
+
+
+def test_server(tmp_path):
+    async def run(workers, path=None):
+        server = Server(workers=workers, delay=0.01)
+        listener = await server.start(port=0, path=path)
+        if path:
+            connect = lambda: asyncio.open_unix_connection(path)
+        else:
+            port = listener.sockets[0].getsockname()[1]
+            connect = lambda: asyncio.open_connection('127.0.0.1', port)
+        try:
+            await session(server, connect)
+        finally:
+            await server.close()
+
+    asyncio.run(run(0))
+    asyncio.run(run(1, str(tmp_path / 'pysign.sock')))
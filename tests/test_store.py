@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from pysign.parse import Sign, CompactSign
+from pysign.store import write_store, SignStore, FIELDS
+
+from conftest import SIGNS
+
+texts = [
+    SIGNS['one-handed'],
+    SIGNS['repeated'],
+    SIGNS['two-handed'],
+    SIGNS['simultaneous'],
+    SIGNS['one-handed'],
+    ]
+
+
+def test_store(tmp_path):
+    signs = [Sign.from_text(text) for text in texts]
+    path = str(tmp_path / 'signs.bin')
+    assert write_store(path, signs) == 5
+
+    with SignStore(path) as store:
+        assert len(store) == 5
+        assert store.records.shape == (5, len(FIELDS))
+        # identical signs share their values
+        assert (store.record(0) == store.record(4)).all()
+        assert list(store) == signs
+        assert store[-2] == signs[3]
+        assert store.text(2) == texts[2]
+        assert store.hand(2, 'nondominant') == signs[2].nondominant
+        assert store.get(3, 'dominant.shape') == signs[3].dominant.shape
+        with pytest.raises(IndexError):
+            store[5]
+
+        # values are copied, so that changing a sign does not change others
+        sign = store[0]
+        sign.dominant.shape[0] = ''
+        assert store[4] == signs[4]
+
+        other = pickle.loads(pickle.dumps(store))
+        assert other[3] == signs[3]
+        other.close()
+
+    # the records can be held while the store is closed
+    store = SignStore(path)
+    records, record = store.records, store.record(-1)
+    store.close()
+    assert (records[4] == record).all()
+
+    write_store(path, [CompactSign.from_text(text) for text in texts])
+    with SignStore(path) as store:
+        assert list(store) == signs
+
+    (tmp_path / 'other.bin').write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        SignStore(str(tmp_path / 'other.bin'))